@@ -5,6 +5,8 @@ import numpy as np
 from pandas import DataFrame
 from pandas.io.formats.style import Styler
 
+from amocarray import tools
+
 
 # ------------------------------------------------------------------------------------
 # Views of the ds or nc file
@@ -256,31 +258,26 @@ def show_variables_by_dimension(
 
 
 def monthly_resample(da: xr.DataArray) -> xr.DataArray:
-    """Resample to monthly mean if data is not already monthly."""
+    """Resample to monthly mean if data is not already monthly.
+
+    NaT and duplicate timestamps are dropped and the data sorted in a single
+    pass by `tools.resample_mean`.
+    """
     time_key = [c for c in da.coords if c.lower() == "time"]
     if not time_key:
         raise ValueError("No time coordinate found.")
     time_key = time_key[0]
 
-    # Extract time values and check spacing
+    # Mean spacing of the valid times
     time_values = da[time_key].values
-    dt_days = np.nanmean(np.diff(time_values) / np.timedelta64(1, "D"))
-    if 20 <= dt_days <= 40:
-        return da  # Already monthly
-
-    # Drop NaT timestamps
-    mask_valid_time = ~np.isnat(time_values)
-    da = da.isel({time_key: mask_valid_time})
-
-    # Drop duplicate timestamps (keep first)
-    _, unique_indices = np.unique(da[time_key].values, return_index=True)
-    da = da.isel({time_key: np.sort(unique_indices)})
-
-    # Ensure strictly increasing time
-    da = da.sortby(time_key)
-
-    # Now resample
-    return da.resample({time_key: "1MS"}).mean()
+    time_values = time_values[~np.isnat(time_values)]
+    if time_values.size > 1:
+        span = abs(time_values[-1] - time_values[0]) / np.timedelta64(1, "D")
+        dt_days = span / (time_values.size - 1)
+        if 20 <= dt_days <= 40:
+            return da  # Already monthly
+
+    return tools.resample_mean(da, "1MS", time_dim=time_key)
 
 
 
@@ -1,8 +1,7 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import xarray as xr
-import datetime
 
 # Import the modules used
 from amocarray import logger, utilities
@@ -20,6 +19,9 @@ A41N_DEFAULT_FILES = [
 A41N_TRANSPORT_FILES = ["hobbs_willis_amoc41N_tseries.txt"]
 A41N_DEFAULT_SOURCE = "https://zenodo.org/records/14681441/files/"
 
+# Bump when the parsed output changes, to invalidate the parsed-result cache
+A41N_PARSER_VERSION = "41n-3"
+
 A41N_METADATA = {
     "project": "Atlantic Meridional Overturning Circulation Near 41N from Altimetry and Argo Observations",
     "weblink": "https://zenodo.org/records/14681441",
@@ -41,6 +43,12 @@ A41N_FILE_METADATA = {
     },
 }
 
+# Default dask chunking per product for lazy opening
+A41N_DEFAULT_CHUNKS = {
+    "trans_ARGO_ERA5.nc": "auto",
+    "Q_ARGO_obs_dens_2000depth_ERA5.nc": "auto",
+}
+
 
 @apply_defaults(A41N_DEFAULT_SOURCE, A41N_DEFAULT_FILES)
 def read_41n(
@@ -50,6 +58,9 @@ def read_41n(
     transport_only: bool = True,
     data_dir: Union[str, Path, None] = None,
     redownload: bool = False,
+    refresh: Optional[str] = None,
+    chunks: Union[dict, str, None] = None,
+    lazy: bool = False,
 ) -> list[xr.Dataset]:
     """Load the 41N transport datasets from a URL or local file path into xarray Datasets.
 
@@ -63,6 +74,15 @@ def read_41n(
     data_dir : str, Path or None, optional
         Optional local data directory.
     redownload : bool, optional                                         If True, force redownload of the data.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", revalidate cached files against the remote server and
+        only download them again if they have changed.
+    chunks : dict or str, optional
+        Dask chunk sizes per dimension (e.g. ``{"TIME": 365}``) or ``"auto"``.
+        If given, NetCDF files are opened lazily through dask.
+    lazy : bool, optional
+        If True, open NetCDF files lazily through dask using the per-product
+        default chunking in ``A41N_DEFAULT_CHUNKS``.
 
     Returns
     -------
@@ -102,6 +122,7 @@ def read_41n(
             download_url=download_url,
             local_data_dir=local_data_dir,
             redownload=redownload,
+            refresh=refresh,
         )
 
         # Open dataset
@@ -110,7 +131,12 @@ def read_41n(
             # file .nc
             try:
                 log.info("Opening 41N dataset: %s", file_path)
-                ds = xr.open_dataset(file_path)
+                ds = utilities.open_netcdf(
+                    file_path,
+                    chunks=utilities.resolve_chunks(
+                        file, chunks, lazy, A41N_DEFAULT_CHUNKS
+                    ),
+                )
             except Exception as e:
                 log.error("Failed to open NetCDF file: %s: %s", file_path, e)
                 raise FileNotFoundError(
@@ -118,44 +144,7 @@ def read_41n(
                 )
         else:
             # file .txt
-            try:
-                column_names, _ = utilities.parse_ascii_header(
-                    file_path, comment_char="%"
-                )
-                df = utilities.read_ascii_file(file_path, comment_char="%")
-                df.columns = column_names
-            except Exception as e:
-                log_error("Failed to parse ASCII file: %s: %s", file_path, e)
-                raise FileNotFoundError(f"Failed to parse ASCII file: {file_path}: {e}")
-            # Time handling
-            try:
-                df = df.apply(
-                    lambda col: col.astype(str)
-                    .str.replace(",", "", regex=False)
-                    .astype(float)
-                )
-                # df['Decimal year'] = df['Decimal year'].astype(str).str.replace(',', '',regex=False).astype(float)
-                df["TIME"] = df["Decimal year"].apply(
-                    lambda x: datetime.datetime(int(x), 1, 1)
-                    + datetime.timedelta(
-                        days=(x - int(x))
-                        * (
-                            datetime.datetime(int(x) + 1, 1, 1)
-                            - datetime.datetime(int(x), 1, 1)
-                        ).days
-                    )
-                )
-                df = df.drop(columns=["Decimal year"])
-                ds = df.set_index("TIME").to_xarray()
-            except Exception as e:
-                log_error(
-                    "Failed to convert DataFrame to xarray Fataset for %s: %s",
-                    file,
-                    e,
-                )
-                raise ValueError(
-                    f"Failed to convert DataFrame to xarray Dataset for {file}: {e}",
-                )
+            ds = utilities.parse_cached(file_path, _parse_41n_file, A41N_PARSER_VERSION)
             # Attach metadata
             file_metadata = A41N_FILE_METADATA.get(file, {})
             log_info("Attaching metadata to 41N dataset from file: %s", file)
@@ -177,3 +166,31 @@ def read_41n(
 
     log_info("Succesfully loaded %d 41N dataset(s)", len(datasets))
     return datasets
+
+
+def _parse_41n_file(file_path: Path) -> xr.Dataset:
+    """Parse the 41N ASCII time series into a Dataset indexed by TIME."""
+    file = file_path.name
+    try:
+        df = utilities.read_ascii_with_header(
+            file_path, comment_char="%", delimiters=","
+        )
+    except Exception as e:
+        log_error("Failed to parse ASCII file: %s: %s", file_path, e)
+        raise FileNotFoundError(f"Failed to parse ASCII file: {file_path}: {e}")
+    # Time handling
+    try:
+        df["TIME"] = utilities.decimal_year_to_datetime64(df["Decimal year"])
+        df = df.drop(columns=["Decimal year"])
+        ds = df.set_index("TIME").to_xarray()
+    except Exception as e:
+        log_error(
+            "Failed to convert DataFrame to xarray Fataset for %s: %s",
+            file,
+            e,
+        )
+        raise ValueError(
+            f"Failed to convert DataFrame to xarray Dataset for {file}: {e}",
+        )
+
+    return ds
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import xarray as xr
 
@@ -32,6 +32,12 @@ DSO_FILE_METADATA = {
         
 }
 
+# Default dask chunking per product for lazy opening (hourly data: 8760 steps = 1 year)
+DSO_DEFAULT_CHUNKS = {
+    "DSO_transport_hourly_1996_2021.nc": {"TIME": 8760},
+}
+
+
 @apply_defaults(DSO_DEFAULT_SOURCE, DSO_DEFAULT_FILES)
 def read_dso(
     source: str,
@@ -40,6 +46,9 @@ def read_dso(
     transport_only: bool = True,
     data_dir: Union[str, Path, None] = None,
     redownload: bool = False,
+    refresh: Optional[str] = None,
+    chunks: Union[dict, str, None] = None,
+    lazy: bool = False,
 ) -> list[xr.Dataset]:
     
     """Load the Denmark Strait Overflow (DSO) datasets from a URL or local file path into xarray Datasets.
@@ -56,6 +65,15 @@ def read_dso(
         Optional local data directory.
     redownload : bool, optional
         If True, force redownload of the data.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", revalidate cached files against the remote server and
+        only download them again if they have changed.
+    chunks : dict or str, optional
+        Dask chunk sizes per dimension (e.g. ``{"TIME": 365}``) or ``"auto"``.
+        If given, NetCDF files are opened lazily through dask.
+    lazy : bool, optional
+        If True, open NetCDF files lazily through dask using the per-product
+        default chunking in ``DSO_DEFAULT_CHUNKS``.
 
     Returns
     -------                                                         list of xr.Dataset
@@ -95,11 +113,17 @@ def read_dso(
             download_url=download_url,
             local_data_dir=local_data_dir,
             redownload=redownload,
+            refresh=refresh,
         )
 
         try:
             log_info("Opening DSO dataset: %s", file_path)
-            ds = xr.open_dataset(file_path)
+            ds = utilities.open_netcdf(
+                file_path,
+                chunks=utilities.resolve_chunks(
+                    file, chunks, lazy, DSO_DEFAULT_CHUNKS
+                ),
+            )
         except Exception as e:
             log_error("Failed to open NetCDF file: %s: %s", file_path, e)
             raise FileNotFoundError(f"Failed to open NetCDF file: {file_path}: {e}")
@@ -1,8 +1,9 @@
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import xarray as xr
 import scipy.io
+from scipy.io.matlab import matfile_version
 import pandas as pd
 import numpy as np
 
@@ -10,6 +11,9 @@ from amocarray import logger, utilities
 from amocarray.logger import log_error, log_info, log_warning
 from amocarray.utilities import apply_defaults
 
+if TYPE_CHECKING:
+    import h5py
+
 log = logger.log  # Use global logger
 
 # Default file list
@@ -24,6 +28,26 @@ FW2015_FILE_URLS = {
     "MOCproxy_for_figshare_v1.mat": "https://figshare.com/ndownloader/files/3369779",
 }
 
+# Bump when the parsed output changes, to invalidate the parsed-result cache
+FW2015_PARSER_VERSION = "fw2015-1"
+
+# Dataset variable -> (MATLAB struct, field) in the .mat file
+FW2015_VARIABLES = {
+    "MOC_PROXY": ("recon", "mocproxy"),
+    "EK": ("recon", "ek"),
+    "H1UMO": ("recon", "h1umo"),
+    "GS": ("recon", "gs"),
+    "UMO_PROXY": ("recon", "umoproxy"),
+    "MOC_GRID": ("mocgrid", "moc"),
+    "EK_GRID": ("mocgrid", "ek"),
+    "GS_GRID": ("mocgrid", "gs"),
+    "LNADW_GRID": ("mocgrid", "lnadw"),
+    "UMO_GRID": ("mocgrid", "umo"),
+    "UNADW_GRID": ("mocgrid", "unadw"),
+}
+# Fields of recon copied to the global attributes
+FW2015_ATTRS = ("created", "url", "paper", "version")
+
 # General Metadata (global for FW2015)
 
 FW2015_METADATA = {
@@ -47,6 +71,8 @@ def read_fw2015(
     transport_only: bool = True,
     data_dir: Union[str, Path, None] = None,
     redownload: bool = False,
+    refresh: Optional[str] = None,
+    variables: Optional[list[str]] = None,
 ) -> list[xr.Dataset]:
     """Load the FW2015 transport datasets from a URL or local file path into xarray Datasets.
 
@@ -63,6 +89,12 @@ def read_fw2015(
         Optional local data directory.
     redownload : bool, optional
         If True, force redownload of the data.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", revalidate cached files against the remote server and
+        only download them again if they have changed.
+    variables : list of str, optional
+        Names of the variables to load (keys of ``FW2015_VARIABLES``). Only the
+        MATLAB structs holding them are read. Defaults to all variables.
 
     Returns
     -------
@@ -72,7 +104,8 @@ def read_fw2015(
     Raises
     ------
     ValueError
-        If no source is provided for a file and no default URL mapping is found.
+        If no source is provided for a file and no default URL mapping is found,
+        or if an unknown variable is requested.
     FileNotFoundError
         If the file cannot be downloaded or does not exist locally.
 
@@ -87,6 +120,14 @@ def read_fw2015(
     if isinstance(file_list, str):
         file_list = [file_list]
 
+    parser_version = FW2015_PARSER_VERSION
+    if variables is not None:
+        unknown = set(variables) - set(FW2015_VARIABLES)
+        if unknown:
+            log_error("Unknown FW2015 variables: %s", sorted(unknown))
+            raise ValueError(f"Unknown FW2015 variables: {sorted(unknown)}")
+        parser_version += "-" + "+".join(sorted(variables))
+
     # Determine the local storage path
     local_data_dir = Path(data_dir) if data_dir else utilities.get_default_data_dir()
     local_data_dir.mkdir(parents=True, exist_ok=True)
@@ -109,58 +150,21 @@ def read_fw2015(
             download_url=download_url,
             local_data_dir=local_data_dir,
             redownload=redownload,
+            refresh=refresh,
         )
 
         # open dataset
-
-        try:
-            log.info("Opening fw2015 file: %s", file_path)
-            mat_data = scipy.io.loadmat(
-                file_path, squeeze_me=True, struct_as_record=False
+        log.info("Opening fw2015 file: %s", file_path)
+        if _is_mat_v73(file_path):
+            # Memory-mapped reads are already cheap; caching them would load
+            # every array into memory to write the cached copy
+            ds = _parse_fw2015_file(file_path, variables)
+        else:
+            ds = utilities.parse_cached(
+                file_path,
+                lambda path: _parse_fw2015_file(path, variables),
+                parser_version,
             )
-            recon = mat_data.get("recon")
-            mocgrid = mat_data.get("mocgrid")
-
-            time = recon.time  # time in decimal years
-
-            variables = {
-                "MOC_PROXY": recon.mocproxy,
-                "EK": recon.ek,
-                "H1UMO": recon.h1umo,
-                "GS": recon.gs,
-                "UMO_PROXY": recon.umoproxy,
-                "MOC_GRID": mocgrid.moc,
-                "EK_GRID": mocgrid.ek,
-                "GS_GRID": mocgrid.gs,
-                "LNADW_GRID": mocgrid.lnadw,
-                "UMO_GRID": mocgrid.umo,
-                "UNADW_GRID": mocgrid.unadw,
-            }
-
-            # Convert decimal years to datetime
-            time = np.asarray(time)
-            time = pd.to_datetime(
-                (time - 719529).astype("int"), origin="unix", unit="D"
-            )
-
-            # Build dataset
-            ds = xr.Dataset(
-                {
-                    name: ("TIME", np.asarray(values))
-                    for name, values in variables.items()
-                },
-                coords={"TIME": time},
-            )
-
-            # add global attributes
-            ds.attrs["created"] = recon.created
-            ds.attrs["url"] = recon.url
-            ds.attrs["paper"] = recon.paper
-            ds.attrs["version"] = recon.version
-
-        except Exception as e:
-            log.error("Failed to parse .mat file: %s: %s", file_path, e)
-            raise ValueError(f"Failed to parse .mat file: {file_path}: {e}")
 
         # attach metadata
         file_metadata = FW2015_FILE_METADATA.get(file, {})
@@ -183,3 +187,96 @@ def read_fw2015(
 
     log.info("Successfully loaded %d FW2015 dataset(s)", len(datasets))
     return datasets
+
+
+def _parse_fw2015_file(
+    file_path: Path, variables: Optional[list[str]] = None
+) -> xr.Dataset:
+    """Parse the FW2015 MATLAB file into a Dataset indexed by TIME.
+
+    MATLAB v7.3 (HDF5) files are read with h5py, memory-mapping contiguous
+    datasets; older versions are read with ``scipy.io.loadmat``.
+    """
+    if variables is None:
+        variables = list(FW2015_VARIABLES)
+    keys = {FW2015_VARIABLES[name] for name in variables}
+    keys.add(("recon", "time"))
+    keys.update(("recon", attr) for attr in FW2015_ATTRS)
+
+    try:
+        if _is_mat_v73(file_path):
+            fields = _load_mat_v73(file_path, keys)
+        else:
+            fields = _load_mat_v5(file_path, keys)
+
+        # Convert MATLAB datenums to datetime
+        time = np.asarray(fields["recon", "time"])
+        time = pd.to_datetime((time - 719529).astype("int"), origin="unix", unit="D")
+
+        # Build dataset
+        ds = xr.Dataset(
+            {
+                name: ("TIME", np.asarray(fields[FW2015_VARIABLES[name]]))
+                for name in variables
+            },
+            coords={"TIME": time},
+        )
+
+        # add global attributes
+        for attr in FW2015_ATTRS:
+            ds.attrs[attr] = fields["recon", attr]
+
+    except Exception as e:
+        log.error("Failed to parse .mat file: %s: %s", file_path, e)
+        raise ValueError(f"Failed to parse .mat file: {file_path}: {e}")
+
+    return ds
+
+
+def _is_mat_v73(file_path: Path) -> bool:
+    """True for MATLAB v7.3 (HDF5) files."""
+    return matfile_version(file_path)[0] == 2
+
+
+def _load_mat_v5(file_path: Path, keys: set) -> dict:
+    """Read (struct, field) pairs from a MATLAB v5 file, loading only those structs."""
+    structs = sorted({struct for struct, _ in keys})
+    mat_data = scipy.io.loadmat(
+        file_path, variable_names=structs, squeeze_me=True, struct_as_record=True
+    )
+    return {(struct, field): mat_data[struct][field].item() for struct, field in keys}
+
+
+def _load_mat_v73(file_path: Path, keys: set) -> dict:
+    """Read (struct, field) pairs from a MATLAB v7.3 (HDF5) file."""
+    try:
+        import h5py
+    except ImportError as e:
+        raise ImportError(
+            "Reading MATLAB v7.3 files requires h5py. Install it with "
+            "`pip install h5py`."
+        ) from e
+
+    fields = {}
+    with h5py.File(file_path, "r") as f:
+        for struct, field in keys:
+            dset = f[struct][field]
+            if dset.attrs.get("MATLAB_class") == b"char":
+                # MATLAB stores strings as UTF-16 code units
+                fields[struct, field] = "".join(map(chr, dset[()].ravel()))
+            else:
+                fields[struct, field] = _memmap_dataset(file_path, dset)
+    return fields
+
+
+def _memmap_dataset(file_path: Path, dset: "h5py.Dataset") -> np.ndarray:
+    """Memory-map a contiguous, uncompressed HDF5 dataset, or read it otherwise."""
+    offset = dset.id.get_offset()
+    if offset is None or dset.chunks is not None:
+        data = dset[()]
+    else:
+        data = np.memmap(
+            file_path, dtype=dset.dtype, mode="r", offset=offset, shape=dset.shape
+        )
+    # MATLAB arrays are column-major, so h5py sees them transposed
+    return np.squeeze(data.T)
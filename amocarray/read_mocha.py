@@ -1,6 +1,8 @@
+import io
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 import zipfile
+import zlib
 import xarray as xr
 
 from amocarray import logger, utilities
@@ -42,6 +44,11 @@ MOCHA_FILE_METADATA = {
     },
 }
 
+# Default dask chunking per product for lazy opening
+MOCHA_DEFAULT_CHUNKS = {
+    "mocha_mht_data_ERA5_v2020.nc": "auto",
+}
+
 
 @apply_defaults(None, MOCHA_DEFAULT_FILES)
 def read_mocha(
@@ -50,6 +57,12 @@ def read_mocha(
     transport_only: bool = True,
     data_dir: Union[str, Path, None] = None,
     redownload: bool = False,
+    refresh: Optional[str] = None,
+    chunks: Union[dict, str, None] = None,
+    lazy: bool = False,
+    stream: bool = False,
+    members: Optional[list[str]] = None,
+    verify_crc: bool = False,
 ) -> list[xr.Dataset]:
     """Load the MOCHA transport dataset from a URL or local file path into xarray Datasets.
 
@@ -67,6 +80,26 @@ def read_mocha(
         Optional local data directory.
     redownload : bool, optional
         If True, force redownload of the data.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", revalidate cached files against the remote server and
+        only download them again if they have changed.
+    chunks : dict or str, optional
+        Dask chunk sizes per dimension (e.g. ``{"TIME": 365}``) or ``"auto"``.
+        If given, NetCDF files are opened lazily through dask.
+    lazy : bool, optional
+        If True, open NetCDF files lazily through dask using the per-product
+        default chunking in ``MOCHA_DEFAULT_CHUNKS``.
+    stream : bool, optional
+        If True, open the NetCDF member directly from the zip archive (through
+        an in-memory buffer) instead of extracting it to ``data_dir``.
+    members : list of str, optional
+        Additional zip members to extract to ``data_dir`` (e.g.
+        ``["README.txt"]``). By default only the NetCDF member is extracted,
+        and nothing is extracted when ``stream`` is True.
+    verify_crc : bool, optional
+        If True, check previously extracted members against the CRC-32 stored
+        in the zip archive and extract them again if they differ. Members read
+        from the archive are always CRC-checked by ``zipfile``.
 
     Returns
     -------
@@ -76,7 +109,8 @@ def read_mocha(
     Raises
     ------
     ValueError
-        If the source is neither a valid URL nor a directory path.
+        If the source is neither a valid URL nor a directory path, or if a
+        requested member is not in the zip archive.
     FileNotFoundError
         If the file cannot be downloaded or does not exist locally.
 
@@ -108,9 +142,10 @@ def read_mocha(
             download_url=download_url,
             local_data_dir=local_data_dir,
             redownload=redownload,
+            refresh=refresh,
         )
 
-        # If the file is a zip, extract all contents
+        # If the file is a zip, extract (or stream) the requested contents
         file_path = Path(file_path)
         if file_path.suffix == ".zip":
             contents = MOCHA_ZIP_CONTENTS.get(file)
@@ -118,49 +153,67 @@ def read_mocha(
                 raise ValueError(
                     f"No internal file mapping provided for zip file: {file}"
                 )
-
-            with zipfile.ZipFile(file_path, "r") as zip_ref:
-                for member in contents:
-                    target_path = local_data_dir / member
-                    if redownload or not target_path.exists():
-                        log.info("Extracting %s from %s", member, file)
-                        zip_ref.extract(member, path=local_data_dir)
+            unknown = set(members or []) - contents
+            if unknown:
+                raise ValueError(f"Members {sorted(unknown)} are not in {file}")
 
             # Look specifically for the .nc file to open
-            nc_files = [f for f in contents if f.endswith(".nc")]
+            nc_files = sorted(f for f in contents if f.endswith(".nc"))
             if not nc_files:
                 raise FileNotFoundError(
                     f"No NetCDF (.nc) file listed in zip contents for {file}"
                 )
 
-            for nc_file in nc_files:
-                nc_path = local_data_dir / nc_file
-                if not nc_path.exists():
-                    raise FileNotFoundError(
-                        f"Expected NetCDF file not found: {nc_path}"
+            with zipfile.ZipFile(file_path, "r") as zip_ref:
+                to_extract = set(members or [])
+                if not stream:
+                    to_extract.update(nc_files)
+                for member in sorted(to_extract):
+                    _extract_member(
+                        zip_ref,
+                        member,
+                        local_data_dir,
+                        file_path,
+                        redownload,
+                        verify_crc,
                     )
 
-                log.info("Opening MOCHA dataset: %s", nc_path)
-                try:
-                    ds = xr.open_dataset(nc_path)
-                except Exception as e:
-                    log.error("Failed to open NetCDF file: %s: %s", nc_path, e)
-                    raise FileNotFoundError(
-                        f"Failed to open NetCDF file: {nc_path}: {e}"
+                for nc_file in nc_files:
+                    member_chunks = utilities.resolve_chunks(
+                        nc_file, chunks, lazy, MOCHA_DEFAULT_CHUNKS
                     )
+                    if stream:
+                        nc_path = f"{file_path}::{nc_file}"
+                        log.info("Streaming MOCHA dataset: %s", nc_path)
+                        open_target = _member_buffer(zip_ref, nc_file)
+                    else:
+                        nc_path = local_data_dir / nc_file
+                        log.info("Opening MOCHA dataset: %s", nc_path)
+                        open_target = nc_path
+                    try:
+                        ds = utilities.open_netcdf(
+                            open_target,
+                            chunks=member_chunks,
+                            **_engine_kwargs(open_target),
+                        )
+                    except Exception as e:
+                        log.error("Failed to open NetCDF file: %s: %s", nc_path, e)
+                        raise FileNotFoundError(
+                            f"Failed to open NetCDF file: {nc_path}: {e}"
+                        )
 
-                metadata = MOCHA_FILE_METADATA.get(nc_file, {})
-                utilities.safe_update_attrs(
-                    ds,
-                    {
-                        "source_file": nc_file,
-                        "source_path": str(nc_path),
-                        **MOCHA_METADATA,
-                        **metadata,
-                    },
-                )
+                    metadata = MOCHA_FILE_METADATA.get(nc_file, {})
+                    utilities.safe_update_attrs(
+                        ds,
+                        {
+                            "source_file": nc_file,
+                            "source_path": str(nc_path),
+                            **MOCHA_METADATA,
+                            **metadata,
+                        },
+                    )
 
-                datasets.append(ds)
+                    datasets.append(ds)
         else:
             log.warning("Non-zip MOCHA files are not currently supported: %s", file)
 
@@ -170,3 +223,59 @@ def read_mocha(
 
     log.info("Successfully loaded %d MOCHA dataset(s)", len(datasets))
     return datasets
+
+
+def _extract_member(
+    zip_ref: zipfile.ZipFile,
+    member: str,
+    target_dir: Path,
+    zip_path: Path,
+    redownload: bool,
+    verify_crc: bool,
+) -> Path:
+    """Extract a zip member unless an up-to-date copy already exists."""
+    target_path = target_dir / member
+    stale = (
+        target_path.exists() and target_path.stat().st_mtime < zip_path.stat().st_mtime
+    )
+    corrupt = (
+        verify_crc
+        and target_path.exists()
+        and _crc32(target_path) != zip_ref.getinfo(member).CRC
+    )
+    if corrupt:
+        log.warning("CRC mismatch for extracted %s, extracting again", target_path)
+    if redownload or stale or corrupt or not target_path.exists():
+        log.info("Extracting %s from %s", member, zip_path.name)
+        zip_ref.extract(member, path=target_dir)
+    return target_path
+
+
+def _crc32(file_path: Path) -> int:
+    crc = 0
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(utilities.HASH_CHUNK_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def _member_buffer(zip_ref: zipfile.ZipFile, member: str) -> io.BytesIO:
+    """Read a zip member into memory; zipfile checks its CRC while reading."""
+    return io.BytesIO(zip_ref.read(member))
+
+
+def _engine_kwargs(target: Union[Path, io.BytesIO]) -> dict:
+    """Pick an in-memory capable engine for a buffered NetCDF member."""
+    if not isinstance(target, io.BytesIO):
+        return {}
+    if target.getvalue()[:3] == b"CDF":
+        # NetCDF3 classic
+        return {"engine": "scipy"}
+    try:
+        import h5netcdf  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Streaming NetCDF4 members from a zip requires h5netcdf: "
+            "pip install h5netcdf"
+        ) from e
+    return {"engine": "h5netcdf"}
@@ -1,9 +1,8 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import xarray as xr
 import numpy as np
-import pandas as pd
 
 from amocarray import logger, utilities
 from amocarray.utilities import apply_defaults
@@ -35,6 +34,15 @@ MOVE_FILE_METADATA = {
     },
 }
 
+# Default dask chunking per product for lazy opening (daily data: 365 steps = 1 year)
+MOVE_DEFAULT_CHUNKS = {
+    "OS_MOVE_20000206-20221014_DPR_VOLUMETRANSPORT.nc": {"TIME": -1},
+    "OS_MOVE_20000101-20221021_GRD_CURRENTS-AT-SITES-MOVE3-MOVE4.nc": {"TIME": 365},
+    "OS_MOVE_20000101-20221018_GRD_TEMPERATURE-SALINITY-AT-SITES-MOVE1-MOVE3.nc": {
+        "TIME": 365
+    },
+}
+
 
 @apply_defaults(MOVE_DEFAULT_SOURCE, MOVE_DEFAULT_FILES)
 def read_move(
@@ -43,6 +51,9 @@ def read_move(
     transport_only: bool = True,
     data_dir: Union[str, Path, None] = None,
     redownload: bool = False,
+    refresh: Optional[str] = None,
+    chunks: Union[dict, str, None] = None,
+    lazy: bool = False,
 ) -> list[xr.Dataset]:
     """Load the MOVE transport dataset from a URL or local file path into xarray Datasets.
 
@@ -60,6 +71,15 @@ def read_move(
         Optional local data directory.
     redownload : bool, optional
         If True, force redownload of the data.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", revalidate cached files against the remote server and
+        only download them again if they have changed.
+    chunks : dict or str, optional
+        Dask chunk sizes per dimension (e.g. ``{"TIME": 365}``) or ``"auto"``.
+        If given, NetCDF files are opened lazily through dask.
+    lazy : bool, optional
+        If True, open NetCDF files lazily through dask using the per-product
+        default chunking in ``MOVE_DEFAULT_CHUNKS``.
 
     Returns
     -------
@@ -101,49 +121,25 @@ def read_move(
             download_url=download_url,
             local_data_dir=local_data_dir,
             redownload=redownload,
+            refresh=refresh,
         )
 
         # Open dataset
         try:
             log.info("Opening MOVE dataset: %s", file_path)
-            ds = xr.open_dataset(file_path, decode_times=False)
+            ds = utilities.open_netcdf(
+                file_path,
+                chunks=utilities.resolve_chunks(
+                    file, chunks, lazy, MOVE_DEFAULT_CHUNKS
+                ),
+                decode_times=False,
+            )
         except Exception as e:
             log.error("Failed to open NetCDF file: %s: %s", file_path, e)
             raise FileNotFoundError(f"Failed to open NetCDF file: {file_path}: {e}")
 
-
         # Clean up time variable
-        if "TIME" in ds.variables:
-            time_raw = ds["TIME"].values
-            valid = (time_raw > 0) & (time_raw < 30000)
-            n_invalid = (~valid).sum()
-
-            if n_invalid > 0:
-                log.info(f"Found {n_invalid} invalid time values in {file_path}; replacing with NaN.")
-
-            clean_time = xr.where(valid, time_raw, np.nan)
-            base = np.datetime64("1950-01-01")
-            time_converted = base + clean_time * np.timedelta64(1, "D")
-
-            # Replace the time in the dataset
-            ds["TIME"] = ("TIME", time_converted)
-            ds["TIME"].attrs.update({
-                "units": "days since 1950-01-01",
-            })
-            log.debug(f"Converted time using base 1950-01-01 for {file_path}")
-        else:
-            log.warning(f"No TIME variable found in {file_path}")
-
-        # Filter out NaT time values and corresponding dataset entries
-            time_pd = pd.to_datetime(ds["TIME"].values)
-            valid_time_mask = ~pd.isna(time_pd)
-
-            if (~valid_time_mask).any():
-                n_removed = (~valid_time_mask).sum()
-                log.info(f"Removing {n_removed} entries with invalid NaT time values from {file_path}")
-
-                ds = ds.isel(TIME=valid_time_mask)
-
+        ds = decode_move_time(ds)
 
         # Attach metadata
         file_metadata = MOVE_FILE_METADATA.get(file, {})
@@ -166,3 +162,50 @@ def read_move(
 
     log.info("Successfully loaded %d MOVE dataset(s)", len(datasets))
     return datasets
+
+
+def decode_move_time(ds: xr.Dataset) -> xr.Dataset:
+    """Convert the raw MOVE TIME (days since 1950-01-01) to datetime64.
+
+    Out-of-range time values (<= 0 or >= 30000 days) are replaced by NaT. Also
+    used as the ``preprocess`` step when MOVE files are opened together with
+    ``xr.open_mfdataset``.
+
+    Parameters
+    ----------
+    ds : xr.Dataset
+        MOVE dataset opened with ``decode_times=False``.
+
+    Returns
+    -------
+    xr.Dataset
+        Dataset with a decoded TIME coordinate.
+
+    """
+    file_path = ds.encoding.get("source", "dataset")
+    if "TIME" not in ds.variables:
+        log.warning(f"No TIME variable found in {file_path}")
+        return ds
+
+    time_raw = ds["TIME"].values
+    valid = (time_raw > 0) & (time_raw < 30000)
+    n_invalid = (~valid).sum()
+
+    if n_invalid > 0:
+        log.info(
+            f"Found {n_invalid} invalid time values in {file_path}; replacing with NaN."
+        )
+
+    clean_time = xr.where(valid, time_raw, np.nan)
+    base = np.datetime64("1950-01-01")
+    time_converted = base + clean_time * np.timedelta64(1, "D")
+
+    # Replace the time in the dataset
+    ds["TIME"] = ("TIME", time_converted)
+    ds["TIME"].attrs.update(
+        {
+            "units": "days since 1950-01-01",
+        }
+    )
+    log.debug(f"Converted time using base 1950-01-01 for {file_path}")
+    return ds
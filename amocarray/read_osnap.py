@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import xarray as xr
 
@@ -46,6 +46,13 @@ OSNAP_FILE_METADATA = {
     },
 }
 
+# Default dask chunking per product for lazy opening (monthly data: 12 steps = 1 year)
+OSNAP_DEFAULT_CHUNKS = {
+    "OSNAP_MOC_MHT_MFT_TimeSeries_201408_202006_2023.nc": {"TIME": -1},
+    "OSNAP_Streamfunction_201408_202006_2023.nc": {"TIME": 12},
+    "OSNAP_Gridded_TSV_201408_202006_2023.nc": {"TIME": 12},
+}
+
 
 @apply_defaults(None, OSNAP_DEFAULT_FILES)
 def read_osnap(
@@ -54,6 +61,9 @@ def read_osnap(
     transport_only: bool = True,
     data_dir: Union[str, Path, None] = None,
     redownload: bool = False,
+    refresh: Optional[str] = None,
+    chunks: Union[dict, str, None] = None,
+    lazy: bool = False,
 ) -> list[xr.Dataset]:
     """Load the OSNAP transport datasets from a URL or local file path into xarray Datasets.
 
@@ -70,6 +80,15 @@ def read_osnap(
         Optional local data directory.
     redownload : bool, optional
         If True, force redownload of the data.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", revalidate cached files against the remote server and
+        only download them again if they have changed.
+    chunks : dict or str, optional
+        Dask chunk sizes per dimension (e.g. ``{"TIME": 365}``) or ``"auto"``.
+        If given, NetCDF files are opened lazily through dask.
+    lazy : bool, optional
+        If True, open NetCDF files lazily through dask using the per-product
+        default chunking in ``OSNAP_DEFAULT_CHUNKS``.
 
     Returns
     -------
@@ -116,12 +135,18 @@ def read_osnap(
             download_url=download_url,
             local_data_dir=local_data_dir,
             redownload=redownload,
+            refresh=refresh,
         )
 
         # Open dataset
         try:
             log.info("Opening OSNAP dataset: %s", file_path)
-            ds = xr.open_dataset(file_path)
+            ds = utilities.open_netcdf(
+                file_path,
+                chunks=utilities.resolve_chunks(
+                    file, chunks, lazy, OSNAP_DEFAULT_CHUNKS
+                ),
+            )
         except Exception as e:
             log.error("Failed to open NetCDF file: %s: %s", file_path, e)
             raise FileNotFoundError(f"Failed to open NetCDF file: {file_path}: {e}")
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import xarray as xr
 
@@ -53,6 +53,16 @@ RAPID_FILE_METADATA = {
 # https://rapid.ac.uk/sites/default/files/rapid_data/2d_gridded.nc
 # https://rapid.ac.uk/sites/default/files/rapid_data/meridional_transports.nc
 
+# Default dask chunking per product for lazy opening (12-hourly: 730 steps = 1 year)
+RAPID_DEFAULT_CHUNKS = {
+    "moc_transports.nc": {"time": -1},
+    "moc_vertical.nc": {"time": 730},
+    "ts_gridded.nc": {"time": 730},
+    "2d_gridded.nc": {"time": 730},
+    "meridional_transports.nc": {"time": -1},
+}
+
+
 @apply_defaults(RAPID_DEFAULT_SOURCE, RAPID_DEFAULT_FILES)
 def read_rapid(
     source: Union[str, Path, None],
@@ -60,6 +70,9 @@ def read_rapid(
     transport_only: bool = True,
     data_dir: Union[str, Path, None] = None,
     redownload: bool = False,
+    refresh: Optional[str] = None,
+    chunks: Union[dict, str, None] = None,
+    lazy: bool = False,
 ) -> list[xr.Dataset]:
     """Load the RAPID transport dataset from a URL or local file path into an xarray.Dataset.
 
@@ -77,6 +90,15 @@ def read_rapid(
         Optional local data directory.
     redownload : bool, optional
         If True, force redownload of the data.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", revalidate cached files against the remote server and
+        only download them again if they have changed.
+    chunks : dict or str, optional
+        Dask chunk sizes per dimension (e.g. ``{"TIME": 365}``) or ``"auto"``.
+        If given, NetCDF files are opened lazily through dask.
+    lazy : bool, optional
+        If True, open NetCDF files lazily through dask using the per-product
+        default chunking in ``RAPID_DEFAULT_CHUNKS``.
 
     Returns
     -------
@@ -120,11 +142,17 @@ def read_rapid(
             download_url=download_url,
             local_data_dir=local_data_dir,
             redownload=redownload,
+            refresh=refresh,
         )
 
         try:
             log_info("Opening RAPID dataset: %s", file_path)
-            ds = xr.open_dataset(file_path)
+            ds = utilities.open_netcdf(
+                file_path,
+                chunks=utilities.resolve_chunks(
+                    file, chunks, lazy, RAPID_DEFAULT_CHUNKS
+                ),
+            )
         except Exception as e:
             log_error("Failed to open NetCDF file: %s: %s", file_path, e)
             raise FileNotFoundError(f"Failed to open NetCDF file: {file_path}: {e}")
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import pandas as pd
 import xarray as xr
@@ -21,10 +21,13 @@ SAMBA_TRANSPORT_FILES = [
 ]
 # Mapping of filenames to remote URLs
 SAMBA_FILE_URLS = {
-    "Upper_Abyssal_Transport_Anomalies.txt": "ftp://ftp.aoml.noaa.gov/phod/pub/SAM/2020_Kersale_etal_ScienceAdvances/",
-    "MOC_TotalAnomaly_and_constituents.asc": "https://www.aoml.noaa.gov/phod/SAMOC_international/documents/",
+    "Upper_Abyssal_Transport_Anomalies.txt": "ftp://ftp.aoml.noaa.gov/phod/pub/SAM/2020_Kersale_etal_ScienceAdvances/Upper_Abyssal_Transport_Anomalies.txt",
+    "MOC_TotalAnomaly_and_constituents.asc": "https://www.aoml.noaa.gov/phod/SAMOC_international/documents/MOC_TotalAnomaly_and_constituents.asc",
 }
 
+# Bump when the parsed output changes, to invalidate the parsed-result cache
+SAMBA_PARSER_VERSION = "samba-2"
+
 # Global metadata for SAMBA
 SAMBA_METADATA = {
     "description": "SAMBA 34S transport estimates dataset",
@@ -55,6 +58,7 @@ def read_samba(
     transport_only: bool = True,
     data_dir: Union[str, Path, None] = None,
     redownload: bool = False,
+    refresh: Optional[str] = None,
 ) -> list[xr.Dataset]:
     """Load the SAMBA transport datasets from remote URL or local file path into xarray Datasets.
 
@@ -71,6 +75,9 @@ def read_samba(
         Optional local data directory.
     redownload : bool, optional
         If True, force redownload of the data.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", revalidate cached files against the remote server and
+        only download them again if they have changed.
 
     Returns
     -------
@@ -116,43 +123,14 @@ def read_samba(
             download_url=download_url,
             local_data_dir=local_data_dir,
             redownload=redownload,
+            refresh=refresh,
         )
 
-        # Parse ASCII file
-        try:
-            column_names, _ = utilities.parse_ascii_header(file_path, comment_char="%")
-            df = utilities.read_ascii_file(file_path, comment_char="%")
-            df.columns = column_names
-        except Exception as e:
-            log_error("Failed to parse ASCII file: %s: %s", file_path, e)
-            raise FileNotFoundError(f"Failed to parse ASCII file: {file_path}: {e}")
-
-        # Time handling
-        try:
-            if "Upper_Abyssal" in file:
-                df["TIME"] = pd.to_datetime(
-                    df[["Year", "Month", "Day", "Hour", "Minute"]],
-                )
-                df = df.drop(columns=["Year", "Month", "Day", "Hour", "Minute"])
-            else:
-                df["TIME"] = pd.to_datetime(df[["Year", "Month", "Day", "Hour"]])
-                df = df.drop(columns=["Year", "Month", "Day", "Hour"])
-        except Exception as e:
-            log_error("Failed to construct TIME column for %s: %s", file, e)
-            raise ValueError(f"Failed to construct TIME column for {file}: {e}")
-
-        # Convert DataFrame to xarray Dataset
-        try:
-            ds = df.set_index("TIME").to_xarray()
-        except Exception as e:
-            log_error(
-                "Failed to convert DataFrame to xarray Dataset for %s: %s",
-                file,
-                e,
-            )
-            raise ValueError(
-                f"Failed to convert DataFrame to xarray Dataset for {file}: {e}",
-            )
+        ds = utilities.parse_cached(
+            file_path,
+            lambda path, file=file: _parse_samba_file(path, file),
+            SAMBA_PARSER_VERSION,
+        )
 
         # Attach metadata
         file_metadata = SAMBA_FILE_METADATA.get(file, {})
@@ -175,3 +153,42 @@ def read_samba(
 
     log_info("Successfully loaded %d SAMBA dataset(s)", len(datasets))
     return datasets
+
+
+def _parse_samba_file(file_path: Path, file: str) -> xr.Dataset:
+    """Parse a SAMBA ASCII file into a Dataset indexed by TIME."""
+    # Parse ASCII file
+    try:
+        df = utilities.read_ascii_with_header(file_path, comment_char="%")
+    except Exception as e:
+        log_error("Failed to parse ASCII file: %s: %s", file_path, e)
+        raise FileNotFoundError(f"Failed to parse ASCII file: {file_path}: {e}")
+
+    # Time handling
+    try:
+        if "Upper_Abyssal" in file:
+            df["TIME"] = pd.to_datetime(
+                df[["Year", "Month", "Day", "Hour", "Minute"]],
+            )
+            df = df.drop(columns=["Year", "Month", "Day", "Hour", "Minute"])
+        else:
+            df["TIME"] = pd.to_datetime(df[["Year", "Month", "Day", "Hour"]])
+            df = df.drop(columns=["Year", "Month", "Day", "Hour"])
+    except Exception as e:
+        log_error("Failed to construct TIME column for %s: %s", file, e)
+        raise ValueError(f"Failed to construct TIME column for {file}: {e}")
+
+    # Convert DataFrame to xarray Dataset
+    try:
+        ds = df.set_index("TIME").to_xarray()
+    except Exception as e:
+        log_error(
+            "Failed to convert DataFrame to xarray Dataset for %s: %s",
+            file,
+            e,
+        )
+        raise ValueError(
+            f"Failed to convert DataFrame to xarray Dataset for {file}: {e}",
+        )
+
+    return ds
@@ -1,25 +1,91 @@
+import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 import xarray as xr
 
-from amocarray import logger
-from amocarray.logger import log_info
-from amocarray.read_move import read_move
-from amocarray.read_osnap import read_osnap
-from amocarray.read_rapid import read_rapid
-from amocarray.read_samba import read_samba
-from amocarray.read_fw2015 import read_fw2015
-from amocarray.read_mocha import read_mocha
-from amocarray.read_41n import read_41n
-from amocarray.read_dso import read_dso
+from amocarray import logger, utilities
+from amocarray.logger import log_error, log_info, log_warning
+from amocarray.read_move import (
+    MOVE_DEFAULT_FILES,
+    MOVE_DEFAULT_SOURCE,
+    MOVE_TRANSPORT_FILES,
+    decode_move_time,
+    read_move,
+)
+from amocarray.read_osnap import (
+    OSNAP_DEFAULT_FILES,
+    OSNAP_FILE_URLS,
+    OSNAP_TRANSPORT_FILES,
+    read_osnap,
+)
+from amocarray.read_rapid import (
+    RAPID_DEFAULT_FILES,
+    RAPID_DEFAULT_SOURCE,
+    RAPID_TRANSPORT_FILES,
+    read_rapid,
+)
+from amocarray.read_samba import (
+    SAMBA_DEFAULT_FILES,
+    SAMBA_FILE_URLS,
+    SAMBA_TRANSPORT_FILES,
+    read_samba,
+)
+from amocarray.read_fw2015 import (
+    FW2015_DEFAULT_FILES,
+    FW2015_FILE_URLS,
+    FW2015_TRANSPORT_FILES,
+    read_fw2015,
+)
+from amocarray.read_mocha import (
+    MOCHA_DEFAULT_FILES,
+    MOCHA_FILE_URLS,
+    MOCHA_TRANSPORT_FILES,
+    read_mocha,
+)
+from amocarray.read_41n import (
+    A41N_DEFAULT_FILES,
+    A41N_DEFAULT_SOURCE,
+    A41N_TRANSPORT_FILES,
+    read_41n,
+)
+from amocarray.read_dso import (
+    DSO_DEFAULT_FILES,
+    DSO_DEFAULT_SOURCE,
+    DSO_TRANSPORT_FILES,
+    read_dso,
+)
 
 log = logger.log
 
 # Dropbox location Public/linked_elsewhere/amocarray_data/
 server = "https://www.dropbox.com/scl/fo/4bjo8slq1krn5rkhbkyds/AM-EVfSHi8ro7u2y8WAcKyw?rlkey=16nqlykhgkwfyfeodkj274xpc&dl=0"
 
+# Remote file layout per array, used to prefetch files before parsing:
+# (default source directory, default files, transport files, per-file URLs)
+_REMOTE_FILES = {
+    "move": (MOVE_DEFAULT_SOURCE, MOVE_DEFAULT_FILES, MOVE_TRANSPORT_FILES, None),
+    "rapid": (RAPID_DEFAULT_SOURCE, RAPID_DEFAULT_FILES, RAPID_TRANSPORT_FILES, None),
+    "osnap": (None, OSNAP_DEFAULT_FILES, OSNAP_TRANSPORT_FILES, OSNAP_FILE_URLS),
+    "samba": (None, SAMBA_DEFAULT_FILES, SAMBA_TRANSPORT_FILES, SAMBA_FILE_URLS),
+    "fw2015": (None, FW2015_DEFAULT_FILES, FW2015_TRANSPORT_FILES, FW2015_FILE_URLS),
+    "mocha": (None, MOCHA_DEFAULT_FILES, MOCHA_TRANSPORT_FILES, MOCHA_FILE_URLS),
+    "41n": (A41N_DEFAULT_SOURCE, A41N_DEFAULT_FILES, A41N_TRANSPORT_FILES, None),
+    "dso": (DSO_DEFAULT_SOURCE, DSO_DEFAULT_FILES, DSO_TRANSPORT_FILES, None),
+}
+
+# Arrays whose readers open NetCDF files and accept chunks/lazy
+_NETCDF_ARRAYS = {"move", "rapid", "osnap", "mocha", "41n", "dso"}
+
+# Reader-specific options for re-opening an array's files with open_mfdataset
+_MFDATASET_OPTIONS = {
+    "move": {"decode_times": False, "preprocess": decode_move_time},
+}
+
 
 def _get_reader(array_name: str):
     """Return the reader function for the given array name.
@@ -99,6 +165,54 @@ def load_sample_dataset(array_name: str = "rapid") -> xr.Dataset:
     )
 
 
+def load_zarr(
+    store: Union[str, Path],
+    variables: Optional[list[str]] = None,
+    time_range: Optional[tuple] = None,
+    chunks: Union[dict, str, None] = None,
+) -> xr.Dataset:
+    """Lazily open a Zarr store written by `writers.save_zarr`.
+
+    Only the consolidated metadata is read on opening; selecting variables and
+    a time range here means only the chunks they cover are read later.
+
+    Parameters
+    ----------
+    store : str or Path
+        Path to the Zarr store.
+    variables : list of str, optional
+        Data variables to keep. Defaults to all.
+    time_range : tuple of (start, end), optional
+        Inclusive TIME bounds (anything ``ds.sel`` accepts, e.g. date strings).
+    chunks : dict or str, optional
+        Dask chunk sizes. Defaults to the chunking of the store.
+
+    Returns
+    -------
+    xr.Dataset
+        Dask-backed dataset.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the store does not exist.
+
+    """
+    if not Path(store).exists():
+        log_error("Zarr store not found: %s", store)
+        raise FileNotFoundError(f"Zarr store not found: {store}")
+
+    # An empty dict keeps the store's own chunking
+    ds = xr.open_zarr(store, consolidated=True, chunks={} if chunks is None else chunks)
+    if variables is not None:
+        ds = ds[variables]
+    if time_range is not None:
+        time_dim = "TIME" if "TIME" in ds.dims else "time"
+        ds = ds.sel({time_dim: slice(*time_range)})
+    log_info("Opened Zarr store %s", store)
+    return ds
+
+
 def load_dataset(
     array_name: str,
     source: str = None,
@@ -106,6 +220,11 @@ def load_dataset(
     transport_only: bool = True,
     data_dir: Union[str, Path, None] = None,
     redownload: bool = False,
+    refresh: Optional[str] = None,
+    chunks: Union[dict, str, None] = None,
+    lazy: bool = False,
+    combine: bool = False,
+    **reader_kwargs,
 ) -> list[xr.Dataset]:
     """Load raw datasets from a selected AMOC observing array.
 
@@ -120,6 +239,7 @@ def load_dataset(
         - 'fw2015' : FW2015 array
         - '41n' : 41N array
         - 'dso' : DSO array
+        - 'mocha' : MOCHA 26N heat transport
     source : str, optional
         URL or local path to the data source.
         If None, the reader-specific default source will be used.
@@ -132,6 +252,26 @@ def load_dataset(
         Local directory for downloaded files.
     redownload : bool, optional
         If True, force redownload of the data.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", revalidate cached files against the remote server
+        (ETag/Last-Modified, or MDTM/SIZE for FTP) and only download them again
+        if they have changed.
+    chunks : dict or str, optional
+        Dask chunk sizes per dimension (e.g. ``{"TIME": 365}``) or ``"auto"``.
+        If given, NetCDF files are opened lazily through dask.
+    lazy : bool, optional
+        If True, open NetCDF files lazily through dask with the reader's
+        per-product default chunking. Requires dask. Ignored (with a warning)
+        for arrays distributed as ASCII or MATLAB files.
+    combine : bool, optional
+        If True, datasets that share the same time axis (e.g. the RAPID
+        transport and vertical files) are combined into one lazily-merged
+        dataset. NetCDF files are re-opened together with
+        ``xr.open_mfdataset(parallel=True)``, which requires dask.
+    **reader_kwargs
+        Further options of the array's reader, e.g. ``variables`` for
+        `read_fw2015.read_fw2015`, or ``stream``, ``members`` and
+        ``verify_crc`` for `read_mocha.read_mocha`.
 
     Returns
     -------
@@ -152,13 +292,29 @@ def load_dataset(
     log_info(f"Loading dataset for array: {array_name}")
 
     reader = _get_reader(array_name)
+    open_kwargs = {}
+    if combine and array_name.lower() in _NETCDF_ARRAYS:
+        # Only open lazily here; the data is read once combined
+        lazy = True
+    if chunks is not None or lazy:
+        if array_name.lower() in _NETCDF_ARRAYS:
+            open_kwargs = {"chunks": chunks, "lazy": lazy}
+        else:
+            log_warning(
+                "Array %s is not distributed as NetCDF; loading eagerly", array_name
+            )
     datasets = reader(
         source=source,
         file_list=file_list,
         transport_only=transport_only,
         data_dir=data_dir,
         redownload=redownload,
+        refresh=refresh,
+        **open_kwargs,
+        **reader_kwargs,
     )
+    if combine:
+        datasets = _combine_datasets(datasets, array_name.lower())
 
     log_info(f"Successfully loaded {len(datasets)} dataset(s) for array: {array_name}")
     _summarise_datasets(datasets, array_name)
@@ -166,6 +322,268 @@ def load_dataset(
     return datasets
 
 
+def _combine_datasets(datasets: list[xr.Dataset], array_name: str) -> list[xr.Dataset]:
+    """Combine datasets that share an identical time axis.
+
+    Datasets are grouped by their time coordinate. Groups of NetCDF files are
+    re-opened with ``xr.open_mfdataset(parallel=True)`` so the merged dataset
+    stays lazy; other groups are merged in memory. Datasets without a time
+    axis, or with a time axis of their own, are returned unchanged.
+    """
+    groups: dict = {}
+    for idx, ds in enumerate(datasets):
+        key = _time_axis_key(ds)
+        groups.setdefault(key if key is not None else idx, []).append(ds)
+
+    combined = []
+    for group in groups.values():
+        if len(group) == 1:
+            combined.append(group[0])
+            continue
+
+        source_files = [ds.attrs.get("source_file", "Unknown") for ds in group]
+        log_info("Combining datasets sharing a time axis: %s", source_files)
+        paths = [ds.attrs.get("source_path", "") for ds in group]
+        if array_name in _NETCDF_ARRAYS and all(p.endswith(".nc") for p in paths):
+            merged = xr.open_mfdataset(
+                paths,
+                parallel=True,
+                combine="by_coords",
+                data_vars="minimal",
+                coords="minimal",
+                compat="override",
+                join="exact",
+                combine_attrs="drop_conflicts",
+                **_MFDATASET_OPTIONS.get(array_name, {}),
+            )
+        else:
+            merged = xr.merge(
+                group, compat="override", join="exact", combine_attrs="drop_conflicts"
+            )
+
+        # Keep the reader metadata shared by all files, and list the sources
+        shared_attrs = {
+            key: value
+            for key, value in group[0].attrs.items()
+            if all(ds.attrs.get(key) == value for ds in group[1:])
+        }
+        merged.attrs.update(shared_attrs)
+        merged.attrs["source_file"] = ", ".join(source_files)
+        merged.attrs["source_path"] = ", ".join(paths)
+        combined.append(merged)
+
+    return combined
+
+
+def _time_axis_key(ds: xr.Dataset) -> Optional[tuple]:
+    """Return a hashable key identifying the time axis of a dataset."""
+    for time_name in ("TIME", "time"):
+        if time_name in ds.dims and time_name in ds.coords:
+            values = np.asarray(ds[time_name].values)
+            digest = hashlib.sha1(values.tobytes()).hexdigest()
+            return time_name, values.size, digest
+    return None
+
+
+def load_datasets(
+    array_names: Optional[list[str]] = None,
+    max_workers: int = 4,
+    transport_only: bool = True,
+    data_dir: Union[str, Path, None] = None,
+    redownload: bool = False,
+    refresh: Optional[str] = None,
+    reader_kwargs: Optional[dict[str, dict]] = None,
+) -> dict[str, list[xr.Dataset]]:
+    """Load raw datasets from several AMOC observing arrays concurrently.
+
+    Files are first fetched over a thread pool (downloads are I/O bound), then
+    each array is opened and parsed in a process pool so that the CPU-bound
+    ASCII and MATLAB parsers run in parallel. A failure for one array is logged
+    and reported in the timing table without affecting the others.
+
+    Parameters
+    ----------
+    array_names : list of str, optional
+        Arrays to load. If None, all supported arrays are loaded.
+    max_workers : int, optional
+        Maximum number of download threads and parser processes. Default is 4.
+    transport_only : bool, optional
+        If True, restrict to transport files only.
+    data_dir : str, Path or None, optional
+        Local directory for downloaded files.
+    redownload : bool, optional
+        If True, force redownload of the data.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", revalidate cached files against the remote server
+        and only download them again if they have changed.
+    reader_kwargs : dict of {str: dict}, optional
+        Further reader options per array, e.g.
+        ``{"fw2015": {"variables": ["MOC_PROXY"]}}``.
+
+    Returns
+    -------
+    dict of {str: list of xarray.Dataset}
+        Datasets for each requested array, in the order requested. Arrays that
+        failed to load map to an empty list.
+
+    """
+    if array_names is None:
+        array_names = list(_REMOTE_FILES)
+    elif isinstance(array_names, str):
+        array_names = [array_names]
+    array_names = [name.lower() for name in array_names]
+    reader_kwargs = {
+        name.lower(): kwargs for name, kwargs in (reader_kwargs or {}).items()
+    }
+
+    if logger.LOGGING_ENABLED:
+        logger.setup_logger(array_name="multi")
+    log_info(f"Loading datasets for arrays: {array_names}")
+
+    local_data_dir = Path(data_dir) if data_dir else utilities.get_default_data_dir()
+    local_data_dir.mkdir(parents=True, exist_ok=True)
+
+    timings = {
+        name: {"download": 0.0, "open": 0.0, "status": "ok"} for name in array_names
+    }
+    errors: dict[str, Exception] = {}
+
+    # 1) Fetch all files over a thread pool
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            name: executor.submit(
+                _prefetch_array,
+                name,
+                transport_only,
+                local_data_dir,
+                redownload,
+                refresh,
+            )
+            for name in array_names
+        }
+        for name, future in futures.items():
+            try:
+                timings[name]["download"] = future.result()
+            except Exception as e:
+                log_error("Failed to fetch files for array %s: %s", name, e)
+                errors[name] = e
+
+    # 2) Open and parse the cached files over a process pool
+    to_open = [name for name in array_names if name not in errors]
+    results: dict[str, list[xr.Dataset]] = {}
+    if to_open:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(to_open))
+        ) as executor:
+            futures = {
+                name: executor.submit(
+                    _open_array,
+                    name,
+                    transport_only,
+                    local_data_dir,
+                    reader_kwargs.get(name, {}),
+                )
+                for name in to_open
+            }
+            for name, future in futures.items():
+                try:
+                    results[name], timings[name]["open"] = future.result()
+                except Exception as e:
+                    log_error("Failed to open datasets for array %s: %s", name, e)
+                    errors[name] = e
+
+    datasets_by_array = {}
+    for name in array_names:
+        datasets_by_array[name] = results.get(name, [])
+        if name in errors:
+            timings[name]["status"] = f"failed: {errors[name]}"
+
+    _summarise_timings(datasets_by_array, timings)
+
+    return datasets_by_array
+
+
+def _prefetch_array(
+    array_name: str,
+    transport_only: bool,
+    local_data_dir: Path,
+    redownload: bool,
+    refresh: Optional[str],
+) -> float:
+    """Resolve (download or reuse) every default file of an array.
+
+    Returns the elapsed time in seconds.
+    """
+    if array_name not in _REMOTE_FILES:
+        raise ValueError(
+            f"Unknown array name: {array_name}. Valid options are: {list(_REMOTE_FILES)}",
+        )
+    default_source, default_files, transport_files, file_urls = _REMOTE_FILES[
+        array_name
+    ]
+    file_list = transport_files if transport_only else default_files
+
+    start = time.perf_counter()
+    for file in file_list:
+        if file_urls is not None:
+            download_url = file_urls.get(file)
+        else:
+            download_url = f"{default_source.rstrip('/')}/{file}"
+        utilities.resolve_file_path(
+            file_name=file,
+            source=None,
+            download_url=download_url,
+            local_data_dir=local_data_dir,
+            redownload=redownload,
+            refresh=refresh,
+        )
+    return time.perf_counter() - start
+
+
+def _open_array(
+    array_name: str,
+    transport_only: bool,
+    local_data_dir: Path,
+    reader_kwargs: dict,
+) -> tuple[list[xr.Dataset], float]:
+    """Open the already-fetched files of an array in a worker process.
+
+    Returns the datasets and the elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    reader = _get_reader(array_name)
+    datasets = reader(
+        source=None,
+        file_list=None,
+        transport_only=transport_only,
+        data_dir=local_data_dir,
+        redownload=False,
+        **reader_kwargs,
+    )
+    return datasets, time.perf_counter() - start
+
+
+def _summarise_timings(datasets_by_array: dict, timings: dict) -> None:
+    """Print and log a per-array timing table for load_datasets."""
+    header = (
+        f"{'Array':<8} {'Datasets':>8} {'Download [s]':>12} {'Open [s]':>9}  Status"
+    )
+    summary_lines = ["Timing summary:", header, "-" * len(header)]
+    for name, timing in timings.items():
+        summary_lines.append(
+            f"{name:<8} {len(datasets_by_array[name]):>8} "
+            f"{timing['download']:>12.2f} {timing['open']:>9.2f}  {timing['status']}"
+        )
+
+    summary = "\n".join(summary_lines)
+
+    # Print to console
+    print(summary)
+
+    # Write to log
+    log_info("\n" + summary)
+
+
 def _summarise_datasets(datasets: list, array_name: str):
     """Print and log a summary of loaded datasets."""
     summary_lines = []
@@ -10,11 +10,13 @@ Currently implemented:
 - SAMBA
 """
 
+import time
+from concurrent.futures import ProcessPoolExecutor
 import xarray as xr
 from collections import OrderedDict
 import re
 from amocarray import logger, utilities
-from amocarray.logger import log_debug
+from amocarray.logger import log_debug, log_error, log_info
 
 log = logger.log  # Use the global logger
 
@@ -63,20 +65,62 @@ _GLOBAL_ATTR_ORDER = [
     "Conventions",  # preserve this exact case
 ]
 
+# Value normalizations and vocabularies applied to the global attributes
+_NORMALIZATIONS = {
+    "platform": (
+        {"Mooring array": "mooring"},
+        "https://vocab.nerc.ac.uk/collection/L06/",
+    ),
+    "featureType": (
+        {"timeSeries": "timeSeries"},
+        "https://cfconventions.org/cf-conventions/v1.6.0/cf-conventions.html#_features_and_feature_types",
+    ),
+    # add more fields here as needed
+}
+
 _INSTITUTION_CORRECTIONS = {
     "National Oceanography Centre,UK": "National Oceanography Centre (Southampton) (UK)",
     # add more exact‐string fixes here as you discover them
 }
 
+# Attribute keys (lowercase) merged into contributing_institutions
+_INSTITUTION_KEYS = ("institution", "publisher_institution", "contributor_institution")
+
+# Institution vocabulary, keyed by whitespace-normalized, casefolded name
+_INSTITUTION_VOCABULARY = {
+    " ".join(key.casefold().split()): url
+    for key, url in {
+        "national oceanography centre (southampton) (uk)": "https://edmo.seadatanet.org/report/17",
+        "helmholtz centre for ocean research kiel (geomar)": "https://edmo.seadatanet.org/report/2947",
+        # add more lower‐cased, normalized keys here...
+    }.items()
+}
+
 
-def reorder_metadata(attrs: dict) -> dict:
+def _lowercase_keys(attrs: dict) -> dict:
+    """Map each key of ``attrs`` to its lowercase form.
+
+    Built once per attrs dict and shared by the steps of the metadata
+    pipeline, which extend it with the keys they create.
+    """
+    return {key: key.lower() for key in attrs}
+
+
+def reorder_metadata(attrs: dict, lower_keys: dict = None) -> dict:
     """
     Return a new dict with keys ordered according to the OG1.0 global‐attribute list.
     Any attrs not in the spec list are appended at the end, in their original order.
+    ``lower_keys`` is the key -> lowercase index from `_lowercase_keys`.
     """
+    if lower_keys is None:
+        lower_keys = _lowercase_keys(attrs)
     # Shallow copy so we can pop
     remaining = dict(attrs)
     ordered = OrderedDict()
+    # first key of each lowercase spelling
+    index = {}
+    for key in remaining:
+        index.setdefault(lower_keys.get(key) or key.lower(), key)
 
     for key in _GLOBAL_ATTR_ORDER:
         # featureType is case‐sensitive; everything else is matched lowercase
@@ -84,14 +128,10 @@ def reorder_metadata(attrs: dict) -> dict:
             if "featureType" in remaining:
                 ordered["featureType"] = remaining.pop("featureType")
         else:
-            # look for any remaining key whose lower() matches
-            to_remove = None
-            for orig in remaining:
-                if orig.lower() == key:
-                    to_remove = orig
-                    break
-            if to_remove is not None:
-                ordered[to_remove] = remaining.pop(to_remove)
+            # first remaining key whose lower() matches
+            orig = index.get(key)
+            if orig is not None and orig in remaining:
+                ordered[orig] = remaining.pop(orig)
 
     # finally, append all the rest in their original insertion order
     for orig, val in remaining.items():
@@ -139,15 +179,22 @@ def normalize_and_add_vocabulary(
     return attrs
 
 
-def clean_metadata(attrs: dict, preferred_keys: dict = None) -> dict:
+def clean_metadata(
+    attrs: dict, preferred_keys: dict = None, lower_keys: dict = None
+) -> dict:
     """
     Clean up a metadata dictionary:
     - Normalize key casing
     - Merge aliases with identical values
     - Apply standard naming (via preferred_keys mapping)
+
+    ``lower_keys`` is the key -> lowercase index from `_lowercase_keys`; it is
+    extended with the keys created here so later steps can reuse it.
     """
     # Step 0: normalize whitespace everywhere
     attrs = utilities.normalize_whitespace(attrs)
+    if lower_keys is None:
+        lower_keys = _lowercase_keys(attrs)
 
     if preferred_keys is None:
         preferred_keys = {
@@ -168,40 +215,24 @@ def clean_metadata(attrs: dict, preferred_keys: dict = None) -> dict:
             "creation_date": "date_created",
         }
 
-    # Step 1: merge any identical aliases first
-    merged_attrs = merge_metadata_aliases(attrs, preferred_keys)
-
-    # Step 2: normalize remaining cases and resolve conflicts
-    cleaned = {}
-    for key, value in merged_attrs.items():
-        # key is already canonical if it was an alias
-        if key in cleaned:
-            if cleaned[key] == value:
-                log_debug(f"Skipping identical '{key}'")
-                continue
-            if len(str(value)) > len(str(cleaned[key])):
-                log_debug(
-                    f"Replacing '{key}' value with longer one ("
-                    f"{len(str(cleaned[key]))}→{len(str(value))} chars)"
-                )
-                cleaned[key] = value
-            else:
-                log_debug(f"Keeping existing '{key}', ignoring shorter from merge")
-        else:
-            cleaned[key] = value
+    # Step 1: merge aliases and normalize key casing; merge_metadata_aliases
+    # already resolves conflicts, so each canonical key appears once
+    cleaned = merge_metadata_aliases(attrs, preferred_keys, lower_keys)
 
-    # Step 3: consolidate contributors and institutions
-    cleaned = _consolidate_contributors(cleaned)
+    # Step 2: consolidate contributors and institutions
+    cleaned = _consolidate_contributors(cleaned, lower_keys)
     return cleaned
 
 
-def _consolidate_contributors(cleaned: dict) -> dict:
+def _consolidate_contributors(cleaned: dict, lower_keys: dict = None) -> dict:
     """
     Consolidate creators, PIs, publishers, and contributors into unified fields:
     - contributor_name, contributor_role, contributor_email, contributor_id aligned one-to-one
     - contributing_institutions, with placeholders for vocabularies/roles
     """
     log_debug("Starting _consolidate_contributors with attrs: %s", cleaned)
+    if lower_keys is None:
+        lower_keys = _lowercase_keys(cleaned)
 
     role_map = {
         "creator_name": "creator",
@@ -306,78 +337,62 @@ def _consolidate_contributors(cleaned: dict) -> dict:
         log_debug("Placeholder contributor_id=%r", cleaned["contributor_id"])
 
     # Step D: consolidate institution keys
-    inst_vocab_map = {
-        "national oceanography centre (southampton) (uk)": "https://edmo.seadatanet.org/report/17",
-        "helmholtz centre for ocean research kiel (geomar)": "https://edmo.seadatanet.org/report/2947",
-        # add more lower‐cased, normalized keys here...
-    }
-    # Build normalized lookup (keys are already whitespace‑cleaned and casefolded)
-    inst_vocab_norm = {
-        re.sub(r"\s+", " ", key.casefold().strip()): url
-        for key, url in inst_vocab_map.items()
-    }
-    for raw_key, url in inst_vocab_map.items():
-        k2 = re.sub(r"\s+", " ", raw_key.replace("\u00A0", " ")).strip().lower()
-        k2 = " ".join(raw_key.strip().casefold().split())
-        inst_vocab_norm[k2] = url
-
-        insts = []
-        inst_vocabs = []
-        for attr_key in list(cleaned.keys()):
-            if attr_key.lower() in (
-                "institution",
-                "publisher_institution",
-                "contributor_institution",
-            ):
-                raw_inst = cleaned.pop(attr_key)
-
-                # apply any known corrections
-                fixed = _INSTITUTION_CORRECTIONS.get(raw_inst, raw_inst)
-
-                # split on semicolons only (commas inside names are preserved)
-                if ";" in fixed:
-                    parts = [p.strip() for p in fixed.split(";") if p.strip()]
-                else:
-                    parts = [fixed.strip()]
-
-                for inst in parts:
-                    # normalize for lookup
-                    lookup = re.sub(r"\s+", " ", inst.casefold().strip())
-
-                    # try exact match
-                    url = inst_vocab_norm.get(lookup, "")
-
-                    # fallback: substring match
-                    if not url:
-                        for k_norm, v in inst_vocab_norm.items():
-                            if lookup == k_norm or lookup in k_norm:
-                                url = v
-                                break
-
-                    insts.append(inst)
-                    inst_vocabs.append(url)
-                    log_debug("Matched institution %r → %r → %r", inst, lookup, url)
-
-        if insts:
-            # dedupe institutions, preserving order
-            unique_insts = list(dict.fromkeys(insts))
-            # align vocab list to those unique insts
-            seen = set()
-            unique_vocabs = []
-            for inst, url in zip(insts, inst_vocabs):
-                if inst not in seen:
-                    seen.add(inst)
-                    unique_vocabs.append(url)
-
-            cleaned["contributing_institutions"] = ", ".join(unique_insts)
-            cleaned["contributing_institutions_vocabulary"] = ", ".join(unique_vocabs)
-            cleaned.setdefault("contributing_institutions_role", "")
-            cleaned.setdefault("contributing_institutions_role_vocabulary", "")
+    insts = []
+    inst_vocabs = []
+    for attr_key in list(cleaned.keys()):
+        # keys added above (contributor_*) are lowercase already
+        if lower_keys.get(attr_key, attr_key) in _INSTITUTION_KEYS:
+            raw_inst = cleaned.pop(attr_key)
+
+            # apply any known corrections
+            fixed = _INSTITUTION_CORRECTIONS.get(raw_inst, raw_inst)
+
+            # split on semicolons only (commas inside names are preserved)
+            if ";" in fixed:
+                parts = [p.strip() for p in fixed.split(";") if p.strip()]
+            else:
+                parts = [fixed.strip()]
+
+            for inst in parts:
+                # normalize for lookup
+                lookup = re.sub(r"\s+", " ", inst.casefold().strip())
+
+                # try exact match
+                url = _INSTITUTION_VOCABULARY.get(lookup, "")
+
+                # fallback: substring match
+                if not url:
+                    for k_norm, v in _INSTITUTION_VOCABULARY.items():
+                        if lookup == k_norm or lookup in k_norm:
+                            url = v
+                            break
+
+                insts.append(inst)
+                inst_vocabs.append(url)
+                log_debug("Matched institution %r → %r → %r", inst, lookup, url)
+
+    if insts:
+        # dedupe institutions, preserving order
+        unique_insts = list(dict.fromkeys(insts))
+        # align vocab list to those unique insts
+        seen = set()
+        unique_vocabs = []
+        for inst, url in zip(insts, inst_vocabs):
+            if inst not in seen:
+                seen.add(inst)
+                unique_vocabs.append(url)
+
+        cleaned["contributing_institutions"] = ", ".join(unique_insts)
+        cleaned["contributing_institutions_vocabulary"] = ", ".join(unique_vocabs)
+        cleaned.setdefault("contributing_institutions_role", "")
+        cleaned.setdefault("contributing_institutions_role_vocabulary", "")
     log_debug("Finished _consolidate_contributors: %s", cleaned)
     return cleaned
 
 
-def merge_metadata_aliases(attrs: dict, preferred_keys: dict) -> dict:
+def merge_metadata_aliases(
+    attrs: dict, preferred_keys: dict, lower_keys: dict = None
+) -> dict:
     """
     Consolidate and rename metadata keys case‑insensitively (except featureType),
     using preferred_keys to map aliases to canonical names.
@@ -388,12 +403,17 @@ def merge_metadata_aliases(attrs: dict, preferred_keys: dict) -> dict:
         Metadata dictionary with potential duplicates.
     preferred_keys : dict
         Mapping of lowercase alias keys to preferred canonical keys.
+    lower_keys : dict, optional
+        Key -> lowercase index of ``attrs`` (see `_lowercase_keys`). Canonical
+        keys are added to it.
 
     Returns
     -------
     dict
         Metadata dictionary with duplicates merged and keys renamed.
     """
+    if lower_keys is None:
+        lower_keys = _lowercase_keys(attrs)
     merged = {}
     for orig_key, value in attrs.items():
         # Preserve 'featureType' exactly
@@ -402,13 +422,15 @@ def merge_metadata_aliases(attrs: dict, preferred_keys: dict) -> dict:
         elif orig_key == "Conventions":
             canonical = "Conventions"
         else:
-            low = orig_key.lower()
+            low = lower_keys[orig_key]
             # 1) if we have a mapping for this lowercase alias, rename
             if low in preferred_keys:
                 canonical = preferred_keys[low]
+                lower_keys.setdefault(canonical, canonical.lower())
             # 2) otherwise use the lowercased key
             else:
                 canonical = low
+                lower_keys.setdefault(canonical, canonical)
 
         # Log any renaming
         if canonical != orig_key:
@@ -465,9 +487,15 @@ def standardise_dso(ds: xr.Dataset, file_name: str) -> xr.Dataset:
     return standardise_array(ds, file_name, array_name="dso")
 
 
-def standardise_array(ds: xr.Dataset, file_name: str, array_name: str) -> xr.Dataset:
+def standardise_array(
+    ds: xr.Dataset, file_name: str, array_name: str, inplace: bool = False
+) -> xr.Dataset:
     """Standardise a mooring array dataset using YAML-based metadata.
 
+    The final attributes of each variable and of the dataset are built in a
+    single pass and assigned once; variables are renamed last, without copying
+    their data.
+
     Parameters
     ----------
     ds : xr.Dataset
@@ -476,6 +504,10 @@ def standardise_array(ds: xr.Dataset, file_name: str, array_name: str) -> xr.Dat
         Filename (e.g., 'moc_transports.nc') expected to match ds.attrs["source_file"].
     array_name : str
         Name of the mooring array (e.g., 'samba', 'rapid', 'move', 'osnap', 'fw2015', 'mocha').
+    inplace : bool, optional
+        If True, update the attributes of ``ds`` itself instead of a shallow
+        copy. Useful for large gridded datasets. When variables need renaming,
+        the returned Dataset is a new object sharing the data of ``ds``.
 
     Returns
     -------
@@ -493,72 +525,171 @@ def standardise_array(ds: xr.Dataset, file_name: str, array_name: str) -> xr.Dat
         raise ValueError(f"file_name {file_name!r} ≠ ds.attrs['source_file'] {src!r}")
     log_debug(f"Standardising {file_name} for {array_name.upper()}")
 
-    # 2) Collect new attrs from YAML
-    meta = utilities.load_array_metadata(array_name)
+    # 2) Collect new attrs from the compiled YAML metadata
+    meta = utilities.get_array_metadata(array_name)
     file_meta = meta["files"].get(file_name, {})
+    rename_dict = dict(file_meta.get("variable_mapping", {}))
+    if not inplace:
+        ds = ds.copy(deep=False)
+
+    # Apply per-variable metadata (keyed by the renamed variable names), removing
+    # attributes that are blank or 'n/a'
+    original_names = {new: old for old, new in rename_dict.items()}
+    var_attrs = file_meta.get("variable_attrs", {})
+    blank_attrs = file_meta.get("blank_attrs", {})
+    for var_name, attrs in var_attrs.items():
+        if var_name in original_names:
+            source_name = original_names[var_name]
+        elif var_name not in rename_dict:
+            source_name = var_name
+        else:
+            continue
+        if source_name not in ds.variables:
+            continue
+        variable = ds.variables[source_name]
+        new_attrs = {**variable.attrs, **attrs}
+        for attr_key in blank_attrs[var_name]:
+            if new_attrs.pop(attr_key, None) is not None:
+                log_debug(
+                    "Removed blank attribute '%s' from variable '%s'",
+                    attr_key,
+                    var_name,
+                )
+        variable.attrs = new_attrs
 
-    # Rename variables
-    rename_dict = file_meta.get("variable_mapping", {})
-    ds = ds.rename(rename_dict)
-
-    # Apply per-variable metadata
-    var_meta = file_meta.get("variables", {})
-    for var_name, attrs in var_meta.items():
-        if var_name in ds.variables:
-            ds[var_name].attrs.update(attrs)
-
-    # If any attributes are blank or value 'n/a', remove them
-    for var_name, attrs in list(var_meta.items()):
-        if var_name in ds.variables:
-            for attr_key, attr_value in attrs.items():
-                if attr_value in ("", "n/a"):
-                    ds[var_name].attrs.pop(attr_key, None)
-                    log_debug(
-                        "Removed blank attribute '%s' from variable '%s'",
-                        attr_key,
-                        var_name,
-                    )
-    # Remove any empty attributes from the dataset
-    for attr_key, attr_value in list(
-        ds.attrs.items()
-    ):  # Iterate over a copy of the items
+    # 3) Merge existing attrs (without blank ones) + new global attrs + file-specific
+    combined = {}
+    for attr_key, attr_value in ds.attrs.items():
         if attr_value in ("", "n/a"):
-            ds.attrs.pop(attr_key, None)
             log_debug("Removed blank attribute '%s' from dataset", attr_key)
+        else:
+            combined[attr_key] = attr_value
+    if file_meta:
+        # array-level, summary/weblink and file-specific
+        combined.update(file_meta["global_attrs"])
+    else:
+        array_meta = meta["raw"].get("metadata", {})
+        combined.update(array_meta)
+        combined.update(
+            {
+                "summary": array_meta.get("description", ""),
+                "weblink": array_meta.get("weblink", ""),
+            }
+        )
 
-    # 3) Merge existing attrs + new global attrs + file-specific
-    combined = {}
-    combined.update(ds.attrs)  # original reader attrs
-    combined.update(meta.get("metadata", {}))  # array‑level
-    combined.update(
-        {
-            "summary": meta["metadata"].get("description", ""),
-            "weblink": meta["metadata"].get("weblink", ""),
-        }
-    )
-    combined.update(
-        {k: file_meta[k] for k in ("acknowledgement", "data_product") if k in file_meta}
-    )
-
-    # 4) Clean up collisions & override ds.attrs wholesale
-    cleaned = clean_metadata(combined)
+    # 4) Clean up collisions
+    lower_keys = _lowercase_keys(combined)
+    cleaned = clean_metadata(combined, lower_keys=lower_keys)
 
     # 5) Normalize and add vocabularies
-    normalizations = {
-        "platform": (
-            {"Mooring array": "mooring"},
-            "https://vocab.nerc.ac.uk/collection/L06/",
-        ),
-        "featureType": (
-            {"timeSeries": "timeSeries"},
-            "https://cfconventions.org/cf-conventions/v1.6.0/cf-conventions.html#_features_and_feature_types",
-        ),
-        # add more fields here as needed
-    }
-    cleaned = normalize_and_add_vocabulary(cleaned, normalizations)
+    cleaned = normalize_and_add_vocabulary(cleaned, _NORMALIZATIONS)
 
-    # 6) Reorder metadata according
-    ds.attrs = cleaned
-    ds.attrs = reorder_metadata(ds.attrs)
-    #    ds = utilities.safe_update_attrs(ds, cleaned, overwrite=False)
+    # 6) Reorder metadata and override ds.attrs wholesale
+    ds.attrs = reorder_metadata(cleaned, lower_keys)
+
+    # 7) Rename variables last; this shares the data of the variables
+    if rename_dict:
+        ds = ds.rename(rename_dict)
     return ds
+
+
+def standardise_all(
+    datasets_by_array: dict[str, list[xr.Dataset]], workers: int = 4
+) -> dict[str, list[xr.Dataset]]:
+    """Standardise the datasets of several arrays in parallel.
+
+    Each dataset is passed to ``standardise_array`` in a process pool, using
+    its ``source_file`` attribute as the file name. Every worker compiles the
+    YAML metadata of the arrays once on start-up and reuses it for all of its
+    datasets. A per-array timing table is printed at the end.
+
+    Parameters
+    ----------
+    datasets_by_array : dict of {str: list of xr.Dataset}
+        Raw datasets per array, e.g. as returned by ``readers.load_datasets``.
+    workers : int, optional
+        Number of worker processes. With 1, datasets are standardised serially
+        in the current process. Default is 4.
+
+    Returns
+    -------
+    dict of {str: list of xr.Dataset}
+        Standardised datasets, with the same keys and order as the input.
+
+    Raises
+    ------
+    ValueError
+        If a dataset has no ``source_file`` attribute.
+
+    """
+    jobs = []
+    for array_name, datasets in datasets_by_array.items():
+        for ds in datasets:
+            file_name = ds.attrs.get("source_file")
+            if not file_name:
+                raise ValueError(
+                    f"Dataset from array {array_name!r} has no 'source_file' attribute"
+                )
+            jobs.append((array_name, file_name, ds))
+    array_names = list(datasets_by_array)
+
+    start = time.perf_counter()
+    if workers <= 1 or len(jobs) <= 1:
+        results = [_timed_standardise(ds, f, a) for a, f, ds in jobs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(jobs)),
+            initializer=_compile_metadata,
+            initargs=(array_names,),
+        ) as executor:
+            futures = [
+                executor.submit(_timed_standardise, ds, f, a) for a, f, ds in jobs
+            ]
+            results = []
+            for (array_name, file_name, _), future in zip(jobs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    log_error(
+                        "Failed to standardise %s (%s): %s", file_name, array_name, e
+                    )
+                    raise
+    wall_time = time.perf_counter() - start
+
+    standardised = {name: [] for name in array_names}
+    timings = {name: 0.0 for name in array_names}
+    for (array_name, _, _), (ds, elapsed) in zip(jobs, results):
+        standardised[array_name].append(ds)
+        timings[array_name] += elapsed
+
+    _summarise_standardise_timings(standardised, timings, wall_time)
+    return standardised
+
+
+def _compile_metadata(array_names: list[str]) -> None:
+    """Compile the metadata of the given arrays (process pool initializer)."""
+    for array_name in array_names:
+        utilities.get_array_metadata(array_name)
+
+
+def _timed_standardise(
+    ds: xr.Dataset, file_name: str, array_name: str
+) -> tuple[xr.Dataset, float]:
+    start = time.perf_counter()
+    ds = standardise_array(ds, file_name, array_name)
+    return ds, time.perf_counter() - start
+
+
+def _summarise_standardise_timings(
+    standardised: dict, timings: dict, wall_time: float
+) -> None:
+    """Print and log a per-array timing table for standardise_all."""
+    header = f"{'Array':<8} {'Datasets':>8} {'Standardise [s]':>15}"
+    summary_lines = ["Standardisation timing summary:", header, "-" * len(header)]
+    for name, elapsed in timings.items():
+        summary_lines.append(f"{name:<8} {len(standardised[name]):>8} {elapsed:>15.2f}")
+    summary_lines.append(f"Wall time: {wall_time:.2f} s")
+
+    summary = "\n".join(summary_lines)
+    print(summary)
+    log_info("\n" + summary)
@@ -1,10 +1,14 @@
 import re
+from collections import deque
+from functools import lru_cache
+from typing import Optional, Union
 
 import numpy as np
+import pandas as pd
 import xarray as xr
 
 from amocarray import logger
-from amocarray.logger import log_info, log_debug
+from amocarray.logger import log_info, log_debug, log_warning
 
 log = logger.log
 
@@ -76,6 +80,16 @@ unit_str_format = {
 }
 
 
+# Encoding keys describing how values are packed on disk
+PACKING_ENCODING_KEYS = (
+    "dtype",
+    "scale_factor",
+    "add_offset",
+    "_FillValue",
+    "missing_value",
+)
+
+
 def reformat_units_var(
     ds: xr.Dataset,
     var_name: str,
@@ -129,26 +143,220 @@ def convert_units_var(
     numpy.ndarray or float
         The converted variable values. If no conversion factor is found, the original values are returned.
 
-    Raises
-    ------
-    KeyError
-        If the conversion factor for the specified units is not found in the `unit_conversion` dictionary.
-
     Notes
     -----
-    If the conversion factor for the specified units is not available, a message is printed, and the original
-    values are returned without any conversion.
+    Multi-hop conversions are followed (see `find_conversion_factor`). If no
+    conversion is available, a warning is logged and the original values are
+    returned without any conversion.
 
     """
-    try:
-        conversion_factor = unit_conversion[current_unit][new_unit]
-        return var_values * conversion_factor
-    except KeyError:
-        print(f"No conversion information found for {current_unit} to {new_unit}")
+    conversion_factor = find_conversion_factor(current_unit, new_unit, unit_conversion)
+    if conversion_factor is None:
+        log_warning(f"No conversion information found for {current_unit} to {new_unit}")
         return var_values
+    return var_values * conversion_factor
+
+
+def find_conversion_factor(
+    current_unit: str,
+    new_unit: str,
+    unit_conversion: dict[str, dict[str, float]] = unit_conversion,
+    unit_format: dict[str, str] = unit_str_format,
+) -> Optional[float]:
+    """Find the factor converting one unit to another, following multi-hop paths.
+
+    Units are nodes of a graph whose edges are the entries of ``unit_conversion``;
+    alternative spellings in ``unit_format`` (e.g. "m/s" and "m s-1") are joined by
+    edges with factor 1. The factor is the product along the shortest path. The
+    default graph is compiled once at import and its factors are cached per unit
+    pair; custom graphs are searched on each call.
+
+    Parameters
+    ----------
+    current_unit : str
+        The current unit.
+    new_unit : str
+        The target unit.
+    unit_conversion : dict of {str: dict of {str: float}}, optional
+        Conversion factors between units. Defaults to `unit_conversion`.
+    unit_format : dict of {str: str}, optional
+        Equivalent unit spellings. Defaults to `unit_str_format`.
+
+    Returns
+    -------
+    float or None
+        The multiplicative conversion factor, or None if the units are not
+        connected.
+
+    """
+    if (
+        unit_conversion is _DEFAULT_UNIT_CONVERSION
+        and unit_format is _DEFAULT_UNIT_FORMAT
+    ):
+        return _default_conversion_factor(current_unit, new_unit)
+    graph = _build_conversion_graph(unit_conversion, unit_format)
+    return _shortest_path_factor(graph, current_unit, new_unit)
+
+
+def _build_conversion_graph(
+    unit_conversion: dict[str, dict[str, float]], unit_format: dict[str, str]
+) -> dict[str, dict[str, float]]:
+    """Adjacency map of conversion factors, with unit spellings joined by factor 1."""
+    graph = {unit: dict(targets) for unit, targets in unit_conversion.items()}
+    for old, new in unit_format.items():
+        graph.setdefault(old, {}).setdefault(new, 1)
+        graph.setdefault(new, {}).setdefault(old, 1)
+    return graph
+
+
+def _shortest_path_factor(
+    graph: dict[str, dict[str, float]], current_unit: str, new_unit: str
+) -> Optional[float]:
+    """Breadth-first search for the shortest conversion path between two units."""
+    factors = {current_unit: 1.0}
+    queue = deque([current_unit])
+    while queue:
+        unit = queue.popleft()
+        if unit == new_unit:
+            return factors[unit]
+        for target, factor in graph.get(unit, {}).items():
+            if target not in factors:
+                factors[target] = factors[unit] * factor
+                queue.append(target)
+    return None
+
+
+# The default conversion graph, compiled once at import
+_DEFAULT_UNIT_CONVERSION = unit_conversion
+_DEFAULT_UNIT_FORMAT = unit_str_format
+_DEFAULT_CONVERSION_GRAPH = _build_conversion_graph(unit_conversion, unit_str_format)
+
+
+@lru_cache(maxsize=1024)
+def _default_conversion_factor(current_unit: str, new_unit: str) -> Optional[float]:
+    """Conversion factor over the default graph, cached per unit pair."""
+    return _shortest_path_factor(_DEFAULT_CONVERSION_GRAPH, current_unit, new_unit)
+
+
+def convert_units_ds(
+    ds: xr.Dataset,
+    preferred: list[str] = preferred_units,
+    unit_conversion: dict[str, dict[str, float]] = unit_conversion,
+    unit_format: dict[str, str] = unit_str_format,
+) -> xr.Dataset:
+    """Convert every variable of a dataset to the preferred units where possible.
 
+    For each variable with a ``units`` attribute, the first unit in ``preferred``
+    that can be reached through the conversion graph (see
+    `find_conversion_factor`) is used. The data is multiplied once by the combined
+    factor, which stays lazy for dask-backed variables, and the ``units``,
+    ``valid_min`` and ``valid_max`` attributes are updated.
 
-def find_best_dtype(var_name: str, da: xr.DataArray) -> np.dtype:
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        The input dataset.
+    preferred : list of str, optional
+        Preferred target units, in order of priority. Defaults to `preferred_units`.
+    unit_conversion : dict of {str: dict of {str: float}}, optional
+        Conversion factors between units. Defaults to `unit_conversion`.
+    unit_format : dict of {str: str}, optional
+        Equivalent unit spellings. Defaults to `unit_str_format`.
+
+    Returns
+    -------
+    xarray.Dataset
+        A new dataset with converted variables. Variables without a reachable
+        preferred unit are left unchanged.
+
+    """
+    converted = {}
+    for var_name, da in ds.data_vars.items():
+        current_unit = da.attrs.get("units")
+        if not isinstance(current_unit, str) or current_unit in preferred:
+            continue
+        for target_unit in preferred:
+            factor = find_conversion_factor(
+                current_unit, target_unit, unit_conversion, unit_format
+            )
+            if factor is not None:
+                break
+        else:
+            continue
+
+        attrs = dict(da.attrs, units=target_unit)
+        for att in ["valid_min", "valid_max"]:
+            if att in attrs:
+                attrs[att] = attrs[att] * factor
+        da_new = da if factor == 1 else da * factor
+        converted[var_name] = da_new.assign_attrs(attrs)
+        # Packing of the source values does not fit the rescaled values
+        converted[var_name].encoding = {
+            key: value
+            for key, value in da.encoding.items()
+            if factor == 1 or key not in PACKING_ENCODING_KEYS
+        }
+        log_debug(f"{var_name}: converted {current_unit} to {target_unit} (x{factor})")
+
+    if converted:
+        log_info(f"Converted units of {len(converted)} variable(s): {list(converted)}")
+    return ds.assign(converted)
+
+
+# Integer dtypes tried, smallest first, when downcasting integer-valued variables
+_INT_DTYPES = (np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32)
+
+# Dtype and fill value used to pack floats with scale_factor/add_offset
+PACKED_DTYPE = np.int16
+PACKED_FILL_VALUE = -32768
+
+
+def compute_min_max(
+    ds: xr.Dataset, var_names: Optional[list[str]] = None
+) -> dict[str, tuple[float, float]]:
+    """Compute the minimum and maximum of numeric variables in one pass.
+
+    The reductions of all variables are evaluated together, so dask-backed
+    datasets are read only once and never fully materialised.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        The input dataset.
+    var_names : list of str, optional
+        Variables to reduce. Defaults to all numeric data variables.
+
+    Returns
+    -------
+    dict of {str: tuple of (float, float)}
+        NaN-skipping (min, max) per variable; (nan, nan) if all values are NaN.
+
+    """
+    if var_names is None:
+        var_names = list(ds.data_vars)
+    var_names = [
+        v for v in var_names if np.issubdtype(ds[v].dtype, np.number) and ds[v].size > 0
+    ]
+    reductions = []
+    for var_name in var_names:
+        reductions.extend([ds[var_name].min(), ds[var_name].max()])
+    if any(ds[v].chunks is not None for v in var_names):
+        import dask
+
+        reductions = dask.compute(*reductions)
+    values = [float(r) for r in reductions]
+    return {
+        var_name: (values[2 * i], values[2 * i + 1])
+        for i, var_name in enumerate(var_names)
+    }
+
+
+def find_best_dtype(
+    var_name: str,
+    da: xr.DataArray,
+    vmin: Optional[float] = None,
+    vmax: Optional[float] = None,
+) -> np.dtype:
     """Determines the most suitable data type for a given variable.
 
     Parameters
@@ -157,11 +365,16 @@ def find_best_dtype(var_name: str, da: xr.DataArray) -> np.dtype:
         The name of the variable.
     da : xarray.DataArray
         The data array containing the variable's values.
+    vmin, vmax : float, optional
+        Precomputed minimum and maximum of the values (see `compute_min_max`).
+        Computed here if not given and needed.
 
     Returns
     -------
     numpy.dtype
         The optimal data type for the variable based on its name and values.
+        Integer-valued variables get the smallest (signed or unsigned) integer
+        type holding their range, keeping the type's maximum free as fill value.
 
     """
     input_dtype = da.dtype.type
@@ -172,10 +385,13 @@ def find_best_dtype(var_name: str, da: xr.DataArray) -> np.dtype:
     if "time" in var_name.lower():
         return input_dtype
     if var_name[-3:] == "raw" or "int" in str(input_dtype):
-        if np.nanmax(da.values) < 2**16 / 2:
-            return np.int16
-        elif np.nanmax(da.values) < 2**32 / 2:
-            return np.int32
+        if vmin is None or vmax is None:
+            vmin, vmax = float(da.min()), float(da.max())
+        if np.isfinite(vmin) and np.isfinite(vmax):
+            for int_dtype in _INT_DTYPES:
+                info = np.iinfo(int_dtype)
+                if vmin >= info.min and vmax < info.max:
+                    return int_dtype
     if input_dtype == np.float64:
         return np.float32
     return input_dtype
@@ -192,54 +408,430 @@ def set_fill_value(new_dtype: np.dtype) -> int:
     Returns
     -------
     int
-        The calculated fill value based on the bit-width of the data type.
+        The calculated fill value: the maximum of an integer type, otherwise
+        based on the bit-width of the data type.
 
     """
+    if np.issubdtype(new_dtype, np.integer):
+        return int(np.iinfo(new_dtype).max)
     fill_val: int = 2 ** (int(re.findall(r"\d+", str(new_dtype))[0]) - 1) - 1
     return fill_val
 
 
-def set_best_dtype(ds: xr.Dataset) -> xr.Dataset:
+def plan_dtype_encoding(
+    ds: xr.Dataset,
+    pack: bool = False,
+    stats: Optional[dict[str, tuple[float, float]]] = None,
+) -> dict[str, dict]:
+    """Plan the on-disk dtype of every data variable as NetCDF/Zarr encoding.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        The input dataset.
+    pack : bool, optional
+        If True, pack floating-point variables into 16-bit integers with
+        ``scale_factor`` and ``add_offset``. This is lossy. Times and
+        latitudes/longitudes (names containing "latitude"/"longitude", or
+        "lat"/"lon" alone or as a ``_lat``/``_lon`` suffix) are never packed.
+    stats : dict, optional
+        Precomputed (min, max) per variable from `compute_min_max`.
+
+    Returns
+    -------
+    dict of {str: dict}
+        Encoding per variable (``dtype``, and ``_FillValue``, ``scale_factor``,
+        ``add_offset`` where needed), for ``to_netcdf(encoding=...)``. Variables
+        that keep their dtype are omitted.
+
+    """
+    if stats is None:
+        stats = compute_min_max(ds)
+
+    plan = {}
+    for var_name, da in ds.data_vars.items():
+        if var_name not in stats:
+            continue
+        vmin, vmax = stats[var_name]
+        new_dtype = np.dtype(find_best_dtype(var_name, da, vmin, vmax))
+        packable = (
+            pack
+            and np.issubdtype(da.dtype, np.floating)
+            and new_dtype != np.double
+            and "time" not in var_name.lower()
+            and not _is_lat_lon(var_name)
+            and np.isfinite(vmin)
+            and np.isfinite(vmax)
+        )
+        if packable:
+            n_steps = 2 ** (8 * np.dtype(PACKED_DTYPE).itemsize) - 2
+            plan[var_name] = {
+                "dtype": np.dtype(PACKED_DTYPE).name,
+                "scale_factor": (vmax - vmin) / n_steps if vmax > vmin else 1.0,
+                "add_offset": (vmax + vmin) / 2,
+                "_FillValue": PACKED_FILL_VALUE,
+            }
+        elif new_dtype != da.dtype:
+            encoding = {"dtype": new_dtype.name}
+            if np.issubdtype(new_dtype, np.integer):
+                encoding["_FillValue"] = set_fill_value(new_dtype)
+            plan[var_name] = encoding
+    return plan
+
+
+def _is_lat_lon(var_name: str) -> bool:
+    """Whether the variable holds latitudes or longitudes (by its name)."""
+    name = var_name.lower()
+    return (
+        "latitude" in name
+        or "longitude" in name
+        or name in ("lat", "lon")
+        or name.endswith(("_lat", "_lon"))
+    )
+
+
+def set_best_dtype(
+    ds: xr.Dataset, use_encoding: bool = False, pack: bool = False
+) -> xr.Dataset:
     """Adjust the data types of variables in a dataset to optimize memory usage.
 
     Parameters
     ----------
     ds : xarray.Dataset
         The input dataset whose variables' data types will be adjusted.
+    use_encoding : bool, optional
+        If True, leave the data untouched and record the new dtypes in each
+        variable's ``encoding`` instead, so they are applied when the dataset
+        is written. This avoids any in-memory copy.
+    pack : bool, optional
+        If True (with ``use_encoding``), also pack floats into 16-bit integers
+        with ``scale_factor``/``add_offset``. See `plan_dtype_encoding`.
 
     Returns
     -------
     xarray.Dataset
-        The dataset with updated data types for its variables, potentially saving memory.
+        The dataset with updated data types (or encodings) for its variables.
 
     Notes
     -----
-    - The function determines the best data type for each variable using `find_best_dtype`.
+    - Minima and maxima of all variables are computed in a single pass (see
+      `compute_min_max`), which stays lazy for dask-backed datasets.
+    - The best data type for each variable is chosen with `find_best_dtype`.
     - Attributes like `valid_min` and `valid_max` are updated to match the new data type.
     - If the new data type is integer-based, NaN values are replaced with a fill value.
     - Logs the percentage of memory saved after the data type adjustments.
 
     """
     bytes_in: int = ds.nbytes
-    for var_name in list(ds):
-        da: xr.DataArray = ds[var_name]
-        input_dtype: np.dtype = da.dtype.type
-        new_dtype: np.dtype = find_best_dtype(var_name, da)
-        for att in ["valid_min", "valid_max"]:
-            if att in da.attrs.keys():
-                da.attrs[att] = np.array(da.attrs[att]).astype(new_dtype)
-        if new_dtype == input_dtype:
+    stats = compute_min_max(ds)
+    ds = ds.copy(deep=False)
+
+    if use_encoding:
+        plan = plan_dtype_encoding(ds, pack=pack, stats=stats)
+        bytes_out = bytes_in
+        for var_name, encoding in plan.items():
+            # Drop packing left over from the source file
+            for key in ("scale_factor", "add_offset", "_FillValue", "missing_value"):
+                if key not in encoding:
+                    ds[var_name].encoding.pop(key, None)
+            ds[var_name].encoding.update(encoding)
+            da = ds[var_name]
+            bytes_out -= da.nbytes - da.size * np.dtype(encoding["dtype"]).itemsize
+            log_debug(f"{var_name} encoded as {encoding}")
+    else:
+        new_vars = {}
+        for var_name, da in ds.data_vars.items():
+            input_dtype: np.dtype = da.dtype.type
+            vmin, vmax = stats.get(var_name, (None, None))
+            new_dtype: np.dtype = find_best_dtype(var_name, da, vmin, vmax)
+            for att in ["valid_min", "valid_max"]:
+                if att in da.attrs.keys():
+                    da.attrs[att] = np.array(da.attrs[att]).astype(new_dtype)
+            if new_dtype == input_dtype:
+                continue
+            log_debug(f"{var_name} input dtype {input_dtype} change to {new_dtype}")
+            if "int" in str(new_dtype):
+                fill_val: int = set_fill_value(new_dtype)
+                da_new = da.fillna(fill_val).astype(new_dtype)
+                da_new.encoding["_FillValue"] = fill_val
+            else:
+                da_new = da.astype(new_dtype)
+            # The source file's dtype would otherwise be restored on write
+            da_new.encoding.pop("dtype", None)
+            new_vars[var_name] = da_new
+        ds = ds.assign(new_vars)
+        bytes_out = ds.nbytes
+    if bytes_in:
+        log_info(
+            f"Space saved by dtype downgrade: {int(100 * (bytes_in - bytes_out) / bytes_in)} %",
+        )
+    return ds
+
+
+# Headline transport per array: (standardised variable, sign). MOVE reports
+# the southward NADW transport, so it is flipped to match the other arrays.
+AMOC_HEADLINE_TRANSPORTS = {
+    "rapid": ("moc_mar_hc10", 1),
+    "move": ("TRANSPORT_TOTAL", -1),
+    "osnap": ("MOC_ALL", 1),
+    "samba": ("MOC", 1),
+    "fw2015": ("MOC_PROXY", 1),
+    "mocha": ("maxmoc", 1),
+    "41n": ("MOT", 1),
+    "dso": ("DSO", 1),
+}
+
+
+def build_amoc_cube(
+    freq: str = "1MS",
+    arrays: Optional[list[str]] = None,
+    datasets_by_array: Optional[dict[str, list[xr.Dataset]]] = None,
+) -> xr.DataArray:
+    """Align the headline transport of every array onto one shared time index.
+
+    Each array's headline variable (see ``AMOC_HEADLINE_TRANSPORTS``) is
+    averaged into ``freq`` bins and placed on a common index spanning all
+    arrays. When the datasets are loaded here, the result is cached per
+    ``(freq, arrays)`` so repeated calls skip loading and alignment; call
+    `clear_amoc_cube_cache` after the underlying data has been refreshed.
+
+    Parameters
+    ----------
+    freq : str, optional
+        Pandas frequency of the shared time index. Default is month start.
+    arrays : list of str, optional
+        Arrays to include. Defaults to all arrays in ``AMOC_HEADLINE_TRANSPORTS``.
+        Ignored if ``datasets_by_array`` is given.
+    datasets_by_array : dict of {str: list of xr.Dataset}, optional
+        Standardised datasets per array. If not given, the arrays are loaded
+        with `readers.load_datasets` and standardised.
+
+    Returns
+    -------
+    xarray.DataArray
+        NumPy-backed (array, TIME) transports, NaN where an array has no data.
+        The ``coverage`` coordinate is True where an array has data, and the
+        ``variable`` and ``units`` coordinates name each array's headline series.
+
+    """
+    if datasets_by_array is not None:
+        return _align_headline_transports(datasets_by_array, freq)
+    arrays = tuple(arrays) if arrays is not None else tuple(AMOC_HEADLINE_TRANSPORTS)
+    # Copy so callers cannot modify the cached cube
+    return _cached_amoc_cube(freq, arrays).copy(deep=True)
+
+
+def clear_amoc_cube_cache() -> None:
+    """Drop the cubes cached by `build_amoc_cube`, e.g. after a data refresh."""
+    _cached_amoc_cube.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _cached_amoc_cube(freq: str, arrays: tuple[str, ...]) -> xr.DataArray:
+    """Load, standardise and align the given arrays once per (freq, arrays)."""
+    return _align_headline_transports(_load_headline_datasets(arrays), freq)
+
+
+def _load_headline_datasets(arrays: tuple[str, ...]) -> dict[str, list[xr.Dataset]]:
+    """Load and standardise the transport files of the given arrays."""
+    from amocarray import readers, standardise
+
+    return standardise.standardise_all(readers.load_datasets(list(arrays)))
+
+
+def _align_headline_transports(
+    datasets_by_array: dict[str, list[xr.Dataset]], freq: str
+) -> xr.DataArray:
+    """Resample each array's headline series to ``freq`` and stack them."""
+    series = {}
+    for array_name, datasets in datasets_by_array.items():
+        var_name, sign = AMOC_HEADLINE_TRANSPORTS.get(array_name.lower(), (None, 1))
+        da = next((ds[var_name] for ds in datasets if var_name in ds), None)
+        if da is None:
+            log_warning("No headline transport found for array %s", array_name)
             continue
-        log_debug(f"{var_name} input dtype {input_dtype} change to {new_dtype}")
-        da_new: xr.DataArray = da.astype(new_dtype)
-        ds = ds.drop_vars(var_name)
-        if "int" in str(new_dtype):
-            fill_val: int = set_fill_value(new_dtype)
-            da_new[np.isnan(da)] = fill_val
-            da_new.encoding["_FillValue"] = fill_val
-        ds[var_name] = da_new
-    bytes_out: int = ds.nbytes
+        singleton = [d for d in da.dims if d != "TIME" and da.sizes[d] == 1]
+        series[array_name] = sign * da.squeeze(singleton, drop=True)
+
+    if not series:
+        raise ValueError("No headline transports found to build the AMOC cube")
+
+    # One set of bins for all arrays, so that every series shares the time axis
+    times = np.concatenate(
+        [da["TIME"].values.astype("datetime64[ns]") for da in series.values()]
+    )
+    times = times[~np.isnat(times)]
+    time = _bin_labels(times.min(), times.max(), freq)
+    series = {
+        array_name: resample_mean(da, freq, time_dim="TIME", labels=time)
+        for array_name, da in series.items()
+    }
+    values = np.stack([da.values for da in series.values()])
+
     log_info(
-        f"Space saved by dtype downgrade: {int(100 * (bytes_in - bytes_out) / bytes_in)} %",
+        "Built AMOC cube of %d arrays x %d time steps (%s)",
+        len(series),
+        len(time),
+        freq,
     )
-    return ds
+    return xr.DataArray(
+        values,
+        dims=("array", "TIME"),
+        coords={
+            "array": list(series),
+            "TIME": time,
+            "variable": ("array", [da.name for da in series.values()]),
+            "units": ("array", [da.attrs.get("units", "") for da in series.values()]),
+            "coverage": (("array", "TIME"), np.isfinite(values)),
+        },
+        name="AMOC_TRANSPORT",
+        attrs={"freq": freq},
+    )
+
+
+# Offsets whose resampling bins pandas closes and labels on the right
+_END_ANCHORED_OFFSETS = {"ME", "QE", "YE", "BME", "BQE", "BYE", "W"}
+
+
+def resample_mean(
+    data: Union[xr.DataArray, xr.Dataset],
+    freq: str = "1MS",
+    time_dim: Optional[str] = None,
+    labels: Optional[pd.DatetimeIndex] = None,
+) -> Union[xr.DataArray, xr.Dataset]:
+    """NaN-skipping mean of the data over ``freq`` bins of its time axis.
+
+    A fast equivalent of dropping NaT and duplicate times (keeping the first),
+    sorting, and ``resample({time_dim: freq}).mean()``. The time axis is cleaned
+    in a single index pass, shared by all variables of a Dataset, and each
+    variable is reduced with one ``np.add.reduceat`` over its bins.
+
+    Parameters
+    ----------
+    data : xarray.DataArray or xarray.Dataset
+        Data with a time dimension. Dataset variables without it are kept
+        unchanged; non-numeric variables along it are dropped.
+    freq : str, optional
+        Pandas frequency of the bins, e.g. "1D", "1MS", "YS". Bins are labelled
+        by their start, except for end-anchored frequencies ("ME", "QE", "YE",
+        "W", ...) which, as in pandas, are labelled by their last day.
+    time_dim : str, optional
+        Name of the time dimension. Defaults to "TIME" or "time".
+    labels : pandas.DatetimeIndex, optional
+        Bin labels to resample onto, e.g. to put several series on the same
+        time axis. Defaults to the bins from the first to the last time; times
+        outside the given bins are dropped.
+
+    Returns
+    -------
+    xarray.DataArray or xarray.Dataset
+        Data on the bin labels, NaN where a bin has no valid values.
+
+    """
+    if time_dim is None:
+        time_dim = next((d for d in ("TIME", "time") if d in data.dims), None)
+        if time_dim is None:
+            raise ValueError("No time dimension found.")
+
+    order, codes, labels = _time_bins(data[time_dim].values, freq, labels)
+    starts = np.flatnonzero(np.diff(codes, prepend=-1))
+
+    def reduce(da: xr.DataArray) -> xr.DataArray:
+        axis = da.dims.index(time_dim)
+        values = np.moveaxis(np.asarray(da.values, dtype="float64"), axis, 0)[order]
+        means = np.full((labels.size,) + values.shape[1:], np.nan)
+        if starts.size:
+            valid = ~np.isnan(values)
+            counts = np.add.reduceat(valid, starts, axis=0)
+            sums = np.add.reduceat(np.where(valid, values, 0), starts, axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                means[codes[starts]] = sums / counts
+        return xr.DataArray(
+            np.moveaxis(means, 0, axis),
+            dims=da.dims,
+            coords={
+                name: coord
+                for name, coord in da.coords.items()
+                if time_dim not in coord.dims
+            },
+            name=da.name,
+            attrs=da.attrs,
+        ).assign_coords({time_dim: labels})
+
+    if isinstance(data, xr.DataArray):
+        return reduce(data)
+
+    data_vars = {}
+    for var_name, da in data.data_vars.items():
+        if time_dim not in da.dims:
+            data_vars[var_name] = da
+        elif np.issubdtype(da.dtype, np.number):
+            data_vars[var_name] = reduce(da)
+    coords = {
+        name: coord for name, coord in data.coords.items() if time_dim not in coord.dims
+    }
+    return xr.Dataset(data_vars, coords=coords, attrs=data.attrs).assign_coords(
+        {time_dim: labels}
+    )
+
+
+def _time_bins(
+    time: np.ndarray, freq: str, labels: Optional[pd.DatetimeIndex] = None
+) -> tuple[np.ndarray, np.ndarray, pd.DatetimeIndex]:
+    """Sort order of the valid, unique times, their bin codes and the bin labels.
+
+    Returns ``order`` (indices into ``time`` of the sorted times, NaT, later
+    duplicates and times outside ``labels`` removed), ``codes`` (bin of each of
+    them, non-decreasing) and ``labels`` (label of every bin, by default from
+    the first to the last time).
+    """
+    time = np.asarray(time).astype("datetime64[ns]")
+    order = np.flatnonzero(~np.isnat(time))
+    # A stable sort keeps the first of duplicate times in front
+    order = order[np.argsort(time[order], kind="stable")]
+    sorted_time = time[order]
+    first = np.ones(sorted_time.size, dtype=bool)
+    first[1:] = sorted_time[1:] != sorted_time[:-1]
+    order, sorted_time = order[first], sorted_time[first]
+    offset = pd.tseries.frequencies.to_offset(freq)
+    if labels is None:
+        if not sorted_time.size:
+            return order, np.array([], dtype=int), pd.DatetimeIndex([], name=None)
+        labels = _bin_labels(sorted_time[0], sorted_time[-1], offset)
+    if not labels.size:
+        return order[:0], np.array([], dtype=int), labels
+
+    if _is_end_anchored(offset):
+        # Bins end on their label and, as in pandas, include the whole label day
+        edges = labels.insert(0, labels[0] - offset) + pd.Timedelta(days=1)
+    else:
+        edges = labels.append(pd.DatetimeIndex([labels[-1] + offset]))
+    codes = edges.searchsorted(sorted_time, side="right") - 1
+    inside = (codes >= 0) & (codes < labels.size)
+    return order[inside], codes[inside], labels
+
+
+def _is_end_anchored(offset: pd.DateOffset) -> bool:
+    """Whether pandas closes and labels ``offset`` bins on the right."""
+    return offset.rule_code.split("-")[0] in _END_ANCHORED_OFFSETS
+
+
+def _bin_labels(
+    first: np.datetime64, last: np.datetime64, freq: str
+) -> pd.DatetimeIndex:
+    """Labels of the ``freq`` bins covering the times from ``first`` to ``last``."""
+    offset = pd.tseries.frequencies.to_offset(freq)
+    start = pd.Timestamp(first).normalize()
+    if _is_end_anchored(offset):
+        # Month/quarter/year end and weekly bins are labelled by their end
+        return pd.date_range(
+            offset.rollforward(start),
+            offset.rollforward(pd.Timestamp(last).normalize()),
+            freq=offset,
+        )
+    if not isinstance(offset, pd.tseries.offsets.Tick):
+        # Anchored offsets (month/year start, ...) label bins by their start
+        start = offset.rollback(start)
+    labels = pd.date_range(start, last, freq=offset)
+    # Sub-daily bins anchored at midnight may start well before the data
+    return labels[labels.searchsorted(first, side="right") - 1 :]
@@ -1,18 +1,31 @@
-from ftplib import FTP
-from functools import wraps
+import atexit
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+from ftplib import FTP, error_perm, error_reply, error_temp
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 import yaml
 import re
 
 
+import numpy as np
 import pandas as pd
 import requests
 import xarray as xr
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from amocarray import logger
-from amocarray.logger import log_debug
+from amocarray.logger import log_debug, log_info, log_warning
 
 log = logger.log
 from importlib import resources
@@ -82,15 +95,98 @@ def normalize_whitespace(attrs: dict) -> dict:
     return cleaned
 
 
+def resolve_chunks(
+    file_name: str,
+    chunks: Union[dict, str, None],
+    lazy: bool,
+    default_chunks: Dict[str, Union[dict, str]],
+) -> Union[dict, str, None]:
+    """Pick the dask chunking for a file.
+
+    Parameters
+    ----------
+    file_name : str
+        Name of the file being opened.
+    chunks : dict, str or None
+        Chunking requested by the caller. Takes precedence if given.
+    lazy : bool
+        If True and ``chunks`` is None, use the per-product default chunking.
+    default_chunks : dict
+        Mapping of file name to default chunking for a reader's products.
+        Files not listed fall back to ``"auto"``.
+
+    Returns
+    -------
+    dict, str or None
+        Chunking to open the file with, or None to open it without dask.
+
+    """
+    if chunks is not None:
+        return chunks
+    if lazy:
+        return default_chunks.get(file_name, "auto")
+    return None
+
+
+def open_netcdf(
+    file_path: Union[str, Path],
+    chunks: Union[dict, str, None] = None,
+    **kwargs,
+) -> xr.Dataset:
+    """Open a NetCDF file, lazily through dask if ``chunks`` is given.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path to the NetCDF file.
+    chunks : dict, str or None, optional
+        Dask chunk sizes per dimension (or ``"auto"``). Dimensions not present
+        in the file are ignored. If None, the file is opened without dask.
+    **kwargs
+        Passed on to ``xr.open_dataset``.
+
+    Returns
+    -------
+    xr.Dataset
+        The opened dataset.
+
+    Raises
+    ------
+    ImportError
+        If ``chunks`` is given but dask is not installed.
+
+    """
+    if chunks is None:
+        return xr.open_dataset(file_path, **kwargs)
+
+    try:
+        import dask  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Lazy (chunked) opening requires dask: pip install dask"
+        ) from e
+
+    # Let the backend build the dask graph straight from the file's variables
+    return xr.open_dataset(file_path, chunks=chunks, **kwargs)
+
+
 def resolve_file_path(
     file_name: str,
     source: Union[str, Path, None],
     download_url: Optional[str],
     local_data_dir: Path,
     redownload: bool = False,
+    refresh: Optional[str] = None,
 ) -> Path:
     """Resolve the path to a data file, using local source, cache, or downloading if necessary.
 
+    Cached and downloaded files are checked against the SHA-256 hashes in
+    ``amoc_registry.txt`` (when the file is listed there) and stored in the
+    content-addressed blob cache, see :func:`get_cache_dir`. A download that
+    differs from the registry is only accepted when the server's validators
+    show a new version (see :func:`download_file`); its hash is then used to
+    verify the cached copy from then on. Anything else is treated as corrupt.
+
     Parameters
     ----------
     file_name : str
@@ -103,6 +199,10 @@ def resolve_file_path(
         Directory where downloaded files are stored.
     redownload : bool, optional
         If True, force redownload even if cached file exists.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", revalidate a cached file against the remote server
+        (conditional GET, or MDTM/SIZE for FTP) and only download it again if
+        it has changed.
 
     Returns
     -------
@@ -110,6 +210,8 @@ def resolve_file_path(
         Path to the resolved file.
 
     """
+    _check_refresh(refresh)
+
     # Use local source if provided
     if source and not _is_valid_url(source):
         source_path = Path(source)
@@ -121,22 +223,47 @@ def resolve_file_path(
             log.error("Local file not found: %s", candidate_file)
             raise FileNotFoundError(f"Local file not found: {candidate_file}")
 
-    # Use cached file if available and redownload is False
+    expected_hash = load_registry().get(file_name)
     cached_file = local_data_dir / file_name
-    if cached_file.exists() and not redownload:
-        log.info("Using cached file: %s", cached_file)
+
+    # The hash of the last accepted download, which may be a version the server
+    # published after the registry was written
+    accepted_hash = read_sidecar(cached_file).get("sha256") or expected_hash
+
+    # Use the cached file unless the caller asked to download or revalidate it
+    refetch = download_url is not None and (redownload or refresh == "if-modified")
+    if cached_file.exists() and not refetch:
+        if accepted_hash is None or file_sha256(cached_file) == accepted_hash:
+            log.info("Using cached file: %s", cached_file)
+            store_blob(cached_file)
+            return cached_file
+        log_warning(
+            "Cached file does not match registry hash, discarding: %s", cached_file
+        )
+        cached_file.unlink()
+
+    # Reuse an identical file already in the blob cache (e.g. from another data dir)
+    if accepted_hash and not refetch and _restore_blob(accepted_hash, cached_file):
+        log.info("Restored %s from blob cache", cached_file)
         return cached_file
 
     # Download if URL is provided
     if download_url:
         try:
             log.info("Downloading file from %s to %s", download_url, local_data_dir)
-            return download_file(
-                download_url, local_data_dir, redownload=redownload, filename=file_name
+            downloaded = download_file(
+                download_url,
+                local_data_dir,
+                redownload=redownload,
+                filename=file_name,
+                expected_sha256=accepted_hash,
+                refresh=refresh,
             )
         except Exception as e:
             log.error("Failed to download %s: %s", download_url, e)
             raise FileNotFoundError(f"Failed to download {download_url}: {e}")
+        store_blob(downloaded)
+        return Path(downloaded)
 
     # If no options succeeded
     raise FileNotFoundError(
@@ -144,10 +271,236 @@ def resolve_file_path(
     )
 
 
+# Content-addressed download cache
+REGISTRY_FILE = "amoc_registry.txt"
+HASH_CHUNK_SIZE = 1 << 20
+_INDEX_LOCK = threading.Lock()
+
+
+def get_cache_dir() -> Path:
+    """Return the directory holding the content-addressed blob cache.
+
+    Defaults to ``data/.cache`` and can be overridden with the
+    ``AMOCARRAY_CACHE_DIR`` environment variable. Sharing one cache directory
+    between several data directories deduplicates identical files.
+    """
+    cache_dir = os.environ.get("AMOCARRAY_CACHE_DIR")
+    return Path(cache_dir) if cache_dir else get_default_data_dir() / ".cache"
+
+
+@lru_cache(maxsize=1)
+def load_registry() -> Dict[str, str]:
+    """Load the known SHA-256 hashes of remote data files.
+
+    Returns
+    -------
+    dict of {str: str}
+        Mapping of file name to lowercase hex SHA-256 digest.
+
+    """
+    registry: Dict[str, str] = {}
+    text = resources.files("amocarray").joinpath(REGISTRY_FILE).read_text()
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and not line.startswith("#"):
+            registry[parts[0]] = parts[1].lower()
+    return registry
+
+
+def file_sha256(file_path: Union[str, Path]) -> str:
+    """Return the SHA-256 digest of a file, reusing the hash index when possible.
+
+    The digest is cached in ``index.json`` in the cache directory together with
+    the file size and modification time, so unchanged files are not re-hashed.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path to the file.
+
+    Returns
+    -------
+    str
+        Lowercase hex SHA-256 digest.
+
+    """
+    file_path = Path(file_path).resolve()
+    stat = file_path.stat()
+    key = str(file_path)
+
+    with _INDEX_LOCK:
+        entry = _read_hash_index().get(key)
+    if (
+        entry
+        and entry["size"] == stat.st_size
+        and entry["mtime_ns"] == stat.st_mtime_ns
+    ):
+        return entry["sha256"]
+
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    sha256 = digest.hexdigest()
+
+    with _INDEX_LOCK:
+        index = _read_hash_index()
+        index[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+        }
+        _write_hash_index(index)
+    log_debug("Hashed %s: %s", file_path, sha256)
+    return sha256
+
+
+def store_blob(file_path: Union[str, Path]) -> Path:
+    """Store a file in the blob cache under its hash and deduplicate it.
+
+    If an identical blob already exists, the file is replaced by a hard link to
+    it so that copies shared between data directories use the disk only once.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path to the file.
+
+    Returns
+    -------
+    Path
+        Path to the blob.
+
+    """
+    file_path = Path(file_path)
+    sha256 = file_sha256(file_path)
+    blob_path = _blob_path(sha256)
+
+    if not blob_path.exists():
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(file_path, blob_path)
+    elif not os.path.samefile(blob_path, file_path):
+        tmp_path = file_path.with_name(file_path.name + ".link")
+        try:
+            os.link(blob_path, tmp_path)
+        except OSError:
+            # Different file systems: keep the separate copy
+            return blob_path
+        os.replace(tmp_path, file_path)
+        log_debug("Deduplicated %s against blob %s", file_path, sha256)
+    return blob_path
+
+
+def _restore_blob(sha256: str, dest: Path) -> bool:
+    """Link or copy a cached blob to ``dest``. Returns False if it is not cached."""
+    blob_path = _blob_path(sha256)
+    if not blob_path.exists():
+        return False
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    _link_or_copy(blob_path, dest)
+    if file_sha256(dest) != sha256:
+        log_warning("Blob %s is corrupt, discarding", blob_path)
+        dest.unlink()
+        blob_path.unlink()
+        return False
+    return True
+
+
+def _blob_path(sha256: str) -> Path:
+    return get_cache_dir() / "blobs" / sha256[:2] / sha256
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+def _read_hash_index() -> dict:
+    index_file = get_cache_dir() / "index.json"
+    if not index_file.exists():
+        return {}
+    try:
+        return json.loads(index_file.read_text())
+    except ValueError:
+        log_warning("Ignoring unreadable hash index: %s", index_file)
+        return {}
+
+
+def _write_hash_index(index: dict) -> None:
+    index_file = get_cache_dir() / "index.json"
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = index_file.with_name(f"index.{os.getpid()}.tmp")
+    tmp_file.write_text(json.dumps(index))
+    os.replace(tmp_file, index_file)
+
+
+def parse_cached(
+    file_path: Union[str, Path],
+    parser: Callable[[Path], xr.Dataset],
+    version: str,
+) -> xr.Dataset:
+    """Parse a source file, reusing a stored copy of the parsed result.
+
+    The dataset returned by ``parser`` is written as NetCDF to ``parsed/`` in
+    the cache directory, keyed by the SHA-256 of the source file and the
+    reader ``version``. Later calls on the same file open the stored copy
+    lazily instead of parsing again. Bump the reader version whenever the
+    parsing changes so that stale results are not reused.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path to the source (ASCII or MATLAB) file.
+    parser : callable
+        Function that parses ``file_path`` into an xarray Dataset.
+    version : str
+        Reader name and parser version, e.g. ``"samba-1"``.
+
+    Returns
+    -------
+    xr.Dataset
+        The parsed dataset, without reader metadata attached.
+
+    """
+    file_path = Path(file_path)
+    cache_file = get_cache_dir() / "parsed" / f"{version}-{file_sha256(file_path)}.nc"
+
+    if cache_file.exists():
+        try:
+            ds = xr.open_dataset(cache_file)
+        except Exception as e:
+            log_warning("Discarding unreadable parsed cache %s: %s", cache_file, e)
+            cache_file.unlink(missing_ok=True)
+        else:
+            log_debug("Loaded parsed %s from cache: %s", file_path.name, cache_file)
+            return ds
+
+    ds = parser(file_path)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        ds.to_netcdf(tmp_file)
+        os.replace(tmp_file, cache_file)
+        log_debug("Stored parsed %s in cache: %s", file_path.name, cache_file)
+    except Exception as e:
+        log_warning("Could not cache parsed %s: %s", file_path.name, e)
+    return ds
+
+
+# Compiled array metadata
+METADATA_CACHE_FILE = "metadata.json"
+_BLANK_ATTR_VALUES = ("", "n/a")
+
+
 def load_array_metadata(array_name: str) -> dict:
     """
     Load metadata YAML for a given mooring array.
 
+    The YAML is parsed once per modification and cached (see
+    ``get_array_metadata``); a fresh, mutable copy is returned on every call.
+
     Parameters
     ----------
     array_name : str
@@ -158,19 +511,170 @@ def load_array_metadata(array_name: str) -> dict:
     dict
         Dictionary containing the parsed YAML metadata.
     """
+    return _thaw(get_array_metadata(array_name)["raw"])
+
+
+def get_array_metadata(array_name: str) -> MappingProxyType:
+    """Return the compiled, read-only metadata of a mooring array.
+
+    The ``<array>_array.yml`` file is parsed lazily and kept in an LRU cache
+    keyed by its modification time, so edits to the YAML are picked up. If a
+    JSON cache written by ``write_metadata_cache`` is up to date, it is used
+    instead of parsing the YAML.
+
+    Parameters
+    ----------
+    array_name : str
+        Name of the mooring array (e.g., 'samba').
+
+    Returns
+    -------
+    MappingProxyType
+        Frozen mapping with keys:
+
+        - ``raw``: the YAML content.
+        - ``files``: per file name, the pre-resolved ``variable_mapping``,
+          ``variable_attrs`` (non-blank attributes per variable),
+          ``blank_attrs`` (attribute names to drop per variable) and
+          ``global_attrs`` (array and file-level global attributes).
+
+    Raises
+    ------
+    FileNotFoundError
+        If there is no metadata file for the array.
+    RuntimeError
+        If the metadata file cannot be parsed.
+
+    """
+    yaml_file = _metadata_file(array_name)
     try:
-        with (
-            resources.files("amocarray.metadata")
-            .joinpath(f"{array_name.lower()}_array.yml")
-            .open("r") as f
-        ):
-            return yaml.safe_load(f)
+        mtime_ns = yaml_file.stat().st_mtime_ns
     except FileNotFoundError as e:
         raise FileNotFoundError(
             f"No metadata file found for array: {array_name}"
         ) from e
-    except Exception as e:
-        raise RuntimeError(f"Error loading metadata for array {array_name}: {e}") from e
+    return _compile_array_metadata(array_name.lower(), mtime_ns)
+
+
+def write_metadata_cache(path: Union[str, Path, None] = None) -> Path:
+    """Write the metadata of all arrays to a JSON cache for faster startup.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        Output file. Defaults to ``metadata.json`` in the cache directory.
+
+    Returns
+    -------
+    Path
+        Path to the written cache file.
+
+    """
+    path = Path(path) if path else get_cache_dir() / METADATA_CACHE_FILE
+    entries = {}
+    for yaml_file in sorted(_metadata_dir().glob("*_array.yml")):
+        array_name = yaml_file.name[: -len("_array.yml")]
+        entries[array_name] = {
+            "mtime_ns": yaml_file.stat().st_mtime_ns,
+            "metadata": load_array_metadata(array_name),
+        }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(entries))
+    os.replace(tmp_path, path)
+    return path
+
+
+def clear_metadata_cache() -> None:
+    """Drop the compiled array metadata held in memory by `get_array_metadata`.
+
+    The next call re-reads the JSON cache or YAML file, e.g. after an edit
+    that kept the file's modification time.
+    """
+    _compile_array_metadata.cache_clear()
+
+
+@lru_cache(maxsize=32)
+def _compile_array_metadata(array_name: str, mtime_ns: int) -> MappingProxyType:
+    raw = _read_metadata_cache(array_name, mtime_ns)
+    if raw is None:
+        try:
+            with _metadata_file(array_name).open("r") as f:
+                raw = yaml.safe_load(f)
+        except Exception as e:
+            raise RuntimeError(
+                f"Error loading metadata for array {array_name}: {e}"
+            ) from e
+        log_debug("Parsed metadata YAML for %s", array_name)
+
+    array_meta = raw.get("metadata") or {}
+    files = {}
+    for file_name, file_meta in (raw.get("files") or {}).items():
+        variables = file_meta.get("variables") or {}
+        global_attrs = dict(array_meta)
+        global_attrs["summary"] = array_meta.get("description", "")
+        global_attrs["weblink"] = array_meta.get("weblink", "")
+        global_attrs.update(
+            {
+                k: file_meta[k]
+                for k in ("acknowledgement", "data_product")
+                if k in file_meta
+            }
+        )
+        files[file_name] = {
+            "variable_mapping": file_meta.get("variable_mapping") or {},
+            "variable_attrs": {
+                var: {k: v for k, v in attrs.items() if v not in _BLANK_ATTR_VALUES}
+                for var, attrs in variables.items()
+            },
+            "blank_attrs": {
+                var: [k for k, v in attrs.items() if v in _BLANK_ATTR_VALUES]
+                for var, attrs in variables.items()
+            },
+            "global_attrs": global_attrs,
+        }
+    return _freeze({"raw": raw, "files": files})
+
+
+def _metadata_dir() -> Path:
+    return Path(str(resources.files("amocarray").joinpath("metadata")))
+
+
+def _metadata_file(array_name: str) -> Path:
+    return _metadata_dir() / f"{array_name.lower()}_array.yml"
+
+
+def _read_metadata_cache(array_name: str, mtime_ns: int) -> Optional[dict]:
+    """Return the cached metadata of an array if the JSON cache is up to date."""
+    cache_file = get_cache_dir() / METADATA_CACHE_FILE
+    if not cache_file.exists():
+        return None
+    try:
+        entry = json.loads(cache_file.read_text()).get(array_name)
+    except ValueError:
+        log_warning("Ignoring unreadable metadata cache: %s", cache_file)
+        return None
+    if entry and entry.get("mtime_ns") == mtime_ns:
+        return entry["metadata"]
+    return None
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of ``_freeze``: return mutable dicts and lists."""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
 
 
 def safe_update_attrs(
@@ -344,14 +848,123 @@ def _is_valid_file(path: str) -> bool:
     return Path(path).is_file() and path.endswith(".nc")
 
 
+# Download settings
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+DOWNLOAD_MAX_RETRIES = 5
+DOWNLOAD_TIMEOUT = 60  # seconds, per connect/read
+
+# Shared HTTP session settings
+HTTP_POOL_HOSTS = 10  # number of hosts with a kept-alive connection pool
+HTTP_POOL_MAXSIZE = 4  # maximum concurrent connections per host
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5  # sleeps 0.5 s, 1 s, 2 s, ... between retries
+HTTP_RETRY_STATUS = (429, 500, 502, 503, 504)
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def configure_session(
+    pool_hosts: int = HTTP_POOL_HOSTS,
+    pool_maxsize: int = HTTP_POOL_MAXSIZE,
+    retries: int = HTTP_RETRIES,
+    backoff_factor: float = HTTP_BACKOFF_FACTOR,
+) -> requests.Session:
+    """Create the shared HTTP(S) session used for all downloads.
+
+    The session keeps connections alive between requests, so the files of one
+    array (e.g. the five RAPID files) reuse a single TCP/TLS connection. It
+    replaces (and closes) any previously configured session.
+
+    Parameters
+    ----------
+    pool_hosts : int, optional
+        Number of hosts for which a connection pool is kept.
+    pool_maxsize : int, optional
+        Maximum number of concurrent connections per host. Further requests
+        to the same host wait for a free connection.
+    retries : int, optional
+        Number of retries for failed connections and retryable status codes
+        (429 and 5xx), honouring ``Retry-After``.
+    backoff_factor : float, optional
+        Exponential backoff factor between retries, in seconds.
+
+    Returns
+    -------
+    requests.Session
+        The new shared session.
+
+    """
+    global _SESSION
+
+    session = _build_session(pool_hosts, pool_maxsize, retries, backoff_factor)
+    with _SESSION_LOCK:
+        old_session, _SESSION = _SESSION, session
+    if old_session is not None:
+        old_session.close()
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP(S) session, creating it on first use."""
+    global _SESSION
+
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _build_session(
+                HTTP_POOL_HOSTS, HTTP_POOL_MAXSIZE, HTTP_RETRIES, HTTP_BACKOFF_FACTOR
+            )
+        return _SESSION
+
+
+def _build_session(
+    pool_hosts: int,
+    pool_maxsize: int,
+    retries: int,
+    backoff_factor: float,
+) -> requests.Session:
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=HTTP_RETRY_STATUS,
+        allowed_methods=("GET", "HEAD"),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_hosts,
+        pool_maxsize=pool_maxsize,
+        pool_block=True,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def download_file(
     url: str,
     dest_folder: str,
     redownload: bool = False,
     filename: str = None,
+    expected_sha256: Optional[str] = None,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    max_retries: int = DOWNLOAD_MAX_RETRIES,
+    refresh: Optional[str] = None,
 ) -> str:
     """Download a file from HTTP(S) or FTP to the specified destination folder.
 
+    Data is written to ``<filename>.part`` and only renamed to the final name
+    once the transfer is complete, so an interrupted download never looks like
+    a valid cached file. Interrupted transfers are resumed with a ``Range``
+    request (HTTP) or ``REST`` (FTP), both within this call (up to
+    ``max_retries`` times) and on a later call that finds the ``.part`` file.
+    FTP downloads reuse pooled logged-in connections, see :func:`ftp_connection`.
+
+    The ETag, Last-Modified and Content-Length of the remote file (MDTM and
+    SIZE for FTP) are stored in a ``<filename>.meta.json`` sidecar, which is
+    used by ``refresh="if-modified"`` to revalidate an existing file.
+
     Parameters
     ----------
     url : str
@@ -362,6 +975,21 @@ def download_file(
         If True, force re-download of the file even if it exists.
     filename : str, optional
         Optional filename to save the file as. If not given, uses the name from the URL.
+    expected_sha256 : str, optional
+        If given, the downloaded file is checked against this SHA-256 digest and
+        removed if it does not match, unless the server's validators (ETag,
+        Last-Modified, Content-Length, or MDTM/SIZE) differ from those of the
+        previous download, i.e. the server has published a new version. The
+        digest of the accepted file is stored in the sidecar.
+    chunk_size : int, optional
+        Number of bytes read per chunk (the ``retrbinary`` blocksize for FTP).
+        Defaults to ``DOWNLOAD_CHUNK_SIZE`` (1 MiB).
+    max_retries : int, optional
+        Number of times an interrupted transfer is resumed before giving up.
+    refresh : {None, "if-modified"}, optional
+        If "if-modified", an existing file is only replaced when the remote
+        file has changed: a conditional GET for HTTP(S), or a MDTM/SIZE
+        comparison for FTP.
 
     Returns
     -------
@@ -371,40 +999,425 @@ def download_file(
     Raises
     ------
     ValueError
-        If the URL scheme is unsupported.
+        If the URL scheme or refresh mode is unsupported, or the downloaded file
+        does not match ``expected_sha256`` although the remote file is unchanged.
 
     """
+    _check_refresh(refresh)
     dest_folder_path = Path(dest_folder)
     dest_folder_path.mkdir(parents=True, exist_ok=True)
 
     local_filename = dest_folder_path / (filename or Path(url).name)
-    if local_filename.exists() and not redownload:
+    conditional = refresh == "if-modified" and local_filename.exists()
+    if local_filename.exists() and not redownload and not conditional:
         # File exists and redownload not requested
         return str(local_filename)
 
+    # Validators of the last completed download, sent with conditional requests
+    previous_meta = read_sidecar(local_filename)
+    if previous_meta.get("url") != url:
+        previous_meta = {}
+    cached_meta = previous_meta if conditional else {}
+
+    part_filename = local_filename.with_name(local_filename.name + ".part")
     parsed_url = urlparse(url)
 
     if parsed_url.scheme in ("http", "https"):
         # HTTP(S) download
-        with requests.get(url, stream=True) as response:
-            response.raise_for_status()
-            with open(local_filename, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        remote_meta = _download_http(
+            url, part_filename, chunk_size, max_retries, cached_meta
+        )
 
     elif parsed_url.scheme == "ftp":
-        # FTP download
-        with FTP(parsed_url.netloc) as ftp:
-            ftp.login()  # anonymous login
-            with open(local_filename, "wb") as f:
-                ftp.retrbinary(f"RETR {parsed_url.path}", f.write)
+        # FTP download over a pooled, logged-in connection
+        remote_meta = _download_ftp(
+            parsed_url.netloc,
+            parsed_url.path,
+            part_filename,
+            chunk_size,
+            max_retries,
+            cached_meta,
+        )
 
     else:
         raise ValueError(f"Unsupported URL scheme in {url}")
 
+    if remote_meta is None:
+        log.info("Remote file not modified, keeping cached file: %s", local_filename)
+        return str(local_filename)
+
+    meta = {"url": url, **remote_meta}
+    if expected_sha256:
+        digest = file_sha256(part_filename)
+        if digest != expected_sha256:
+            if not _remote_changed(previous_meta, remote_meta):
+                part_filename.unlink()
+                raise ValueError(
+                    f"Downloaded file {local_filename} does not match registry hash"
+                )
+            log_warning(
+                "%s does not match its expected hash, but the server reports a "
+                "new version; using the new version",
+                local_filename.name,
+            )
+        # Later calls verify the cached copy against the accepted version
+        meta["sha256"] = digest
+
+    os.replace(part_filename, local_filename)
+    _sidecar_path(part_filename).unlink(missing_ok=True)
+    write_sidecar(local_filename, meta)
     return str(local_filename)
 
 
+def _download_http(
+    url: str,
+    part_filename: Path,
+    chunk_size: int,
+    max_retries: int,
+    cached_meta: Optional[dict] = None,
+) -> Optional[dict]:
+    """Stream a URL into ``part_filename``, resuming with Range requests.
+
+    If ``cached_meta`` holds validators of a cached copy, the first request is
+    conditional. Returns None if the server answers 304 Not Modified, otherwise
+    the ETag, Last-Modified and Content-Length of the downloaded file.
+
+    The validators of the version being fetched are stored next to the partial
+    file and sent as ``If-Range`` when resuming, so that a partial from an
+    older version is never completed with the bytes of a newer one: the server
+    then answers with the full file and the transfer starts over.
+    """
+    conditional_headers = {}
+    if cached_meta and cached_meta.get("etag"):
+        conditional_headers["If-None-Match"] = cached_meta["etag"]
+    if cached_meta and cached_meta.get("last_modified"):
+        conditional_headers["If-Modified-Since"] = cached_meta["last_modified"]
+    part_meta = read_sidecar(part_filename) if part_filename.exists() else {}
+    if_range = part_meta.get("etag") or part_meta.get("last_modified")
+    if part_filename.exists() and (conditional_headers or not if_range):
+        # A leftover partial transfer may belong to an older version
+        log_warning("Discarding unverifiable partial download: %s", part_filename)
+        part_filename.unlink()
+
+    for attempt in range(max_retries + 1):
+        offset = part_filename.stat().st_size if part_filename.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else dict(conditional_headers)
+        if offset and if_range:
+            headers["If-Range"] = if_range
+        responded = False
+        try:
+            with get_session().get(
+                url, stream=True, headers=headers, timeout=DOWNLOAD_TIMEOUT
+            ) as response:
+                responded = True
+                if response.status_code == 304:
+                    return None
+                if offset and response.status_code == 416:
+                    # Range not satisfiable: either already complete or stale
+                    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+                    if total == str(offset):
+                        return _http_meta(response.headers, total)
+                    log_warning("Discarding stale partial download: %s", part_filename)
+                    part_filename.unlink()
+                    continue
+                response.raise_for_status()
+
+                # Servers that ignore Range, or whose file no longer matches
+                # If-Range, send the whole file again
+                resumed = offset and response.status_code == 206
+                if offset and not resumed:
+                    log_warning("Server sent the whole file, restarting %s", url)
+                if not resumed:
+                    # Record which version the partial file belongs to
+                    part_meta = _http_meta(response.headers, None)
+                    if_range = part_meta["etag"] or part_meta["last_modified"]
+                    write_sidecar(part_filename, part_meta)
+                expected = response.headers.get("Content-Length")
+                written = 0
+                with open(part_filename, "ab" if resumed else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                        written += len(chunk)
+                if expected is not None and written < int(expected):
+                    raise requests.ConnectionError(
+                        f"Transfer ended after {written} of {expected} bytes"
+                    )
+                total = response.headers.get("Content-Range", "").rpartition("/")[2]
+                return _http_meta(response.headers, total or expected)
+        except (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ) as e:
+            # Only resume transfers that were under way; connection failures
+            # are not retried here
+            if not responded or attempt == max_retries:
+                raise
+            offset = part_filename.stat().st_size if part_filename.exists() else 0
+            log_warning(
+                "Download of %s interrupted (%s); resuming from byte %d",
+                url,
+                e,
+                offset,
+            )
+            time.sleep(min(2**attempt, 30))
+
+
+def _http_meta(headers: dict, content_length: Optional[str]) -> dict:
+    """Collect the cache validators of an HTTP response."""
+    return {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "content_length": int(content_length) if content_length else None,
+    }
+
+
+def _download_ftp(
+    host: str,
+    path: str,
+    part_filename: Path,
+    chunk_size: int,
+    max_retries: int,
+    cached_meta: Optional[dict] = None,
+) -> Optional[dict]:
+    """Retrieve an FTP file into ``part_filename``, resuming with REST.
+
+    Returns None if MDTM/SIZE match ``cached_meta``, otherwise the MDTM and
+    SIZE of the downloaded file.
+
+    The MDTM and SIZE of the version being fetched are stored next to the
+    partial file; a partial is only resumed if both are known and unchanged.
+    """
+    if cached_meta and part_filename.exists():
+        # A leftover partial transfer may belong to an older version
+        part_filename.unlink()
+    part_meta = read_sidecar(part_filename) if part_filename.exists() else {}
+
+    for attempt in range(max_retries + 1):
+        offset = part_filename.stat().st_size if part_filename.exists() else 0
+        try:
+            with ftp_connection(host) as ftp:
+                remote_meta = _ftp_stat(ftp, path)
+                if cached_meta and _same_remote(
+                    cached_meta, remote_meta, ("mdtm", "size")
+                ):
+                    return None
+                if offset and not _same_remote(
+                    part_meta, remote_meta, ("mdtm", "size")
+                ):
+                    log_warning(
+                        "Discarding partial download of another version: %s",
+                        part_filename,
+                    )
+                    offset = 0
+                if offset and offset == remote_meta["size"]:
+                    return remote_meta
+                if offset and offset > remote_meta["size"]:
+                    log_warning("Discarding stale partial download: %s", part_filename)
+                    offset = 0
+                if not offset:
+                    # Record which version the partial file belongs to
+                    part_meta = remote_meta
+                    write_sidecar(part_filename, part_meta)
+                with open(part_filename, "ab" if offset else "wb") as f:
+                    try:
+                        ftp.retrbinary(
+                            f"RETR {path}",
+                            f.write,
+                            blocksize=chunk_size,
+                            rest=offset or None,
+                        )
+                    except (error_perm, error_reply) as e:
+                        # A refused REST is a 5xx reply (error_perm): start over
+                        if not offset:
+                            raise
+                        log_warning(
+                            "FTP server refused REST (%s), restarting %s", e, path
+                        )
+                        f.seek(0)
+                        f.truncate()
+                        ftp.retrbinary(f"RETR {path}", f.write, blocksize=chunk_size)
+                return remote_meta
+        except (OSError, EOFError, error_temp) as e:
+            progressed = (
+                part_filename.exists() and part_filename.stat().st_size > offset
+            )
+            if not progressed or attempt == max_retries:
+                raise
+            log_warning(
+                "FTP download of %s interrupted (%s); resuming from byte %d",
+                path,
+                e,
+                part_filename.stat().st_size,
+            )
+
+
+def _ftp_stat(ftp: FTP, path: str) -> dict:
+    """Return the modification time (MDTM) and size (SIZE) of a remote FTP file."""
+    meta = {"mdtm": None, "size": None}
+    try:
+        meta["mdtm"] = ftp.voidcmd(f"MDTM {path}").split()[-1]
+        ftp.voidcmd("TYPE I")
+        meta["size"] = ftp.size(path)
+    except Exception as e:
+        log_debug("FTP server did not report MDTM/SIZE for %s: %s", path, e)
+    return meta
+
+
+# FTP connection reuse
+FTP_TIMEOUT = 60  # seconds
+FTP_MAX_IDLE = 4  # idle logged-in connections kept per host
+
+_FTP_POOL: Dict[str, List[FTP]] = {}
+_FTP_POOL_LOCK = threading.Lock()
+
+
+@contextmanager
+def ftp_connection(host: str) -> Iterator[FTP]:
+    """Borrow a logged-in anonymous FTP connection to ``host``.
+
+    Connections are returned to a per-host pool on exit and reused by later
+    downloads, which saves the connect and login handshake for every file.
+    A connection that raised an error is closed instead of being pooled.
+
+    Parameters
+    ----------
+    host : str
+        FTP host name.
+
+    Yields
+    ------
+    ftplib.FTP
+        A logged-in connection.
+
+    """
+    ftp = _acquire_ftp(host)
+    try:
+        yield ftp
+    except BaseException:
+        _close_ftp(ftp)
+        raise
+    with _FTP_POOL_LOCK:
+        idle = _FTP_POOL.setdefault(host, [])
+        if len(idle) < FTP_MAX_IDLE:
+            idle.append(ftp)
+            return
+    _close_ftp(ftp)
+
+
+def close_ftp_connections() -> None:
+    """Close all pooled FTP connections."""
+    with _FTP_POOL_LOCK:
+        connections = [ftp for idle in _FTP_POOL.values() for ftp in idle]
+        _FTP_POOL.clear()
+    for ftp in connections:
+        _close_ftp(ftp)
+
+
+def _acquire_ftp(host: str) -> FTP:
+    while True:
+        with _FTP_POOL_LOCK:
+            idle = _FTP_POOL.get(host)
+            ftp = idle.pop() if idle else None
+        if ftp is None:
+            break
+        try:
+            ftp.voidcmd("NOOP")
+        except (OSError, EOFError, error_reply, error_temp, error_perm):
+            _close_ftp(ftp)
+        else:
+            log_debug("Reusing FTP connection to %s", host)
+            return ftp
+
+    log_debug("Opening FTP connection to %s", host)
+    ftp = FTP(host, timeout=FTP_TIMEOUT)
+    ftp.login()  # anonymous login
+    return ftp
+
+
+def _close_ftp(ftp: FTP) -> None:
+    try:
+        ftp.quit()
+    except Exception:
+        ftp.close()
+
+
+atexit.register(close_ftp_connections)
+
+
+def _remote_changed(previous_meta: dict, remote_meta: dict) -> bool:
+    """True if a validator known for both downloads differs between them."""
+    keys = [
+        key
+        for key in ("etag", "last_modified", "content_length", "mdtm", "size")
+        if previous_meta.get(key) is not None and remote_meta.get(key) is not None
+    ]
+    return any(previous_meta[key] != remote_meta[key] for key in keys)
+
+
+def _same_remote(cached_meta: dict, remote_meta: dict, keys: Tuple[str, ...]) -> bool:
+    """True if all validators are known and unchanged."""
+    return all(
+        remote_meta.get(key) is not None and cached_meta.get(key) == remote_meta[key]
+        for key in keys
+    )
+
+
+# Freshness control for cached files
+REFRESH_MODES = (None, "if-modified")
+
+
+def _check_refresh(refresh: Optional[str]) -> None:
+    if refresh not in REFRESH_MODES:
+        raise ValueError(
+            f"Unknown refresh mode: {refresh!r}. Valid options are: {REFRESH_MODES}"
+        )
+
+
+def _sidecar_path(file_path: Union[str, Path]) -> Path:
+    file_path = Path(file_path)
+    return file_path.with_name(file_path.name + ".meta.json")
+
+
+def read_sidecar(file_path: Union[str, Path]) -> dict:
+    """Read the remote metadata stored next to a cached file.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path to the cached data file.
+
+    Returns
+    -------
+    dict
+        Stored metadata (url, etag, last_modified, content_length, or mdtm and
+        size for FTP), or an empty dict if there is none.
+
+    """
+    sidecar = _sidecar_path(file_path)
+    if not sidecar.exists():
+        return {}
+    try:
+        return json.loads(sidecar.read_text())
+    except ValueError:
+        log_warning("Ignoring unreadable sidecar: %s", sidecar)
+        return {}
+
+
+def write_sidecar(file_path: Union[str, Path], meta: dict) -> None:
+    """Store remote metadata next to a cached file.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path to the cached data file.
+    meta : dict
+        Metadata to store.
+
+    """
+    _sidecar_path(file_path).write_text(json.dumps(meta, indent=2))
+
+
 def parse_ascii_header(
     file_path: str,
     comment_char: str = "%",
@@ -467,3 +1480,120 @@ def read_ascii_file(file_path: str, comment_char: str = "#") -> pd.DataFrame:
 
     """
     return pd.read_csv(file_path, sep=r"\s+", comment=comment_char, on_bad_lines="skip")
+
+
+def read_ascii_with_header(
+    file_path: Union[str, Path],
+    comment_char: str = "%",
+    delimiters: str = "",
+) -> pd.DataFrame:
+    """Read an ASCII file with a commented header in a single pass.
+
+    Column names are taken from header lines like
+    ``'<comment_char> Column 1: <column_name>'``, and the remaining bytes are
+    parsed with the pandas C engine as whitespace-separated float columns.
+    Unlike ``parse_ascii_header`` followed by ``read_ascii_file``, the file is
+    read once and the first data row is not mistaken for a header.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path to the ASCII file.
+    comment_char : str, optional
+        Character used to identify header lines. Defaults to '%'.
+    delimiters : str, optional
+        Extra characters separating fields (e.g. ',' for trailing commas),
+        treated as whitespace.
+
+    Returns
+    -------
+    pd.DataFrame
+        The data as float64 columns, named from the header when available.
+
+    Raises
+    ------
+    ValueError
+        If the number of header columns does not match the data.
+
+    """
+    start = time.perf_counter()
+    marker = comment_char.encode()
+    column_names: List[str] = []
+
+    with open(file_path, "rb") as f:
+        data_offset = 0
+        for line in f:
+            stripped = line.strip()
+            if stripped and not stripped.startswith(marker):
+                break
+            data_offset += len(line)
+            text = stripped.decode(errors="replace")
+            if "Column" in text and ":" in text:
+                column_names.append(text.split(":", 1)[1].strip())
+        f.seek(data_offset)
+        data = f.read()
+
+    if delimiters:
+        table = bytes.maketrans(delimiters.encode(), b" " * len(delimiters))
+        data = data.translate(table)
+
+    df = pd.read_csv(
+        io.BytesIO(data),
+        sep=r"\s+",
+        engine="c",
+        header=None,
+        comment=comment_char,
+        dtype=float,
+    )
+    if column_names:
+        if len(column_names) != df.shape[1]:
+            raise ValueError(
+                f"{file_path}: header lists {len(column_names)} columns, "
+                f"data has {df.shape[1]}"
+            )
+        df.columns = column_names
+
+    elapsed = time.perf_counter() - start
+    size_mb = (data_offset + len(data)) / 1e6
+    log_info(
+        "Parsed %s: %d rows, %.2f MB in %.3f s (%.1f MB/s)",
+        Path(file_path).name,
+        len(df),
+        size_mb,
+        elapsed,
+        size_mb / elapsed if elapsed > 0 else float("inf"),
+    )
+    return df
+
+
+def decimal_year_to_datetime64(decimal_year: np.ndarray) -> np.ndarray:
+    """Convert decimal years (e.g. 2002.0417) to datetime64[ns].
+
+    The fractional part is scaled by the length of the given year, so leap
+    years are handled. NaN values become NaT.
+
+    Parameters
+    ----------
+    decimal_year : array-like of float
+        Times in decimal years.
+
+    Returns
+    -------
+    np.ndarray
+        Array of datetime64[ns].
+
+    """
+    decimal_year = np.asarray(decimal_year, dtype=float)
+    valid = np.isfinite(decimal_year)
+    years = np.floor(np.where(valid, decimal_year, 1970)).astype("int64")
+
+    # Work in microseconds, the resolution of the decimal years in practice
+    start = (years - 1970).astype("datetime64[Y]").astype("datetime64[us]")
+    end = (years - 1969).astype("datetime64[Y]").astype("datetime64[us]")
+    year_length = (end - start).astype("int64")
+
+    offset = np.round((decimal_year - years) * year_length)
+    offset = np.where(valid, offset, 0).astype("int64").astype("timedelta64[us]")
+    times = (start + offset).astype("datetime64[ns]")
+    times[~valid] = np.datetime64("NaT")
+    return times
@@ -1,17 +1,60 @@
+import json
 from numbers import Number
-from typing import Union
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional, Union
 
 import numpy as np
 import xarray as xr
 
-from amocarray import logger
+from amocarray import logger, readers, standardise, tools
+from amocarray.logger import log_debug, log_error, log_info, log_warning
+
+if TYPE_CHECKING:
+    import pyarrow
 
 log = logger.log  # Use the global logger
 
+# Attribute types netCDF can store; anything else is written as a string
+VALID_ATTR_TYPES = (str, Number, np.ndarray, np.number, list, tuple)
+
+# Source-file encoding worth keeping; the rest (chunks, filters) is re-planned
+_KEPT_ENCODING = (
+    "dtype",
+    "_FillValue",
+    "scale_factor",
+    "add_offset",
+    "units",
+    "calendar",
+)
+
+# Attributes xarray derives from the encoding when writing a variable
+_ENCODING_ATTRS = ("_FillValue", "missing_value", "scale_factor", "add_offset", "dtype")
+_TIME_ENCODING_ATTRS = ("units", "calendar")
+
+# Target uncompressed size of one chunk
+CHUNK_TARGET_BYTES = 1024**2
+
+# File in the output directory of `update_array` recording the last stored TIME
+HIGH_WATER_MARK_FILE = "high_water_marks.json"
 
-def save_dataset(ds: xr.Dataset, output_file: str = "../test.nc") -> bool:
-    """Attempts to save the dataset to a NetCDF file. If a TypeError occurs due to invalid attribute values,
-    it converts the invalid attributes to strings and retries the save operation.
+
+def save_dataset(
+    ds: xr.Dataset,
+    output_file: str = "../test.nc",
+    format: str = "NETCDF4_CLASSIC",
+    compression: Optional[str] = "zlib",
+    complevel: int = 4,
+    shuffle: bool = True,
+    time_chunk: Optional[int] = None,
+    optimise_dtypes: bool = False,
+    pack: bool = False,
+) -> bool:
+    """Save the dataset to a compressed, chunked NetCDF4 file.
+
+    Attributes netCDF cannot store are converted to strings beforehand and the
+    per-variable encoding is planned with `plan_encoding`. The input dataset is
+    not modified.
 
     Parameters
     ----------
@@ -19,6 +62,24 @@ def save_dataset(ds: xr.Dataset, output_file: str = "../test.nc") -> bool:
         The dataset to be saved.
     output_file : str, optional
         The path to the output NetCDF file. Defaults to '../test.nc'.
+    format : {"NETCDF4_CLASSIC", "NETCDF4"}, optional
+        NetCDF file format.
+    compression : {"zlib", "zstd", None}, optional
+        Compression filter. "zstd" falls back to "zlib" if the netCDF4 library
+        lacks zstandard support.
+    complevel : int, optional
+        Compression level (1-9 for zlib).
+    shuffle : bool, optional
+        If True, apply the HDF5 byte-shuffle filter before compressing.
+    time_chunk : int, optional
+        Chunk length along the time dimension. Defaults to about 1 MiB per chunk.
+    optimise_dtypes : bool, optional
+        If True, store variables in the smallest suitable dtype
+        (see `tools.plan_dtype_encoding`). This is lossy: float64 is stored
+        as float32.
+    pack : bool, optional
+        If True, pack floats into 16-bit integers with scale_factor/add_offset.
+        This is lossy.
 
     Returns
     -------
@@ -27,44 +88,607 @@ def save_dataset(ds: xr.Dataset, output_file: str = "../test.nc") -> bool:
 
     Notes
     -----
-    This function is based on a workaround for issues with saving datasets containing
+    Attribute sanitising works around issues with saving datasets containing
     attributes of unsupported types. See: https://github.com/pydata/xarray/issues/3743
 
     """
-    valid_types: tuple[Union[type, tuple], ...] = (
-        str,
-        int,
-        float,
-        np.float32,
-        np.float64,
-        np.int32,
-        np.int64,
+    ds = sanitise_attrs(ds)
+    encoding = plan_encoding(
+        ds,
+        format=format,
+        compression=compression,
+        complevel=complevel,
+        shuffle=shuffle,
+        time_chunk=time_chunk,
+        optimise_dtypes=optimise_dtypes,
+        pack=pack,
     )
-    # More general
-    valid_types = (str, Number, np.ndarray, np.number, list, tuple)
     try:
-        ds.to_netcdf(output_file, format="NETCDF4_CLASSIC")
-        return True
-    except TypeError as e:
-        print(e.__class__.__name__, e)
-        for varname, variable in ds.variables.items():
-            for k, v in variable.attrs.items():
-                if not isinstance(v, valid_types) or isinstance(v, bool):
-                    print(
-                        f"variable '{varname}': Converting attribute '{k}' with value '{v}' to string.",
-                    )
-                    variable.attrs[k] = str(v)
-        try:
-            ds.to_netcdf(output_file, format="NETCDF4_CLASSIC")
-            return True
-        except Exception as e:
-            print("Failed to save dataset:", e)
-            datetime_vars = [
-                var for var in ds.variables if ds[var].dtype == "datetime64[ns]"
-            ]
-            print("Variables with dtype datetime64[ns]:", datetime_vars)
-            float_attrs = [
-                attr for attr in ds.attrs if isinstance(ds.attrs[attr], float)
-            ]
-            print("Attributes with dtype float64:", float_attrs)
-            return False
+        ds.to_netcdf(output_file, format=format, encoding=encoding)
+    except Exception as e:
+        log_error("Failed to save dataset to %s: %s", output_file, e)
+        return False
+    log_info("Saved dataset to %s", output_file)
+    return True
+
+
+def sanitise_attrs(ds: xr.Dataset) -> xr.Dataset:
+    """Make attributes writable: stringify unsupported values, move encoding keys.
+
+    Attributes netCDF cannot store (e.g. bool, None, dict) are converted to
+    strings. Attributes xarray writes itself when encoding a variable (``units``
+    and ``calendar`` of times, ``_FillValue``, ``scale_factor``, ...) are moved
+    to the variable's encoding, where xarray expects them.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        The input dataset.
+
+    Returns
+    -------
+    xarray.Dataset
+        Shallow copy of the dataset with sanitised global and variable attributes.
+
+    """
+    ds = ds.copy(deep=False)
+    for varname, attrs in [(None, ds.attrs)] + [
+        (name, var.attrs) for name, var in ds.variables.items()
+    ]:
+        for k, v in attrs.items():
+            if not isinstance(v, VALID_ATTR_TYPES) or isinstance(v, bool):
+                log_warning(
+                    "%s: Converting attribute '%s' with value '%s' to string.",
+                    f"variable '{varname}'" if varname else "global",
+                    k,
+                    v,
+                )
+                attrs[k] = str(v)
+    for name, var in ds.variables.items():
+        keys = _ENCODING_ATTRS
+        if var.dtype.kind in "mM":
+            keys += _TIME_ENCODING_ATTRS
+        for key in keys:
+            if key in var.attrs:
+                log_debug("variable '%s': Moving attribute '%s' to encoding", name, key)
+                var.encoding.setdefault(key, var.attrs.pop(key))
+    return ds
+
+
+def plan_encoding(
+    ds: xr.Dataset,
+    format: str = "NETCDF4_CLASSIC",
+    compression: Optional[str] = "zlib",
+    complevel: int = 4,
+    shuffle: bool = True,
+    time_chunk: Optional[int] = None,
+    optimise_dtypes: bool = False,
+    pack: bool = False,
+) -> dict[str, dict]:
+    """Plan the NetCDF4 encoding (dtype, compression, chunks) of every variable.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        The dataset to be saved.
+    format, compression, complevel, shuffle, time_chunk, optimise_dtypes, pack
+        See `save_dataset`.
+
+    Returns
+    -------
+    dict of {str: dict}
+        Encoding per variable for ``ds.to_netcdf(encoding=...)``.
+
+    """
+    if compression == "zstd" and not _has_zstd():
+        log_warning("netCDF4 lacks zstandard support; using zlib instead")
+        compression = "zlib"
+
+    dtype_plan = {}
+    if optimise_dtypes or pack:
+        dtype_plan = tools.plan_dtype_encoding(ds, pack=pack)
+        if format == "NETCDF4_CLASSIC":
+            _avoid_unsigned(dtype_plan)
+
+    time_dim = _time_dim(ds)
+    encoding = {}
+    for var_name, var in ds.variables.items():
+        enc = _kept_encoding(var, dtype_plan.get(var_name))
+        if (
+            format == "NETCDF4_CLASSIC"
+            and var.dtype.kind in "mM"
+            and np.dtype(enc.get("dtype", "int64")) == np.int64
+        ):
+            # The classic model has no int64; times in e.g. milliseconds since
+            # a reference date need not fit int32, so store them as doubles
+            enc["dtype"] = "float64"
+        compressible = var.ndim > 0 and (
+            np.issubdtype(var.dtype, np.number)
+            or np.issubdtype(var.dtype, np.datetime64)
+        )
+        if compressible and compression:
+            enc.update(
+                _compression_encoding(compression, complevel),
+                shuffle=shuffle,
+                chunksizes=_chunk_sizes(var, time_dim, time_chunk, enc),
+            )
+        encoding[var_name] = enc
+    return encoding
+
+
+def save_zarr(
+    ds: xr.Dataset,
+    store: Union[str, Path],
+    append: bool = False,
+    time_chunk: Optional[int] = None,
+    optimise_dtypes: bool = False,
+    pack: bool = False,
+) -> bool:
+    """Save the dataset to a Zarr store chunked along the time dimension.
+
+    Metadata is consolidated so that `readers.load_zarr` opens the store with a
+    single read. With ``append=True`` the dataset's time steps are appended to
+    an existing store, reusing its chunking and encoding. Stores that will be
+    appended to should keep the default dtypes: a dtype or packing planned from
+    the first time steps need not hold later ones.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        The dataset to be saved.
+    store : str or Path
+        Path to the Zarr store. Overwritten unless ``append`` is True.
+    append : bool, optional
+        If True, append along the time dimension of an existing store.
+    time_chunk : int, optional
+        Chunk length along the time dimension. Defaults to about 1 MiB per chunk
+        for the widest variable.
+    optimise_dtypes, pack : bool, optional
+        See `save_dataset`. Ignored when appending.
+
+    Returns
+    -------
+    bool
+        True if the dataset was saved successfully, False otherwise.
+
+    Raises
+    ------
+    ValueError
+        If ``append`` is True and the dataset has no time dimension, or has
+        values that the store's integer dtype or packing cannot represent.
+
+    """
+    time_dim = _time_dim(ds)
+    if append and time_dim is None:
+        log_error("Cannot append a dataset without a time dimension to %s", store)
+        raise ValueError(f"Cannot append a dataset without a time dimension to {store}")
+
+    ds = sanitise_attrs(ds)
+    if append:
+        _check_append_fits(ds, store, time_dim)
+    try:
+        if append:
+            # Appended tails are small; loading them avoids dask chunks that
+            # straddle the partially filled last chunk of the store
+            ds.load().to_zarr(store, append_dim=time_dim, consolidated=True)
+        else:
+            encoding = _plan_zarr_encoding(
+                ds, time_dim, time_chunk, optimise_dtypes, pack
+            )
+            if any(var.chunks is not None for var in ds.variables.values()):
+                # Dask chunks must line up with the Zarr chunks
+                ds = ds.chunk(_dim_chunks(ds, encoding))
+            ds.to_zarr(store, mode="w", encoding=encoding, consolidated=True)
+    except Exception as e:
+        log_error("Failed to save dataset to %s: %s", store, e)
+        return False
+    log_info("Saved dataset to %s", store)
+    return True
+
+
+def update_array(
+    array_name: str,
+    output_dir: Union[str, Path],
+    refresh: Optional[str] = "if-modified",
+    **load_kwargs,
+) -> dict[str, int]:
+    """Bring the standardised Zarr copies of an array's files up to date.
+
+    Each file is opened lazily and its TIME range compared with the high-water
+    mark (last stored time step) recorded for it. Only the time steps after the
+    mark are standardised and appended to the file's store, so an extended
+    release costs a read of its new tail rather than of the full record. Files
+    without a store, or whose new values do not fit the stored encoding, are
+    standardised and written in full.
+
+    Parameters
+    ----------
+    array_name : str
+        Name of the observing array (see `readers.load_dataset`).
+    output_dir : str or Path
+        Directory holding one ``<array>_<file>.zarr`` store per file and the
+        ``high_water_marks.json`` record.
+    refresh : {None, "if-modified"}, optional
+        Passed to `readers.load_dataset`; by default only changed files are
+        downloaded again.
+    **load_kwargs
+        Further keyword arguments for `readers.load_dataset`.
+
+    Returns
+    -------
+    dict of {str: int}
+        Number of time steps written per file.
+
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    marks = _read_high_water_marks(output_dir)
+    load_kwargs.setdefault("lazy", True)
+    datasets = readers.load_dataset(array_name, refresh=refresh, **load_kwargs)
+
+    written = {}
+    for ds in datasets:
+        file_name = ds.attrs["source_file"]
+        key = f"{array_name}/{file_name}"
+        store = output_dir / f"{array_name}_{Path(file_name).stem}.zarr"
+        time_dim = _time_dim(ds)
+        if time_dim is not None:
+            ds = _valid_time_steps(ds, time_dim)
+
+        mark = marks.get(key, {}).get("time_end") if store.exists() else None
+        if mark in (None, "NaT") and store.exists():
+            # The record is missing (or was written from a NaT-padded axis):
+            # read the mark from the valid times of the stored copy
+            mark = _time_end(readers.load_zarr(store)["TIME"].values)
+
+        append = mark is not None and time_dim is not None
+        if append:
+            is_new = ds[time_dim].values > np.datetime64(mark)
+            if not is_new.any():
+                log_info("%s is up to date (last TIME %s)", key, mark)
+                written[file_name] = 0
+                continue
+            std = standardise.standardise_array(
+                ds.isel({time_dim: is_new}), file_name, array_name
+            )
+            try:
+                saved = save_zarr(std, store, append=True)
+            except ValueError as e:
+                log_warning("Rewriting %s in full: %s", store, e)
+                append = False
+        if not append:
+            std = standardise.standardise_array(ds, file_name, array_name)
+            saved = save_zarr(std, store)
+        if not saved:
+            log_error("Failed to update %s; high-water mark left at %s", key, mark)
+            continue
+        written[file_name] = std.sizes.get("TIME", 0)
+        time_end = _time_end(std["TIME"].values) if "TIME" in std.dims else None
+        if time_end is not None:
+            marks[key] = {"time_end": time_end, "store": store.name}
+            _write_high_water_marks(output_dir, marks)
+        log_info(
+            "%s %s time steps of %s",
+            "Appended" if append else "Wrote",
+            written[file_name],
+            key,
+        )
+    return written
+
+
+def to_long_table(datasets_by_array: dict[str, list[xr.Dataset]]) -> "pyarrow.Table":
+    """Flatten the 1-D TIME series of standardised datasets into a long table.
+
+    Parameters
+    ----------
+    datasets_by_array : dict of {str: list of xr.Dataset}
+        Standardised datasets per array, as returned by
+        `standardise.standardise_all`.
+
+    Returns
+    -------
+    pyarrow.Table
+        Columns ``array``, ``variable``, ``units`` (dictionary-encoded
+        strings), ``time``, ``value`` and ``year``, sorted by array, variable
+        and time. Rows with a missing time or value are dropped.
+
+    """
+    pa = _import_pyarrow()
+
+    columns = {"array": [], "variable": [], "units": [], "time": [], "value": []}
+    for array_name, datasets in datasets_by_array.items():
+        for ds in datasets:
+            for var_name, da in ds.data_vars.items():
+                # e.g. DSO_tr is stored as (TIME, DEPTH) with a single depth
+                singleton = [d for d in da.dims if d != "TIME" and da.sizes[d] == 1]
+                da = da.squeeze(singleton, drop=True)
+                if da.dims != ("TIME",) or not np.issubdtype(da.dtype, np.number):
+                    continue
+                time = ds["TIME"].values.astype("datetime64[ns]")
+                value = da.values.astype("float64")
+                keep = ~np.isnat(time) & ~np.isnan(value)
+                n = int(keep.sum())
+                columns["array"].append(np.full(n, array_name, dtype=object))
+                columns["variable"].append(np.full(n, var_name, dtype=object))
+                columns["units"].append(
+                    np.full(n, str(da.attrs.get("units", "")), dtype=object)
+                )
+                columns["time"].append(time[keep])
+                columns["value"].append(value[keep])
+
+    if not columns["time"]:
+        log_warning("No 1-D TIME series found to export")
+        columns = {k: [np.array([], dtype=object)] for k in columns}
+        columns["time"] = [np.array([], dtype="datetime64[ns]")]
+        columns["value"] = [np.array([], dtype="float64")]
+    columns = {k: np.concatenate(v) for k, v in columns.items()}
+
+    table = pa.table(
+        {
+            "array": pa.array(columns["array"], pa.string()),
+            "variable": pa.array(columns["variable"], pa.string()),
+            "units": pa.array(columns["units"], pa.string()),
+            "time": pa.array(columns["time"], pa.timestamp("ns")),
+            "value": pa.array(columns["value"], pa.float64()),
+            "year": pa.array(
+                columns["time"].astype("datetime64[Y]").astype("int64") + 1970,
+                pa.int16(),
+            ),
+        }
+    ).sort_by(
+        [("array", "ascending"), ("variable", "ascending"), ("time", "ascending")]
+    )
+    # Few distinct strings repeat over many rows
+    for name in ("array", "variable", "units"):
+        index = table.schema.get_field_index(name)
+        table = table.set_column(index, name, table[name].dictionary_encode())
+    return table
+
+
+def save_parquet(
+    datasets_by_array: dict[str, list[xr.Dataset]], output_dir: Union[str, Path]
+) -> bool:
+    """Export all 1-D TIME series as a Parquet dataset partitioned by array and year.
+
+    The long-format table from `to_long_table` is written as a hive-partitioned
+    dataset (``array=<name>/year=<yyyy>/...parquet``) that SQL engines and
+    ``pyarrow.parquet.read_table`` can query without xarray.
+
+    Parameters
+    ----------
+    datasets_by_array : dict of {str: list of xr.Dataset}
+        Standardised datasets per array.
+    output_dir : str or Path
+        Root directory of the Parquet dataset. Existing partitions are replaced.
+
+    Returns
+    -------
+    bool
+        True if the dataset was saved successfully, False otherwise.
+
+    """
+    table = to_long_table(datasets_by_array)
+    import pyarrow.parquet as pq
+
+    try:
+        pq.write_to_dataset(
+            table,
+            output_dir,
+            partition_cols=["array", "year"],
+            existing_data_behavior="delete_matching",
+        )
+    except Exception as e:
+        log_error("Failed to save Parquet dataset to %s: %s", output_dir, e)
+        return False
+    log_info("Saved %d rows to Parquet dataset %s", table.num_rows, output_dir)
+    return True
+
+
+def _import_pyarrow() -> ModuleType:
+    """Import pyarrow, which the Parquet export needs."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Exporting to Parquet requires pyarrow. Install it with "
+            "`pip install pyarrow`."
+        ) from e
+    return pyarrow
+
+
+def _read_high_water_marks(output_dir: Path) -> dict:
+    """Read the per array/file high-water marks, or an empty record."""
+    path = output_dir / HIGH_WATER_MARK_FILE
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_high_water_marks(output_dir: Path, marks: dict) -> None:
+    """Atomically replace the high-water mark record."""
+    path = output_dir / HIGH_WATER_MARK_FILE
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(marks, f, indent=2, sort_keys=True)
+    tmp_path.replace(path)
+
+
+def _plan_zarr_encoding(
+    ds: xr.Dataset,
+    time_dim: Optional[str],
+    time_chunk: Optional[int],
+    optimise_dtypes: bool,
+    pack: bool,
+) -> dict[str, dict]:
+    """Plan the Zarr encoding: dtypes and one time chunk length for all variables."""
+    dtype_plan = (
+        tools.plan_dtype_encoding(ds, pack=pack) if optimise_dtypes or pack else {}
+    )
+    if time_dim is not None and time_chunk is None:
+        time_chunk = min(
+            max(1, CHUNK_TARGET_BYTES // _row_bytes(var, time_dim))
+            for var in ds.variables.values()
+            if time_dim in var.dims
+        )
+    encoding = {}
+    for var_name, var in ds.variables.items():
+        enc = _kept_encoding(var, dtype_plan.get(var_name))
+        if var.ndim > 0:
+            enc["chunks"] = _chunk_sizes(var, time_dim, time_chunk, enc)
+        encoding[var_name] = enc
+    return encoding
+
+
+def _check_append_fits(ds: xr.Dataset, store: Union[str, Path], time_dim: str) -> None:
+    """Raise if appended values overflow the store's integer dtype or packing.
+
+    Zarr silently wraps or clips values outside the on-disk dtype, so the
+    appended time steps are encoded as they would be stored and checked first.
+    """
+    with xr.open_zarr(store, consolidated=True) as stored:
+        for var_name, var in ds.variables.items():
+            if var_name not in stored.variables or time_dim not in var.dims:
+                continue
+            enc = stored[var_name].encoding
+            dtype = np.dtype(enc.get("dtype", stored[var_name].dtype))
+            if dtype.kind not in "iu" or var.dtype.kind not in "iuf":
+                continue
+            values = var.values.astype("float64")
+            encoded = np.round(
+                (values - enc.get("add_offset", 0)) / enc.get("scale_factor", 1)
+            )
+            encoded = encoded[np.isfinite(encoded)]
+            if encoded.size == 0:
+                continue
+            info = np.iinfo(dtype)
+            fill = enc.get("_FillValue")
+            if (
+                encoded.min() < info.min
+                or encoded.max() > info.max
+                or (fill is not None and np.any(encoded == fill))
+            ):
+                log_error(
+                    "Values of %s (%s to %s) do not fit the %s encoding of %s",
+                    var_name,
+                    np.nanmin(values),
+                    np.nanmax(values),
+                    dtype,
+                    store,
+                )
+                raise ValueError(
+                    f"Values of {var_name} do not fit the {dtype} encoding of "
+                    f"{store}; rewrite the store instead of appending"
+                )
+
+
+def _dim_chunks(ds: xr.Dataset, encoding: dict[str, dict]) -> dict[str, int]:
+    """Chunk length per dimension implied by the planned Zarr encoding."""
+    chunks = {}
+    for var_name, var in ds.variables.items():
+        if "chunks" in encoding[var_name]:
+            chunks.update(zip(var.dims, encoding[var_name]["chunks"]))
+    return chunks
+
+
+def _valid_time_steps(ds: xr.Dataset, time_dim: str) -> xr.Dataset:
+    """Drop time steps with a missing (NaT) time and sort the rest by time.
+
+    Some releases (e.g. MOVE) pad their time axis with NaT; such rows cannot be
+    compared with a high-water mark and break time slicing of the store.
+    """
+    time = ds[time_dim].values
+    if not np.issubdtype(time.dtype, np.datetime64):
+        return ds
+    valid = np.flatnonzero(~np.isnat(time))
+    order = valid[np.argsort(time[valid], kind="stable")]
+    if order.size < time.size:
+        log_warning(
+            "Dropping %d time steps without a valid %s",
+            time.size - order.size,
+            time_dim,
+        )
+    elif (order == np.arange(time.size)).all():
+        return ds
+    return ds.isel({time_dim: order})
+
+
+def _time_end(time: np.ndarray) -> Optional[str]:
+    """Last valid (non-NaT) time as a string, or None if there is none."""
+    time = np.asarray(time)
+    if np.issubdtype(time.dtype, np.datetime64):
+        time = time[~np.isnat(time)]
+    return str(time.max()) if time.size else None
+
+
+def _time_dim(ds: xr.Dataset) -> Optional[str]:
+    """Name of the time dimension ("TIME" or "time"), if any."""
+    for name in ("TIME", "time"):
+        if name in ds.dims:
+            return name
+    return None
+
+
+def _kept_encoding(var: xr.Variable, dtype_encoding: Optional[dict]) -> dict:
+    """Source encoding worth keeping, updated with a planned on-disk dtype.
+
+    When the dtype changes, the source's packing (scale_factor, add_offset,
+    fill values) no longer applies and is dropped.
+    """
+    enc = {k: v for k, v in var.encoding.items() if k in _KEPT_ENCODING}
+    if dtype_encoding:
+        for key in tools.PACKING_ENCODING_KEYS:
+            enc.pop(key, None)
+        enc.update(dtype_encoding)
+    return enc
+
+
+def _has_zstd() -> bool:
+    """Whether the installed netCDF4 library can write zstandard-compressed data."""
+    try:
+        import netCDF4
+    except ImportError:
+        return False
+    return bool(getattr(netCDF4, "__has_zstandard_support__", False))
+
+
+def _compression_encoding(compression: str, complevel: int) -> dict:
+    """Encoding keys selecting the compression filter and level."""
+    if compression == "zlib":
+        return {"zlib": True, "complevel": complevel}
+    return {"compression": compression, "complevel": complevel}
+
+
+def _avoid_unsigned(dtype_plan: dict[str, dict]) -> None:
+    """Replace unsigned dtypes (not allowed in NETCDF4_CLASSIC) by wider signed ones."""
+    for var_name, enc in list(dtype_plan.items()):
+        dtype = np.dtype(enc["dtype"])
+        if dtype.kind != "u":
+            continue
+        if dtype.itemsize >= 4:
+            # No wider signed type in the classic model: keep the input dtype
+            del dtype_plan[var_name]
+            continue
+        signed = np.dtype(f"int{dtype.itemsize * 16}")
+        enc["dtype"] = signed.name
+        enc["_FillValue"] = tools.set_fill_value(signed)
+
+
+def _chunk_sizes(
+    var: xr.Variable, time_dim: Optional[str], time_chunk: Optional[int], enc: dict
+) -> tuple[int, ...]:
+    """Chunk shape spanning all non-time dimensions and aligned with ``time_dim``."""
+    shape = dict(zip(var.dims, var.shape))
+    if time_dim not in shape:
+        return tuple(var.shape)
+    if time_chunk is None:
+        time_chunk = max(1, CHUNK_TARGET_BYTES // _row_bytes(var, time_dim, enc))
+    shape[time_dim] = max(1, min(time_chunk, shape[time_dim]))
+    return tuple(shape[d] for d in var.dims)
+
+
+def _row_bytes(var: xr.Variable, time_dim: str, enc: Optional[dict] = None) -> int:
+    """Size in bytes of one time step of ``var`` in its (planned) dtype."""
+    itemsize = np.dtype((enc or {}).get("dtype", var.dtype)).itemsize
+    shape = [n for d, n in zip(var.dims, var.shape) if d != time_dim]
+    return itemsize * int(np.prod(shape))
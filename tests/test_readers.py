@@ -1,7 +1,10 @@
+import zipfile
+
+import numpy as np
 import pytest
 import xarray as xr
 
-from amocarray import logger, readers
+from amocarray import logger, read_fw2015, read_mocha, readers
 
 logger.disable_logging()
 
@@ -63,3 +66,195 @@ def test_load_dataset(array_name, expected_var):
         assert (
             "project" in ds.attrs
         ), f"{array_name} dataset should include 'project' metadata"
+
+
+def test_load_datasets_reports_errors_per_array(capsys):
+    datasets_by_array = readers.load_datasets(
+        ["rapid", "dso", "invalid"],
+        max_workers=2,
+    )
+    assert list(datasets_by_array) == ["rapid", "dso", "invalid"]
+    assert "moc_mar_hc10" in datasets_by_array["rapid"][0]
+    assert "DSO_tr" in datasets_by_array["dso"][0]
+    assert datasets_by_array["invalid"] == []
+
+    table = capsys.readouterr().out
+    assert "Timing summary:" in table
+    assert "failed: Unknown array name: invalid" in table
+
+
+def test_load_datasets_passes_reader_options():
+    datasets_by_array = readers.load_datasets(
+        ["fw2015", "dso"],
+        max_workers=2,
+        reader_kwargs={"FW2015": {"variables": ["MOC_PROXY"]}},
+    )
+    assert list(datasets_by_array["fw2015"][0].data_vars) == ["MOC_PROXY"]
+    assert "DSO_tr" in datasets_by_array["dso"][0]
+
+
+def test_load_dataset_lazy_uses_default_chunks():
+    pytest.importorskip("dask")
+    ds = readers.load_dataset("dso", lazy=True)[0]
+    assert ds["DSO_tr"].chunks is not None
+    assert max(ds.chunksizes["TIME"]) == 8760
+
+
+def test_load_dataset_explicit_chunks():
+    pytest.importorskip("dask")
+    ds = readers.load_dataset("rapid", chunks={"time": 1000, "depth": 10})[0]
+    assert ds["moc_mar_hc10"].chunks[0][0] == 1000
+
+
+def test_load_dataset_combines_files_sharing_a_time_axis(tmp_path):
+    pytest.importorskip("dask")
+
+    time = np.arange("2004-04-01", "2004-04-11", dtype="datetime64[D]")
+    for name, n_steps in (("a", 10), ("b", 10), ("c", 3)):
+        xr.Dataset(
+            {name: ("TIME", np.arange(float(n_steps)))},
+            coords={"TIME": time[:n_steps]},
+            attrs={"project": "RAPID"},
+        ).to_netcdf(tmp_path / f"{name}.nc")
+
+    combined = readers.load_dataset(
+        "rapid",
+        source=str(tmp_path),
+        file_list=["a.nc", "b.nc", "c.nc"],
+        transport_only=False,
+        data_dir=tmp_path / "data",
+        lazy=True,
+        combine=True,
+    )
+    assert len(combined) == 2
+    merged = combined[0]
+    assert {"a", "b"} <= set(merged.data_vars)
+    assert merged["a"].chunks is not None
+    assert merged.attrs["project"] == "RAPID"
+    assert merged.attrs["source_file"] == "a.nc, b.nc"
+    assert list(combined[1].data_vars) == ["c"]
+
+
+def _write_mat_v73(path, structs):
+    """Write a minimal MATLAB v7.3 (HDF5) file holding the given structs."""
+    h5py = pytest.importorskip("h5py")
+
+    with h5py.File(path, "w", userblock_size=512) as f:
+        for struct, fields in structs.items():
+            group = f.create_group(struct)
+            for name, value in fields.items():
+                if isinstance(value, str):
+                    dset = group.create_dataset(
+                        name, data=np.array([[ord(c)] for c in value], "uint16")
+                    )
+                    dset.attrs["MATLAB_class"] = np.bytes_("char")
+                else:
+                    group.create_dataset(name, data=np.asarray(value)[None, :])
+    header = b"MATLAB 7.3 MAT-file".ljust(124) + b"\x00\x02IM"
+    with open(path, "r+b") as f:
+        f.write(header)
+
+
+def test_read_fw2015_v73_selected_variables(tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    recon = {"time": [735965.0, 735996.0], "mocproxy": [17.5, 16.2]}
+    recon.update({attr: "v7.3 test" for attr in read_fw2015.FW2015_ATTRS})
+    _write_mat_v73(source / read_fw2015.FW2015_DEFAULT_FILES[0], {"recon": recon})
+
+    ds = read_fw2015.read_fw2015(
+        source=str(source), data_dir=tmp_path / "data", variables=["MOC_PROXY"]
+    )[0]
+    assert list(ds.data_vars) == ["MOC_PROXY"]
+    np.testing.assert_array_equal(ds["MOC_PROXY"], [17.5, 16.2])
+    assert str(ds["TIME"].values[0])[:10] == "2015-01-01"
+    assert ds.attrs["version"] == "v7.3 test"
+
+
+def test_read_fw2015_v73_keeps_memmap_uncached(tmp_path, monkeypatch):
+    monkeypatch.setenv("AMOCARRAY_CACHE_DIR", str(tmp_path / "cache"))
+    source = tmp_path / "source"
+    source.mkdir()
+    recon = {"time": [735965.0, 735996.0], "mocproxy": [17.5, 16.2]}
+    recon.update({attr: "v7.3 test" for attr in read_fw2015.FW2015_ATTRS})
+    _write_mat_v73(source / read_fw2015.FW2015_DEFAULT_FILES[0], {"recon": recon})
+
+    ds = readers.load_dataset(
+        "fw2015",
+        source=str(source),
+        data_dir=tmp_path / "data",
+        variables=["MOC_PROXY"],
+    )[0]
+    data = ds["MOC_PROXY"].values
+    while not isinstance(data, np.memmap) and getattr(data, "base", None) is not None:
+        data = data.base
+    assert isinstance(data, np.memmap)
+    assert not (tmp_path / "cache" / "parsed").exists()
+
+
+@pytest.fixture
+def mocha_zip(tmp_path):
+    """A local MOCHA-style zip holding a NetCDF4 member and a README."""
+    pytest.importorskip("h5netcdf")
+    zip_name = read_mocha.MOCHA_DEFAULT_FILES[0]
+    nc_name = "mocha_mht_data_ERA5_v2020.nc"
+    nc_path = tmp_path / nc_name
+    xr.Dataset(
+        {"Q_eddy": ("time", np.arange(4.0))}, coords={"time": np.arange(4)}
+    ).to_netcdf(nc_path, engine="h5netcdf")
+
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    with zipfile.ZipFile(source_dir / zip_name, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.write(nc_path, nc_name)
+        zf.writestr("README.txt", "MOCHA readme")
+    return source_dir
+
+
+def test_read_mocha_streams_member_without_extracting(mocha_zip, tmp_path):
+    data_dir = tmp_path / "data"
+    ds = read_mocha.read_mocha(source=str(mocha_zip), data_dir=data_dir, stream=True)[0]
+    assert ds["Q_eddy"].values.tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert ds.attrs["source_path"].endswith("::mocha_mht_data_ERA5_v2020.nc")
+    assert list(data_dir.iterdir()) == []
+
+
+def test_read_mocha_extracts_requested_members_and_checks_crc(mocha_zip, tmp_path):
+    data_dir = tmp_path / "data"
+    read_mocha.read_mocha(source=str(mocha_zip), data_dir=data_dir)
+    assert sorted(p.name for p in data_dir.iterdir()) == [
+        "mocha_mht_data_ERA5_v2020.nc"
+    ]
+
+    readme = data_dir / "README.txt"
+    readme.write_text("corrupted")
+    read_mocha.read_mocha(
+        source=str(mocha_zip),
+        data_dir=data_dir,
+        members=["README.txt"],
+        verify_crc=True,
+    )
+    assert readme.read_text() == "MOCHA readme"
+
+
+def test_load_dataset_passes_mocha_options(mocha_zip, tmp_path):
+    data_dir = tmp_path / "data"
+    ds = readers.load_dataset(
+        "mocha", source=str(mocha_zip), data_dir=data_dir, stream=True
+    )[0]
+    assert ds.attrs["source_path"].endswith("::mocha_mht_data_ERA5_v2020.nc")
+    assert list(data_dir.iterdir()) == []
+
+    readers.load_dataset(
+        "mocha", source=str(mocha_zip), data_dir=data_dir, members=["README.txt"]
+    )
+    readme = data_dir / "README.txt"
+    readme.write_text("corrupted")
+    readers.load_dataset(
+        "mocha",
+        source=str(mocha_zip),
+        data_dir=data_dir,
+        members=["README.txt"],
+        verify_crc=True,
+    )
+    assert readme.read_text() == "MOCHA readme"
@@ -1,4 +1,6 @@
+import numpy as np
 import pytest
+import xarray as xr
 from amocarray import logger, readers, standardise, utilities
 
 logger.disable_logging()
@@ -152,3 +154,59 @@ def test_consolidate_contributors_merges_and_assigns_roles(input_dict, expected_
     data = input_dict.copy()  # avoid mutating input
     result = standardise._consolidate_contributors(data)
     assert result == expected_dict
+
+
+def test_standardise_all_matches_serial(capsys):
+    datasets_by_array = {
+        "samba": readers.load_dataset("samba"),
+        "rapid": readers.load_dataset("rapid"),
+    }
+    capsys.readouterr()
+
+    result = standardise.standardise_all(datasets_by_array, workers=2)
+    assert list(result) == ["samba", "rapid"]
+    for array_name, datasets in datasets_by_array.items():
+        assert len(result[array_name]) == len(datasets)
+        for ds, std_ds in zip(datasets, result[array_name]):
+            expected = standardise.standardise_array(
+                ds, ds.attrs["source_file"], array_name
+            )
+            xr.testing.assert_identical(std_ds, expected)
+
+    assert "Standardisation timing summary:" in capsys.readouterr().out
+
+
+def test_standardise_array_inplace_shares_data():
+    ds = readers.load_dataset("rapid")[0].load()
+    original_attrs = dict(ds.attrs)
+
+    std_ds = standardise.standardise_array(ds, "moc_transports.nc", "rapid")
+    assert ds.attrs == original_attrs
+    assert "TIME" in std_ds.dims
+
+    std_inplace = standardise.standardise_array(
+        ds, "moc_transports.nc", "rapid", inplace=True
+    )
+    xr.testing.assert_identical(std_inplace, std_ds)
+    assert ds.attrs == std_ds.attrs
+    assert np.shares_memory(
+        std_inplace["moc_mar_hc10"].values, ds["moc_mar_hc10"].values
+    )
+
+
+def test_reorder_metadata_matches_keys_case_insensitively():
+    attrs = {"extra": "1", "featureType": "timeSeries", "DOI": "10", "Title": "t"}
+    result = standardise.reorder_metadata(attrs)
+    assert list(result) == ["Title", "DOI", "featureType", "extra"]
+    assert result == attrs
+
+
+def test_clean_metadata_shares_lowercase_index():
+    attrs = {"Title": "t", "WebSite": "https://x", "Institution": "NOC"}
+    lower_keys = {key: key.lower() for key in attrs}
+    cleaned = standardise.clean_metadata(attrs, lower_keys=lower_keys)
+    assert cleaned["web_link"] == "https://x"
+    assert cleaned["contributing_institutions"] == "NOC"
+    # Canonical keys created while merging are added to the shared index
+    assert lower_keys["web_link"] == "web_link"
+    assert list(standardise.reorder_metadata(cleaned, lower_keys))[0] == "title"
@@ -1,6 +1,10 @@
 import pathlib
 import sys
 
+import numpy as np
+import pytest
+import xarray as xr
+
 script_dir = pathlib.Path(__file__).parent.absolute()
 parent_dir = script_dir.parents[0]
 sys.path.append(str(parent_dir))
@@ -16,3 +20,201 @@ def test_convert_units_var():
     new_units = "m/s"
     converted_values = tools.convert_units_var(var_values, current_units, new_units)
     assert converted_values == 1.0
+
+
+def test_find_conversion_factor_multi_hop():
+    # km -> m -> cm, and unit spellings joined with factor 1
+    assert tools.find_conversion_factor("km", "cm") == pytest.approx(1e5)
+    assert tools.find_conversion_factor("cm/s", "m s-1") == pytest.approx(0.01)
+    assert tools.find_conversion_factor("Sv", "m") is None
+    # Custom graphs bypass the cache of the default graph
+    custom = {"Sv": {"m3 s-1": 1e6}}
+    assert tools.find_conversion_factor("Sv", "m3 s-1", custom) == 1e6
+    assert tools.find_conversion_factor("Sv", "m3 s-1") is None
+
+
+def test_convert_units_ds_is_lazy_and_updates_attrs():
+    pytest.importorskip("dask")
+    ds = xr.Dataset(
+        {
+            "U": ("TIME", np.arange(3.0), {"units": "cm/s", "valid_max": 100.0}),
+            "MOC": ("TIME", np.ones(3), {"units": "Sverdrup"}),
+            "DEPTH": ("TIME", np.ones(3), {"units": "km"}),
+        }
+    ).chunk()
+    out = tools.convert_units_ds(ds)
+    assert out["U"].chunks is not None
+    np.testing.assert_allclose(out["U"].values, [0.0, 0.01, 0.02])
+    assert out["U"].attrs == {"units": "m s-1", "valid_max": 1.0}
+    assert out["MOC"].attrs["units"] == "Sv"
+    assert out["DEPTH"].attrs["units"] == "km"
+    assert ds["U"].attrs["units"] == "cm/s"
+
+
+def test_convert_units_ds_drops_source_packing():
+    ds = xr.Dataset({"U": ("TIME", [10.0, 20.0], {"units": "cm/s"})})
+    ds["U"].encoding = {"dtype": "int16", "scale_factor": 0.1, "zlib": True}
+    out = tools.convert_units_ds(ds)
+    assert out["U"].encoding == {"zlib": True}
+
+
+def test_find_best_dtype_uses_value_range():
+    da = xr.DataArray(np.array([0, 200]))
+    assert tools.find_best_dtype("COUNT", da) == np.uint8
+    assert tools.find_best_dtype("COUNT", da, -5, 100) == np.int8
+    assert tools.find_best_dtype("COUNT", da, -40000, 10) == np.int32
+    assert tools.find_best_dtype("MOC", da.astype(float)) == np.float32
+
+
+def test_set_best_dtype_fills_nan_without_touching_input():
+    ds = xr.Dataset(
+        {
+            "COUNT_raw": ("TIME", [1.0, np.nan, 300.0], {"valid_max": 300.0}),
+            "MOC": ("TIME", [17.0, 16.5, 18.2]),
+        }
+    )
+    out = tools.set_best_dtype(ds)
+    assert out["COUNT_raw"].dtype == np.int16
+    assert out["COUNT_raw"].values[1] == 32767
+    assert out["COUNT_raw"].encoding["_FillValue"] == 32767
+    assert out["MOC"].dtype == np.float32
+    assert ds["COUNT_raw"].dtype == np.float64
+    assert ds["COUNT_raw"].attrs["valid_max"] == 300.0
+
+
+def test_set_best_dtype_encoding_is_lazy_and_round_trips(tmp_path):
+    pytest.importorskip("dask")
+    ds = xr.Dataset(
+        {
+            "COUNT": ("TIME", np.arange(10, dtype="int64")),
+            "MOC": ("TIME", np.linspace(10.0, 20.0, 10)),
+        }
+    ).chunk({"TIME": 5})
+    out = tools.set_best_dtype(ds, use_encoding=True, pack=True)
+    assert out["MOC"].chunks is not None
+    assert out["COUNT"].encoding["dtype"] == "int8"
+    assert out["MOC"].encoding["dtype"] == "int16"
+
+    out.to_netcdf(tmp_path / "packed.nc")
+    with xr.open_dataset(tmp_path / "packed.nc", mask_and_scale=False) as raw:
+        assert raw["MOC"].dtype == np.int16
+    with xr.open_dataset(tmp_path / "packed.nc") as decoded:
+        np.testing.assert_allclose(decoded["MOC"], ds["MOC"], atol=1e-3)
+        np.testing.assert_array_equal(decoded["COUNT"], ds["COUNT"])
+
+
+def test_plan_dtype_encoding_never_packs_latitude_longitude():
+    n = 10
+    ds = xr.Dataset(
+        {
+            "MOC": ("TIME", np.linspace(10.0, 20.0, n)),
+            "location_vertices_latitude": ("TIME", np.linspace(16.0, 16.5, n)),
+            "location_vertices_longitude": ("TIME", np.linspace(-60.0, -51.5, n)),
+            "LAT": ("TIME", np.linspace(26.0, 26.5, n)),
+            "mooring_lon": ("TIME", np.linspace(-77.0, -13.0, n)),
+        }
+    )
+    plan = tools.plan_dtype_encoding(ds, pack=True)
+    assert plan["MOC"]["dtype"] == "int16"
+    for var_name in ("location_vertices_latitude", "LAT", "mooring_lon"):
+        assert "scale_factor" not in plan.get(var_name, {})
+    assert "location_vertices_longitude" not in plan
+
+
+def _headline_datasets():
+    daily = np.arange("2004-04-01", "2004-06-01", dtype="datetime64[D]")
+    rapid = xr.Dataset(
+        {"moc_mar_hc10": ("TIME", np.full(daily.size, 17.0), {"units": "Sv"})},
+        coords={"TIME": daily},
+    )
+    move = xr.Dataset(
+        {"TRANSPORT_TOTAL": ("TIME", [20.0, 22.0], {"units": "Sv"})},
+        coords={"TIME": np.array(["2004-02-15", "2004-04-15"], "datetime64[ns]")},
+    )
+    return {"rapid": [rapid], "move": [move]}
+
+
+def test_build_amoc_cube_aligns_arrays_on_shared_time():
+    cube = tools.build_amoc_cube(datasets_by_array=_headline_datasets())
+    assert cube.dims == ("array", "TIME")
+    assert list(cube["array"].values) == ["rapid", "move"]
+    assert cube["TIME"].values[0] == np.datetime64("2004-02-01")
+    assert cube.sizes["TIME"] == 4
+    np.testing.assert_array_equal(cube.sel(array="rapid"), [np.nan, np.nan, 17, 17])
+    # MOVE is flipped to a northward transport; March is a coverage gap
+    np.testing.assert_array_equal(cube.sel(array="move"), [-20, np.nan, -22, np.nan])
+    assert cube["coverage"].sel(array="move").values.tolist() == [
+        True,
+        False,
+        True,
+        False,
+    ]
+
+
+def test_build_amoc_cube_shares_bins_that_are_not_month_aligned():
+    cube = tools.build_amoc_cube(freq="7D", datasets_by_array=_headline_datasets())
+    time = np.datetime64("2004-02-15") + np.arange(16) * np.timedelta64(7, "D")
+    np.testing.assert_array_equal(cube["TIME"], time.astype("datetime64[ns]"))
+    # RAPID starts on 2004-04-01, inside the bin of 2004-03-28
+    rapid = np.full(16, np.nan)
+    rapid[6:] = 17
+    np.testing.assert_array_equal(cube.sel(array="rapid"), rapid)
+    move = np.full(16, np.nan)
+    move[[0, 8]] = [-20, -22]
+    np.testing.assert_array_equal(cube.sel(array="move"), move)
+
+
+def test_build_amoc_cube_is_cached(monkeypatch):
+    calls = []
+
+    def fake_load(arrays):
+        calls.append(arrays)
+        return _headline_datasets()
+
+    monkeypatch.setattr(tools, "_load_headline_datasets", fake_load)
+    tools.clear_amoc_cube_cache()
+    cube = tools.build_amoc_cube(arrays=["rapid", "move"])
+    cube[:] = 0
+    again = tools.build_amoc_cube(arrays=["rapid", "move"])
+    assert calls == [("rapid", "move")]
+    assert float(again.sel(array="rapid")[-1]) == 17
+    tools.clear_amoc_cube_cache()
+
+
+@pytest.mark.parametrize(
+    "freq", ["6h", "1D", "1MS", "QS", "YS", "ME", "QE", "YE", "W", "W-WED", "2ME"]
+)
+def test_resample_mean_matches_xarray(freq):
+    rng = np.random.default_rng(0)
+    n = 2000
+    time = np.datetime64("2004-03-17T05:00", "ns") + rng.integers(
+        0, 3 * 365 * 24, n
+    ) * np.timedelta64(1, "h")
+    time[rng.integers(0, n, 20)] = np.datetime64("NaT")
+    time[100:110] = time[200:210]
+    values = rng.normal(size=(n, 3))
+    values[rng.random((n, 3)) < 0.1] = np.nan
+    ds = xr.Dataset(
+        {
+            "MOC": ("TIME", values[:, 0], {"units": "Sv"}),
+            "PROFILE": (("TIME", "DEPTH"), values),
+            "DEPTH_BNDS": ("DEPTH", np.arange(3.0)),
+        },
+        coords={"TIME": time, "DEPTH": [1.0, 2.0, 3.0]},
+    )
+
+    cleaned = ds.isel(TIME=~np.isnat(time))
+    _, first = np.unique(cleaned["TIME"].values, return_index=True)
+    expected = cleaned.isel(TIME=np.sort(first)).sortby("TIME").resample(TIME=freq)
+    expected = expected.mean()
+
+    result = tools.resample_mean(ds, freq)
+    # xarray also broadcasts DEPTH_BNDS along TIME; it is kept as is here
+    xr.testing.assert_identical(result["DEPTH_BNDS"], ds["DEPTH_BNDS"])
+    xr.testing.assert_allclose(
+        result[["MOC", "PROFILE"]], expected[["MOC", "PROFILE"]].transpose("TIME", ...)
+    )
+    assert result["MOC"].attrs["units"] == "Sv"
+    xr.testing.assert_allclose(
+        tools.resample_mean(ds["PROFILE"], freq), result["PROFILE"]
+    )
@@ -1,5 +1,9 @@
+import hashlib
+import json
+import os
 from pathlib import Path
 
+import numpy as np
 import pytest
 import xarray as xr
 
@@ -75,3 +79,483 @@ def test_safe_update_attrs_existing_key_with_overwrite():
     new_attrs = {"project": "OSNAP"}
     ds = utilities.safe_update_attrs(ds, new_attrs, overwrite=True)
     assert ds.attrs["project"] == "OSNAP"
+
+
+@pytest.fixture()
+def blob_cache(tmp_path, monkeypatch):
+    """Point the blob cache at a temporary directory and fake the registry."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("AMOCARRAY_CACHE_DIR", str(cache_dir))
+    registry = {}
+    monkeypatch.setattr(utilities, "load_registry", lambda: registry)
+    return registry
+
+
+def test_load_registry_contains_rapid_hashes():
+    registry = utilities.load_registry()
+    assert "moc_transports.nc" in registry
+    assert len(registry["moc_transports.nc"]) == 64
+
+
+@pytest.mark.usefixtures("blob_cache")
+def test_file_sha256_uses_index(tmp_path, monkeypatch):
+    data_file = tmp_path / "a.txt"
+    data_file.write_text("amoc")
+    digest = utilities.file_sha256(data_file)
+    assert digest == hashlib.sha256(b"amoc").hexdigest()
+
+    # An unchanged file is served from the mtime/size index without re-reading
+    monkeypatch.setattr(utilities.hashlib, "sha256", None)
+    assert utilities.file_sha256(data_file) == digest
+
+
+def test_resolve_file_path_restores_from_blob(blob_cache, tmp_path):
+    first_dir = tmp_path / "first"
+    first_dir.mkdir()
+    (first_dir / "moc.nc").write_text("transport data")
+    blob_cache["moc.nc"] = utilities.file_sha256(first_dir / "moc.nc")
+
+    # Cached file is verified and stored in the blob cache
+    path = utilities.resolve_file_path("moc.nc", None, None, first_dir)
+    assert path == first_dir / "moc.nc"
+
+    # A second data directory is filled from the blob cache without a download
+    second_dir = tmp_path / "second"
+    path = utilities.resolve_file_path("moc.nc", None, None, second_dir)
+    assert path.read_text() == "transport data"
+    assert path.samefile(first_dir / "moc.nc")
+
+
+def test_resolve_file_path_discards_corrupt_file(blob_cache, tmp_path):
+    (tmp_path / "moc.nc").write_text("truncated")
+    blob_cache["moc.nc"] = "0" * 64
+
+    with pytest.raises(FileNotFoundError):
+        utilities.resolve_file_path("moc.nc", None, None, tmp_path)
+    assert not (tmp_path / "moc.nc").exists()
+
+
+class _FakeResponse:
+    """Minimal streaming response used to simulate interrupted transfers."""
+
+    def __init__(self, body, status_code=200, fail_after=None, headers=None):
+        self.body = body
+        self.status_code = status_code
+        self.fail_after = fail_after
+        self.headers = {"Content-Length": str(len(body)), **(headers or {})}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            if self.fail_after is not None and start >= self.fail_after:
+                raise utilities.requests.ConnectionError("connection reset")
+            yield self.body[start : start + chunk_size]
+
+
+def test_download_file_resumes_with_range(tmp_path, monkeypatch):
+    payload = bytes(range(256)) * 40
+    calls = []
+
+    def fake_get(_url, headers, **_kwargs):
+        calls.append(headers.get("Range"))
+        if len(calls) == 1:
+            return _FakeResponse(payload, fail_after=4096)
+        offset = int(headers["Range"][len("bytes=") : -1])
+        return _FakeResponse(payload[offset:], status_code=206)
+
+    monkeypatch.setattr(utilities.get_session(), "get", fake_get)
+    monkeypatch.setattr(utilities.time, "sleep", lambda _: None)
+
+    path = utilities.download_file(
+        "https://example.org/ts_gridded.nc", tmp_path, chunk_size=1024
+    )
+
+    assert Path(path).read_bytes() == payload
+    assert calls == [None, "bytes=4096-"]
+    assert not (tmp_path / "ts_gridded.nc.part").exists()
+
+
+def test_download_file_restarts_partial_of_older_version(tmp_path, monkeypatch):
+    old, new = b"a" * 3000, b"b" * 5000
+    requests_seen = []
+
+    def fake_get(_url, headers, **_kwargs):
+        requests_seen.append(headers)
+        if "Range" in headers and headers.get("If-Range") == '"v2"':
+            offset = int(headers["Range"][len("bytes=") : -1])
+            return _FakeResponse(new[offset:], status_code=206)
+        return _FakeResponse(new, headers={"ETag": '"v2"'})
+
+    monkeypatch.setattr(utilities.get_session(), "get", fake_get)
+    url = "https://example.org/moc_vertical.nc"
+    part = tmp_path / "moc_vertical.nc.part"
+
+    # A partial of the previous release is not spliced onto the new one
+    part.write_bytes(old)
+    utilities.write_sidecar(part, {"etag": '"v1"'})
+    path = utilities.download_file(url, tmp_path)
+    assert Path(path).read_bytes() == new
+    assert requests_seen[-1] == {"Range": "bytes=3000-", "If-Range": '"v1"'}
+    assert not utilities.read_sidecar(part)
+
+    # A partial without validators cannot be verified and is discarded
+    part.write_bytes(old)
+    utilities.download_file(url, tmp_path, redownload=True)
+    assert requests_seen[-1] == {}
+    assert Path(path).read_bytes() == new
+
+    # A partial of the current release is resumed
+    part.write_bytes(new[:3000])
+    utilities.write_sidecar(part, {"etag": '"v2"'})
+    utilities.download_file(url, tmp_path, redownload=True)
+    assert requests_seen[-1] == {"Range": "bytes=3000-", "If-Range": '"v2"'}
+    assert Path(path).read_bytes() == new
+
+
+def test_download_file_keeps_part_file_on_failure(tmp_path, monkeypatch):
+    payload = b"x" * 4096
+
+    def fake_get(_url, **_kwargs):
+        return _FakeResponse(payload, fail_after=1024)
+
+    monkeypatch.setattr(utilities.get_session(), "get", fake_get)
+
+    with pytest.raises(utilities.requests.ConnectionError):
+        utilities.download_file(
+            "https://example.org/2d_gridded.nc",
+            tmp_path,
+            chunk_size=1024,
+            max_retries=0,
+        )
+
+    assert not (tmp_path / "2d_gridded.nc").exists()
+    assert (tmp_path / "2d_gridded.nc.part").stat().st_size == 1024
+
+
+def test_download_file_revalidates_with_etag(tmp_path, monkeypatch):
+    requests_seen = []
+
+    def fake_get(_url, headers, **_kwargs):
+        requests_seen.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return _FakeResponse(b"", status_code=304)
+        return _FakeResponse(b"version 1", headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(utilities.get_session(), "get", fake_get)
+    url = "https://example.org/moc_vertical.nc"
+
+    path = utilities.download_file(url, tmp_path)
+    assert utilities.read_sidecar(path)["etag"] == '"v1"'
+    assert utilities.read_sidecar(path)["content_length"] == len(b"version 1")
+
+    # Unchanged on the server: one conditional request, file kept
+    path = utilities.download_file(url, tmp_path, refresh="if-modified")
+    assert requests_seen[-1] == {"If-None-Match": '"v1"'}
+    assert Path(path).read_bytes() == b"version 1"
+    assert len(requests_seen) == 2
+
+
+def test_download_file_if_modified_replaces_changed_file(tmp_path, monkeypatch):
+    def fake_get(_url, **_kwargs):
+        return _FakeResponse(b"version 2", headers={"ETag": '"v2"'})
+
+    monkeypatch.setattr(utilities.get_session(), "get", fake_get)
+    url = "https://example.org/moc_vertical.nc"
+    (tmp_path / "moc_vertical.nc").write_bytes(b"version 1")
+    utilities.write_sidecar(tmp_path / "moc_vertical.nc", {"url": url, "etag": '"v1"'})
+
+    path = utilities.download_file(url, tmp_path, refresh="if-modified")
+    assert Path(path).read_bytes() == b"version 2"
+    assert utilities.read_sidecar(path)["etag"] == '"v2"'
+
+
+def test_resolve_file_path_accepts_reissued_registry_file(
+    blob_cache, tmp_path, monkeypatch
+):
+    url = "https://example.org/moc_transports.nc"
+    (tmp_path / "moc_transports.nc").write_bytes(b"version 1")
+    utilities.write_sidecar(tmp_path / "moc_transports.nc", {"url": url, "etag": "v1"})
+    blob_cache["moc_transports.nc"] = hashlib.sha256(b"version 1").hexdigest()
+    requests_seen = []
+
+    def fake_get(_url, headers, **_kwargs):
+        requests_seen.append(headers)
+        return _FakeResponse(b"version 2", headers={"ETag": '"v2"'})
+
+    monkeypatch.setattr(utilities.get_session(), "get", fake_get)
+
+    # The registry hash no longer short-circuits a requested revalidation
+    path = utilities.resolve_file_path(
+        "moc_transports.nc", None, url, tmp_path, refresh="if-modified"
+    )
+    assert requests_seen == [{"If-None-Match": "v1"}]
+    assert path.read_bytes() == b"version 2"
+
+    # The new version is verified against its own hash, not discarded
+    path = utilities.resolve_file_path("moc_transports.nc", None, url, tmp_path)
+    assert path.read_bytes() == b"version 2"
+    assert len(requests_seen) == 1
+
+    utilities.resolve_file_path(
+        "moc_transports.nc", None, url, tmp_path, redownload=True
+    )
+    assert len(requests_seen) == 2
+
+
+def test_resolve_file_path_rejects_corrupt_download_of_unchanged_file(
+    blob_cache, tmp_path, monkeypatch
+):
+    url = "https://example.org/moc_transports.nc"
+    blob_cache["moc_transports.nc"] = hashlib.sha256(b"version 1").hexdigest()
+    utilities.write_sidecar(tmp_path / "moc_transports.nc", {"url": url, "etag": "v1"})
+
+    def fake_get(_url, **_kwargs):
+        # Same ETag as the registered version, but truncated content
+        return _FakeResponse(b"versi", headers={"ETag": "v1"})
+
+    monkeypatch.setattr(utilities.get_session(), "get", fake_get)
+
+    with pytest.raises(FileNotFoundError, match="does not match registry hash"):
+        utilities.resolve_file_path(
+            "moc_transports.nc", None, url, tmp_path, redownload=True
+        )
+    assert not (tmp_path / "moc_transports.nc").exists()
+    assert not (tmp_path / "moc_transports.nc.part").exists()
+
+    # Without validators from a previous download there is no new version
+    utilities.write_sidecar(tmp_path / "moc_transports.nc", {})
+    with pytest.raises(FileNotFoundError, match="does not match registry hash"):
+        utilities.resolve_file_path("moc_transports.nc", None, url, tmp_path)
+
+
+def test_resolve_file_path_rejects_unknown_refresh(tmp_path):
+    with pytest.raises(ValueError, match="Unknown refresh mode"):
+        utilities.resolve_file_path("a.nc", None, None, tmp_path, refresh="sometimes")
+
+
+def test_get_session_is_shared_and_pooled():
+    session = utilities.get_session()
+    assert utilities.get_session() is session
+
+    adapter = session.get_adapter("https://rapid.ac.uk/")
+    pool_kw = adapter.poolmanager.connection_pool_kw
+    assert pool_kw["maxsize"] == utilities.HTTP_POOL_MAXSIZE
+    assert pool_kw["block"]
+    assert adapter.max_retries.total == utilities.HTTP_RETRIES
+
+
+class _FakeFTP:
+    """In-memory FTP server with a single file, counting logins."""
+
+    files = {"/phod/pub/SAM/upper.txt": b"0123456789" * 100}
+    logins = 0
+    rests = []
+
+    def __init__(self, host, **_kwargs):
+        self.host = host
+
+    def login(self):
+        type(self).logins += 1
+
+    def voidcmd(self, cmd):
+        if cmd.startswith("MDTM"):
+            return "213 20200101120000"
+        return "200 OK"
+
+    def size(self, path):
+        return len(self.files[path])
+
+    def retrbinary(self, cmd, callback, blocksize=8192, rest=None):
+        type(self).rests.append(rest)
+        data = self.files[cmd.split(" ", 1)[1]][rest or 0 :]
+        for start in range(0, len(data), blocksize):
+            callback(data[start : start + blocksize])
+
+    def quit(self):
+        pass
+
+
+def test_download_file_reuses_ftp_connections(tmp_path, monkeypatch):
+    monkeypatch.setattr(utilities, "FTP", _FakeFTP)
+    monkeypatch.setattr(_FakeFTP, "logins", 0)
+    utilities.close_ftp_connections()
+    url = "ftp://ftp.example.org/phod/pub/SAM/upper.txt"
+
+    utilities.download_file(url, tmp_path / "a")
+    utilities.download_file(url, tmp_path / "b")
+    assert _FakeFTP.logins == 1
+    assert (tmp_path / "b" / "upper.txt").read_bytes() == _FakeFTP.files[
+        "/phod/pub/SAM/upper.txt"
+    ]
+    assert utilities.read_sidecar(tmp_path / "b" / "upper.txt")["size"] == 1000
+
+    # Unchanged MDTM/SIZE: nothing is retrieved
+    monkeypatch.setattr(_FakeFTP, "retrbinary", None)
+    utilities.download_file(url, tmp_path / "b", refresh="if-modified")
+    utilities.close_ftp_connections()
+
+
+def test_download_file_resumes_ftp_with_rest(tmp_path, monkeypatch):
+    monkeypatch.setattr(utilities, "FTP", _FakeFTP)
+    monkeypatch.setattr(_FakeFTP, "rests", [])
+    utilities.close_ftp_connections()
+    url = "ftp://ftp.example.org/phod/pub/SAM/upper.txt"
+    payload = _FakeFTP.files["/phod/pub/SAM/upper.txt"]
+    part = tmp_path / "upper.txt.part"
+    part.write_bytes(payload[:300])
+    utilities.write_sidecar(part, {"mdtm": "20200101120000", "size": 1000})
+
+    path = utilities.download_file(url, tmp_path)
+    assert Path(path).read_bytes() == payload
+    assert _FakeFTP.rests == [300]
+    assert not utilities.read_sidecar(part)
+
+    # A partial of another version (here: other MDTM) is not resumed
+    part.write_bytes(b"x" * 300)
+    utilities.write_sidecar(part, {"mdtm": "20190101120000", "size": 1000})
+    path = utilities.download_file(url, tmp_path, redownload=True)
+    assert Path(path).read_bytes() == payload
+    assert _FakeFTP.rests == [300, None]
+    utilities.close_ftp_connections()
+
+
+class _NoRestFTP(_FakeFTP):
+    """FTP server that refuses REST, as ftplib sees it before RETR."""
+
+    def sendcmd(self, _cmd):
+        raise utilities.error_perm("502 REST command not implemented")
+
+    def retrbinary(self, cmd, callback, blocksize=8192, rest=None):
+        if rest is not None:
+            self.sendcmd(f"REST {rest}")
+        super().retrbinary(cmd, callback, blocksize=blocksize)
+
+
+def test_download_file_restarts_ftp_when_rest_refused(tmp_path, monkeypatch):
+    monkeypatch.setattr(utilities, "FTP", _NoRestFTP)
+    utilities.close_ftp_connections()
+    payload = _FakeFTP.files["/phod/pub/SAM/upper.txt"]
+    (tmp_path / "upper.txt.part").write_bytes(b"stale" * 60)
+    utilities.write_sidecar(
+        tmp_path / "upper.txt.part", {"mdtm": "20200101120000", "size": 1000}
+    )
+
+    path = utilities.download_file(
+        "ftp://ftp.example.org/phod/pub/SAM/upper.txt", tmp_path
+    )
+    assert Path(path).read_bytes() == payload
+    utilities.close_ftp_connections()
+
+
+@pytest.mark.usefixtures("blob_cache")
+def test_parse_cached_reuses_parsed_result(tmp_path):
+    source = tmp_path / "series.txt"
+    source.write_text("1 2 3\n")
+    calls = []
+
+    def parser(path):
+        calls.append(path)
+        return xr.Dataset({"x": ("TIME", [1.0, 2.0, 3.0])})
+
+    first = utilities.parse_cached(source, parser, "test-1")
+    second = utilities.parse_cached(source, parser, "test-1")
+    assert len(calls) == 1
+    xr.testing.assert_identical(first, second.load())
+
+    # A new reader version or changed source file triggers a re-parse
+    utilities.parse_cached(source, parser, "test-2")
+    source.write_text("1 2 3 4\n")
+    utilities.parse_cached(source, parser, "test-2")
+    assert len(calls) == 3
+
+
+def test_decimal_year_to_datetime64_handles_leap_years():
+    times = utilities.decimal_year_to_datetime64([2004.5, 2005.5, 2023.0, np.nan])
+    expected = np.array(
+        ["2004-07-02", "2005-07-02T12:00", "2023-01-01", "NaT"], dtype="datetime64[ns]"
+    )
+    np.testing.assert_array_equal(times, expected)
+
+
+def test_read_ascii_with_header_keeps_first_row(tmp_path):
+    path = tmp_path / "series.txt"
+    path.write_text(
+        "% Transport data\n"
+        "% Column 1: Decimal year\n"
+        "% Column 2: MOC\n"
+        "  2002.0417,  14.9,\n"
+        "  2002.1250,  16.1,\n"
+    )
+    df = utilities.read_ascii_with_header(path, comment_char="%", delimiters=",")
+    assert list(df.columns) == ["Decimal year", "MOC"]
+    assert df["MOC"].tolist() == [14.9, 16.1]
+    assert (df.dtypes == "float64").all()
+
+
+def test_read_ascii_with_header_rejects_column_mismatch(tmp_path):
+    path = tmp_path / "series.txt"
+    path.write_text("% Column 1: MOC\n1.0 2.0\n")
+    with pytest.raises(ValueError, match="header lists 1 columns"):
+        utilities.read_ascii_with_header(path)
+
+
+@pytest.mark.usefixtures("blob_cache")
+def test_get_array_metadata_is_frozen_and_tracks_mtime(tmp_path, monkeypatch):
+    monkeypatch.setattr(utilities, "_metadata_dir", lambda: tmp_path)
+    yaml_file = tmp_path / "test_array.yml"
+    yaml_file.write_text(
+        "metadata:\n  project: Test\n"
+        "files:\n  a.nc:\n    variable_mapping: {t: TIME}\n"
+        "    variables:\n      MOC: {units: Sv, comment: n/a}\n"
+    )
+    meta = utilities.get_array_metadata("test")
+    assert utilities.get_array_metadata("test") is meta
+    file_meta = meta["files"]["a.nc"]
+    assert dict(file_meta["variable_attrs"]["MOC"]) == {"units": "Sv"}
+    assert file_meta["blank_attrs"]["MOC"] == ("comment",)
+    assert file_meta["global_attrs"]["summary"] == ""
+    with pytest.raises(TypeError):
+        meta["files"]["a.nc"]["variable_mapping"]["t"] = "time"
+
+    # load_array_metadata hands out mutable copies
+    copy = utilities.load_array_metadata("test")
+    copy["metadata"]["project"] = "Changed"
+    assert meta["raw"]["metadata"]["project"] == "Test"
+
+    # Editing the YAML invalidates the compiled entry
+    yaml_file.write_text("metadata:\n  project: Edited\nfiles: {}\n")
+    os.utime(yaml_file, ns=(0, yaml_file.stat().st_mtime_ns + 10**9))
+    assert (
+        utilities.get_array_metadata("test")["raw"]["metadata"]["project"] == "Edited"
+    )
+
+
+@pytest.mark.usefixtures("blob_cache")
+def test_write_metadata_cache_is_used(monkeypatch):
+    cache_file = utilities.write_metadata_cache()
+    assert "rapid" in json.loads(cache_file.read_text())
+
+    utilities.clear_metadata_cache()
+    monkeypatch.setattr(utilities.yaml, "safe_load", None)
+    meta = utilities.get_array_metadata("rapid")
+    assert meta["raw"]["metadata"]["program"] == "RAPID"
+    utilities.clear_metadata_cache()
+
+
+def test_open_netcdf_chunks_through_backend(tmp_path):
+    pytest.importorskip("dask")
+    path = tmp_path / "t.nc"
+    xr.Dataset({"a": ("time", np.arange(4.0))}).to_netcdf(path)
+
+    ds = utilities.open_netcdf(path, chunks={"time": 2, "depth": 3})
+    assert ds["a"].chunks == ((2, 2),)
+    assert all("open_dataset" in name for name in ds["a"].data.dask.layers)
+    assert utilities.open_netcdf(path)["a"].chunks is None
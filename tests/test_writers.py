@@ -0,0 +1,303 @@
+import hashlib
+import json
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from amocarray import logger, readers, standardise, utilities, writers
+
+logger.disable_logging()
+
+
+@pytest.fixture
+def transport_ds():
+    time = np.arange("2004-04-01", "2004-07-09", dtype="datetime64[D]")
+    return xr.Dataset(
+        {
+            "MOC": ("TIME", np.linspace(10.0, 20.0, time.size), {"valid": True}),
+            "COUNT_raw": ("TIME", np.arange(time.size) * 600.0),
+            "PROFILE": (("TIME", "DEPTH"), np.ones((time.size, 5))),
+        },
+        coords={"TIME": time, "DEPTH": np.arange(5.0)},
+        attrs={"processed": None},
+    )
+
+
+def test_plan_encoding_chunks_along_time(transport_ds):
+    encoding = writers.plan_encoding(transport_ds, time_chunk=30, optimise_dtypes=True)
+    assert encoding["PROFILE"]["chunksizes"] == (30, 5)
+    assert encoding["MOC"]["zlib"] and encoding["MOC"]["shuffle"]
+    assert encoding["MOC"]["dtype"] == "float32"
+    # uint16 is not allowed in NETCDF4_CLASSIC
+    assert encoding["COUNT_raw"]["dtype"] == "int32"
+    encoding = writers.plan_encoding(
+        transport_ds, format="NETCDF4", optimise_dtypes=True
+    )
+    assert encoding["COUNT_raw"]["dtype"] == "uint16"
+
+
+def test_save_dataset_sanitises_attrs_and_round_trips(transport_ds, tmp_path):
+    out = tmp_path / "out.nc"
+    assert writers.save_dataset(transport_ds, str(out))
+    assert transport_ds["MOC"].attrs["valid"] is True
+
+    with xr.open_dataset(out) as ds:
+        assert ds["MOC"].attrs["valid"] == "True"
+        assert ds.attrs["processed"] == "None"
+        assert ds["MOC"].encoding["zlib"]
+        np.testing.assert_allclose(ds["MOC"], transport_ds["MOC"], rtol=1e-6)
+        np.testing.assert_array_equal(ds["COUNT_raw"], transport_ds["COUNT_raw"])
+
+
+def test_plan_encoding_keeps_dtype_and_drops_stale_packing(transport_ds):
+    transport_ds["MOC"].encoding = {
+        "dtype": "int16",
+        "scale_factor": 0.01,
+        "_FillValue": -32768,
+    }
+    assert writers.plan_encoding(transport_ds)["MOC"]["dtype"] == "int16"
+    assert "dtype" not in writers.plan_encoding(transport_ds)["PROFILE"]
+
+    encoding = writers.plan_encoding(transport_ds, optimise_dtypes=True)["MOC"]
+    assert encoding["dtype"] == "float32"
+    assert "scale_factor" not in encoding and "_FillValue" not in encoding
+
+
+def test_plan_encoding_stores_classic_times_as_double(transport_ds):
+    transport_ds["TIME"].encoding.update(
+        units="milliseconds since 2002-01-16 05:17:31.200000", dtype="int64"
+    )
+    encoding = writers.plan_encoding(transport_ds, format="NETCDF4_CLASSIC")
+    assert encoding["TIME"]["dtype"] == "float64"
+    assert (
+        writers.plan_encoding(transport_ds, format="NETCDF4")["TIME"]["dtype"]
+        == "int64"
+    )
+
+
+def test_save_dataset_standardised_osnap(tmp_path):
+    ds = readers.load_dataset("osnap")[0]
+    std = standardise.standardise_osnap(ds, ds.attrs["source_file"])
+    out = tmp_path / "osnap.nc"
+    assert writers.save_dataset(std, str(out))
+    assert "units" in std["TIME"].attrs
+
+    with xr.open_dataset(out) as saved:
+        np.testing.assert_array_equal(saved["TIME"], std["TIME"])
+        assert saved["MOC_ALL"].dtype == std["MOC_ALL"].dtype
+        np.testing.assert_array_equal(saved["MOC_ALL"], std["MOC_ALL"])
+
+
+def test_save_zarr_appends_and_reads_back_partially(transport_ds, tmp_path):
+    pytest.importorskip("zarr")
+    store = tmp_path / "transport.zarr"
+    assert writers.save_zarr(transport_ds.isel(TIME=slice(0, 60)), store, time_chunk=32)
+    assert writers.save_zarr(
+        transport_ds.isel(TIME=slice(60, None)), store, append=True
+    )
+
+    ds = readers.load_zarr(store)
+    assert ds["MOC"].chunks is not None
+    assert ds["PROFILE"].encoding["chunks"] == (32, 5)
+    np.testing.assert_allclose(ds["MOC"], transport_ds["MOC"], rtol=1e-6)
+
+    part = readers.load_zarr(
+        store, variables=["MOC"], time_range=("2004-05-01", "2004-05-31")
+    )
+    assert list(part.data_vars) == ["MOC"]
+    assert part.sizes["TIME"] == 31
+
+    with pytest.raises(ValueError, match="without a time dimension"):
+        writers.save_zarr(transport_ds.isel(TIME=0), store, append=True)
+
+
+def test_save_zarr_append_keeps_values_outside_first_range(tmp_path):
+    pytest.importorskip("zarr")
+    time = np.arange("2020-01", "2020-07", dtype="datetime64[M]").astype(
+        "datetime64[ns]"
+    )
+    ds = xr.Dataset(
+        {
+            "FLAG": ("TIME", np.array([1, 2, 3, 300, 70000, 5])),
+            "MOC": ("TIME", np.array([16.0, 17.0, 18.0, 25.0, 30.0, 5.0])),
+        },
+        coords={"TIME": time},
+    )
+    store = tmp_path / "flags.zarr"
+    assert writers.save_zarr(ds.isel(TIME=slice(0, 3)), store)
+    assert writers.save_zarr(ds.isel(TIME=slice(3, None)), store, append=True)
+    stored = readers.load_zarr(store)
+    np.testing.assert_array_equal(stored["FLAG"], ds["FLAG"])
+    np.testing.assert_allclose(stored["MOC"], ds["MOC"])
+
+    # Optimised dtypes are planned from the first time steps only
+    packed = tmp_path / "packed.zarr"
+    assert writers.save_zarr(
+        ds.isel(TIME=slice(0, 3)), packed, optimise_dtypes=True, pack=True
+    )
+    with pytest.raises(ValueError, match="do not fit"):
+        writers.save_zarr(ds.isel(TIME=slice(3, None)), packed, append=True)
+    assert readers.load_zarr(packed).sizes["TIME"] == 3
+
+
+def test_update_array_appends_only_new_time_steps(tmp_path):
+    pytest.importorskip("zarr")
+    full = readers.load_dataset("dso")[0]
+    file_name = full.attrs["source_file"]
+    source = tmp_path / "source"
+    source.mkdir()
+    out = tmp_path / "out"
+    kwargs = {"source": str(source), "data_dir": tmp_path / "data", "refresh": None}
+
+    full.isel(TIME=slice(0, 1000)).to_netcdf(source / file_name)
+    assert writers.update_array("dso", out, **kwargs) == {file_name: 1000}
+
+    # An extended release: only its tail is standardised and appended
+    full.isel(TIME=slice(0, 1500)).to_netcdf(source / file_name)
+    assert writers.update_array("dso", out, **kwargs) == {file_name: 500}
+    assert writers.update_array("dso", out, **kwargs) == {file_name: 0}
+
+    marks = json.loads((out / writers.HIGH_WATER_MARK_FILE).read_text())
+    assert marks[f"dso/{file_name}"]["time_end"].startswith(
+        str(full["TIME"].values[1499])[:19]
+    )
+    stored = readers.load_zarr(out / marks[f"dso/{file_name}"]["store"])
+    np.testing.assert_array_equal(stored["TIME"], full["TIME"][:1500])
+
+
+def test_update_array_skips_missing_times(tmp_path):
+    pytest.importorskip("zarr")
+    full = readers.load_dataset("dso")[0].isel(TIME=slice(0, 1500))
+    file_name = full.attrs["source_file"]
+    source = tmp_path / "source"
+    source.mkdir()
+    out = tmp_path / "out"
+    kwargs = {"source": str(source), "data_dir": tmp_path / "data", "refresh": None}
+
+    def release(n_steps):
+        # Like MOVE: a NaT-padded tail, and here also two swapped time steps
+        ds = full.isel(TIME=slice(0, n_steps + 5)).load()
+        time = ds["TIME"].values.copy()
+        time[[10, 11]] = time[[11, 10]]
+        time[n_steps:] = np.datetime64("NaT")
+        ds.assign_coords(TIME=time).to_netcdf(source / file_name)
+
+    release(1000)
+    assert writers.update_array("dso", out, **kwargs) == {file_name: 1000}
+    marks = json.loads((out / writers.HIGH_WATER_MARK_FILE).read_text())
+    assert marks[f"dso/{file_name}"]["time_end"] != "NaT"
+
+    release(1400)
+    assert writers.update_array("dso", out, **kwargs) == {file_name: 400}
+    store = out / marks[f"dso/{file_name}"]["store"]
+    np.testing.assert_array_equal(readers.load_zarr(store)["TIME"], full["TIME"][:1400])
+    start, end = full["TIME"].values[[100, 199]]
+    assert readers.load_zarr(store, time_range=(start, end)).sizes["TIME"] == 100
+
+
+def test_update_array_rewrites_store_that_cannot_hold_new_values(tmp_path):
+    pytest.importorskip("zarr")
+    full = readers.load_dataset("dso")[0]
+    file_name = full.attrs["source_file"]
+    source = tmp_path / "source"
+    source.mkdir()
+    out = tmp_path / "out"
+    kwargs = {"source": str(source), "data_dir": tmp_path / "data", "refresh": None}
+
+    # A store packed from a first release with a narrower range of values
+    first = standardise.standardise_array(
+        full.isel(TIME=slice(0, 600)), file_name, "dso"
+    )
+    store = out / f"dso_{file_name[:-3]}.zarr"
+    assert writers.save_zarr(first, store, optimise_dtypes=True, pack=True)
+    assert "scale_factor" in readers.load_zarr(store)["DSO"].encoding
+
+    full.isel(TIME=slice(0, 1500)).to_netcdf(source / file_name)
+    assert writers.update_array("dso", out, **kwargs) == {file_name: 1500}
+    stored = readers.load_zarr(store)
+    expected = standardise.standardise_array(
+        full.isel(TIME=slice(0, 1500)), file_name, "dso"
+    )
+    np.testing.assert_allclose(stored["DSO"], expected["DSO"])
+
+
+class _Response:
+    """Minimal streaming response standing in for the RAPID web server."""
+
+    def __init__(self, body, etag):
+        self.body = body
+        self.status_code = 200 if body else 304
+        self.headers = {"Content-Length": str(len(body)), "ETag": etag}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+
+def test_update_array_picks_up_reissued_registry_file(tmp_path, monkeypatch):
+    pytest.importorskip("zarr")
+    monkeypatch.setenv("AMOCARRAY_CACHE_DIR", str(tmp_path / "cache"))
+    full = readers.load_dataset("rapid")[0]
+    releases = []
+    for n_steps in (3000, 4000):
+        path = tmp_path / f"moc_transports_{n_steps}.nc"
+        full.isel(time=slice(0, n_steps)).to_netcdf(path)
+        releases.append(path.read_bytes())
+
+    def fake_get(_url, headers, **_kwargs):
+        etag = f'"v{len(releases)}"'
+        if headers.get("If-None-Match") == etag:
+            return _Response(b"", etag)
+        return _Response(releases[0], etag)
+
+    monkeypatch.setattr(utilities.get_session(), "get", fake_get)
+    registry = {"moc_transports.nc": hashlib.sha256(releases[0]).hexdigest()}
+    monkeypatch.setattr(utilities, "load_registry", lambda: registry)
+    out = tmp_path / "out"
+    kwargs = {"data_dir": tmp_path / "data"}
+
+    assert writers.update_array("rapid", out, **kwargs) == {"moc_transports.nc": 3000}
+    assert writers.update_array("rapid", out, **kwargs) == {"moc_transports.nc": 0}
+
+    # The server extends the record: its new ETag marks a new version, so the
+    # mismatch with the registry is accepted and the new tail reaches the store
+    releases.pop(0)
+    assert writers.update_array("rapid", out, **kwargs) == {"moc_transports.nc": 1000}
+    stored = readers.load_zarr(out / "rapid_moc_transports.zarr")
+    np.testing.assert_array_equal(stored["TIME"], full["time"][:4000])
+
+
+def test_save_parquet_long_format_partitioned(transport_ds, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    transport_ds["MOC"].attrs["units"] = "Sv"
+    transport_ds["MOC"][0] = np.nan
+    dso = xr.Dataset(
+        {"DSO": (("TIME", "DEPTH"), np.ones((3, 1)), {"units": "Sv"})},
+        coords={"TIME": np.arange("2004-12-30", "2005-01-02", dtype="datetime64[D]")},
+    )
+    datasets_by_array = {"rapid": [transport_ds], "dso": [dso]}
+
+    table = writers.to_long_table(datasets_by_array)
+    assert table.column_names == ["array", "variable", "units", "time", "value", "year"]
+    assert table.schema.field("array").type.value_type == "string"
+    # PROFILE is 2-D; the NaN MOC value is dropped
+    assert table.num_rows == 3 + 98 + 99
+
+    out = tmp_path / "series"
+    assert writers.save_parquet(datasets_by_array, out)
+    assert sorted(p.name for p in (out / "array=dso").iterdir()) == [
+        "year=2004",
+        "year=2005",
+    ]
+    moc = pq.read_table(out, filters=[("variable", "=", "MOC")]).to_pandas()
+    assert len(moc) == 98 and set(moc["units"]) == {"Sv"}